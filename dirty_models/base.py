@@ -2,7 +2,9 @@
 Base classes for Dirty Models
 '''
 
+import itertools
 import weakref
+from functools import wraps
 
 __all__ = ['Unlocker', 'Creating', 'AccessMode']
 
@@ -24,35 +26,134 @@ class AccessMode(IntEnum):
         return min(self, other)
 
 
+#: Returned by field converters when a value could not be used on field.
+UNUSABLE = object()
+
+_access_modes_versions = itertools.count(1)
+_access_modes_version = 0
+
+
+def get_access_modes_version():
+    """
+    Returns version of field access modes. It is part of keys of memoized data which depends on them.
+    """
+    return _access_modes_version
+
+
+def touch_access_modes():
+    """
+    Must be called whenever access mode of a field, or access modes overridden by a model class, change.
+    They change rarely, so a new version is enough to stop using memoized data of every model.
+    """
+    global _access_modes_version
+    _access_modes_version = next(_access_modes_versions)
+
+
 class BaseData:
     """
     Base class for data inside dirty model.
+
+    Effective access mode, lock state and creation state depend on ancestors. They are cached on
+    each node, so querying them does not walk parent chain every time. Cached states of a tree share
+    a validity token which belongs to its root. Token is dropped when any node of tree is locked, unlocked,
+    marked as creating, unmarked, gets a new access mode or a new parent (or its parent disappears), so
+    only nodes of that tree compute their state again.
+
+    Whether node is modified is cached too. Methods which modify data must be decorated with
+    :func:`track_modified`, so cached value is updated after writing and changes are propagated to
+    ancestors whose state depends on it. A node which is set as child of a new parent keeps its previous
+    parents as owners, because they could still hold it, and changes are propagated to them as well.
+
+    Exported data is memoized on each node until node or any of its descendants is written. A node with
+    memoized data always has descendants with memoized data, so dropping memoized data of ancestors stops
+    on first ancestor which has none.
     """
 
+    __slots__ = ()
+
     __locked__ = None
     __access_mode__ = None
     __is_creating__ = None
     __parent__ = None
+    __owners__ = None
+    __shared_by__ = None
+    __state_cache__ = None
+    __state_token__ = None
+    __modified_state__ = None
+    __journal__ = None
+    __transaction__ = None
+    __export_cache__ = None
 
     def __init__(self, *args, __is_creating=False, **kwargs):
         self.__locked__ = True
         self.__access_mode__ = AccessMode.READ_AND_WRITE
         self.__is_creating__ = __is_creating
         self.__parent__ = None
+        self.__owners__ = None
+        self.__shared_by__ = None
+        self.__state_cache__ = None
+        self.__state_token__ = None
+        self.__modified_state__ = None
+        self.__journal__ = None
+        self.__transaction__ = None
+        self.__export_cache__ = None
+
+    def _invalidate_state(self, *args):
+        """
+        Invalidates cached state of every node of tree which node belongs to. Token is only marked as
+        invalid, so it is safe to do it from several threads at once.
+        """
+        state = self.__state_cache__
+        if state is not None:
+            state[0][0] = False
 
-    def get_access_mode(self):
+    def _get_state(self):
         """
-        Returns how model could be acceded
+        Returns a tuple with validity token, effective access mode, lock state, creation state,
+        change journals and transactions of node and whether node or any ancestor is shared by a
+        placeholder.
         """
+        state = self.__state_cache__
+        if state is not None and state[0][0]:
+            return state
+
+        parent = self.get_parent()
+        if parent is None:
+            token = self.__state_token__
+            if token is None or not token[0]:
+                token = self.__state_token__ = [True]
+            locked = bool(self.__locked__)
+            creating = bool(self.__is_creating__)
+            journals = ()
+            shared = bool(self.__shared_by__)
+        else:
+            token, parent_am, parent_locked, parent_creating, journals, shared = parent._get_state()
+            locked = bool(self.__locked__) and parent_locked
+            creating = bool(self.__is_creating__) or parent_creating
+            shared = shared or bool(self.__shared_by__)
+
+        if self.__journal__ is not None:
+            journals += (self.__journal__,)
+        if self.__transaction__ is not None:
+            journals += (self.__transaction__,)
+
         am = self.__access_mode__
         if not am \
-                or (self.is_creating() and am <= AccessMode.WRITABLE_ONLY_ON_CREATION) \
-                or not self.is_locked():
+                or (creating and am <= AccessMode.WRITABLE_ONLY_ON_CREATION) \
+                or not locked:
             am = AccessMode.READ_AND_WRITE
 
-        if self.get_parent():
-            am &= self.get_parent().get_access_mode()
-        return am
+        if parent is not None:
+            am &= parent_am
+
+        state = self.__state_cache__ = (token, am, locked, creating, journals, shared)
+        return state
+
+    def get_access_mode(self):
+        """
+        Returns how model could be acceded
+        """
+        return self._get_state()[1]
 
     def set_access_mode(self, value):
         """
@@ -60,6 +161,7 @@ class BaseData:
         """
         if self.__access_mode__ != value:
             self.__access_mode__ = value
+            self._invalidate_state()
             self._update_access_mode()
 
     @abstractmethod
@@ -76,53 +178,194 @@ class BaseData:
         """
         Sets parent model
         """
-        self.__parent__ = weakref.ref(value)
+        parent = self.get_parent()
+        if parent is not None and parent is not value:
+            # Previous parent could still hold node, so it must know about changes
+            owners = self.__owners__
+            if owners is None:
+                owners = self.__owners__ = weakref.WeakSet()
+            owners.add(parent)
+            owners.discard(value)
+        node = weakref.ref(self)
+
+        def parent_dropped(ref):
+            # Node is referenced weakly, so a detached node is still freed as soon as it is not used
+            item = node()
+            if item is not None:
+                item._invalidate_state()
+
+        self.__parent__ = weakref.ref(value, parent_dropped)
+        self._invalidate_state()
 
     def unlock(self):
         """
         Unlock model to be able to write even it's read only
         """
         self.__locked__ = False
+        self._invalidate_state()
 
     def lock(self):
         """
         Lock model to avoid modification on read only fields
         """
         self.__locked__ = True
+        self._invalidate_state()
 
     def is_locked(self):
         """
         Returns whether model is locked
         """
-        if not self.__locked__:
-            return False
-        elif self.get_parent():
-            return self.get_parent().is_locked()
-
-        return True
+        return self._get_state()[2]
 
     def start_creation(self):
         """
         Mark model to be able to set creation-only fields.
         """
         self.__is_creating__ = True
+        self._invalidate_state()
 
     def end_creation(self):
         """
         Unmark model to be able to set creation-only fields.
         """
         self.__is_creating__ = False
+        self._invalidate_state()
 
     def is_creating(self):
         """
         Returns whether model is marked on creation mode.
         """
-        if self.__is_creating__:
-            return True
-        elif self.get_parent():
-            return self.get_parent().is_creating()
+        return self._get_state()[3]
+
+    def is_modified(self):
+        """
+        Returns whether data is modified or not
+        """
+        state = self.__modified_state__
+        if state is None:
+            state = self.__modified_state__ = self._is_modified()
+        return state
+
+    @abstractmethod
+    def _is_modified(self):  # pragma: no cover
+        pass
+
+    def _propagate_modified(self, old_state):
+        """
+        Updates cached modified state of node after it was written and, if it changed, updates
+        ancestors as well. Ancestors with no cached state do not need to be updated.
+
+        :param old_state: Cached modified state before writing.
+        """
+        item = self
+        while True:
+            item.__modified_state__ = None
+            if item.is_modified() == old_state:
+                return
+            if item.__owners__:
+                for owner in list(item.__owners__):
+                    if owner.__modified_state__ is not None:
+                        owner._propagate_modified(owner.__modified_state__)
+            item = item.get_parent()
+            if item is None:
+                return
+            old_state = item.__modified_state__
+            if old_state is None:
+                return
+
+    def _record_change(self, key, op, value=None):
+        """
+        Records a change on journals and transactions of node and its ancestors. It must be called
+        before data is modified.
+
+        :param key: Field name, or ``None`` for operations on whole model or list.
+        :param op: Operation name.
+        :param value: Value written.
+        """
+        # Flattening data does not change exported data
+        if op != 'flat':
+            self._invalidate_export()
+        for journal in self._get_state()[4]:
+            journal.record(self, key, op, value)
+
+    def _invalidate_export(self):
+        """
+        Drops memoized data of node and its ancestors, including previous parents.
+        """
+        item = self
+        while item is not None and item.__export_cache__ is not None:
+            item.__export_cache__ = None
+            if item.__owners__:
+                for owner in list(item.__owners__):
+                    owner._invalidate_export()
+            item = item.get_parent()
+
+    def _get_memoized(self, key, function):
+        """
+        Returns memoized result of a function which exports node data. It is dropped when node or any of
+        its descendants is written, so result must be built using memoized results of children.
+
+        :param key: Memoized result key.
+        :param function: Function to build result.
+        :return: Result, which must not be modified.
+        """
+        cache = self.__export_cache__
+        if cache is None:
+            cache = self.__export_cache__ = {}
+        try:
+            return cache[key]
+        except KeyError:
+            result = cache[key] = function()
+            return result
+
+    def _find_memoized(self, key):
+        """
+        Returns memoized result of a function which exports node data, or ``None`` if it is not built.
 
-        return False
+        :param key: Memoized result key.
+        :return: Result, which must not be modified.
+        """
+        cache = self.__export_cache__
+        if cache is None:
+            return None
+        return cache.get(key)
+
+    def export_data(self):
+        """
+        Get the results with the modified_data. Exported data is memoized until model is written, so
+        exporting an unchanged model again only copies dictionaries and lists.
+        """
+        return copy_exported(self._get_exported_data())
+
+    def _get_exported_data(self):
+        return self._get_memoized('data', self._export_data)
+
+    @abstractmethod
+    def _export_data(self):  # pragma: no cover
+        pass
+
+    @abstractmethod
+    def _apply_patch(self, tree):  # pragma: no cover
+        pass
+
+    @abstractmethod
+    def _save_undo(self, key):  # pragma: no cover
+        pass
+
+    @abstractmethod
+    def _undo(self, key, saved):  # pragma: no cover
+        pass
+
+    def _restore_child(self, value):
+        """
+        Sets node as parent of a restored value, if it is not already.
+        """
+        try:
+            if value.get_parent() is self:
+                return
+        except AttributeError:
+            return
+        self._prepare_child(value)
 
     def _prepare_child(self, value):
         try:
@@ -130,6 +373,123 @@ class BaseData:
         except AttributeError:
             pass
 
+    def _share(self):
+        """
+        Returns a placeholder which shares model until it is modified.
+        """
+        shared_value = SharedValue(self)
+        shared_by = self.__shared_by__
+        if shared_by is None:
+            shared_by = self.__shared_by__ = weakref.WeakSet()
+        if not shared_by:
+            # Cached states of node and its descendants do not know it is shared
+            self._invalidate_state()
+        shared_by.add(shared_value)
+        return shared_value
+
+    def _before_write(self):
+        """
+        It must be called before any modification. Placeholders which share model or any of its
+        ancestors get their own copy, so they are not affected by modification. Whether there are
+        any is cached with node state, so nodes of trees which are not shared do not walk parent chain.
+        """
+        if not self._get_state()[5]:
+            return
+
+        chain = []
+        item = self
+        while item is not None:
+            chain.append(item)
+            item = item.get_parent()
+
+        # Ancestors first, because copying them shares their children again
+        for item in reversed(chain):
+            shared_by = item.__shared_by__
+            if shared_by is not None:
+                item.__shared_by__ = None
+                item._invalidate_state()
+                for shared_value in list(shared_by):
+                    shared_value.materialize()
+
+
+def track_modified(function):
+    """
+    Decorator for methods which modify data. Cached modified state is updated once method finishes.
+    Meanwhile, node has no cached state, so writes on its children do not go further.
+    """
+
+    @wraps(function)
+    def func(self, *args, **kwargs):
+        """Decorator function"""
+        old_state = self.__modified_state__
+        self.__modified_state__ = None
+        try:
+            return function(self, *args, **kwargs)
+        finally:
+            self._propagate_modified(old_state)
+
+    return func
+
+
+class PatchTree:
+    """
+    Dotted paths of a change set grouped by their keys, so paths sharing a prefix are looked up
+    only once. Each node keeps value to write on its path, whether path must be deleted and its
+    children by key.
+    """
+
+    __slots__ = ('children', 'has_value', 'value', 'deleted')
+
+    def __init__(self):
+        self.children = {}
+        self.has_value = False
+        self.value = None
+        self.deleted = False
+
+    @classmethod
+    def build(cls, modifications, deleted=None):
+        """
+        Builds a tree from a change set.
+
+        :param modifications: Dictionary of values by dotted path, like
+                              :meth:`~dirty_models.models.BaseModel.export_modifications` result.
+        :type modifications: dict
+        :param deleted: Dotted paths to delete, like
+                        :meth:`~dirty_models.models.BaseModel.export_deleted_fields` result.
+        :type deleted: list or str
+        :return: PatchTree
+        """
+        tree = cls()
+        for path, value in modifications.items():
+            node = tree.get_node(path)
+            node.has_value = True
+            node.value = value
+
+        if isinstance(deleted, str):
+            deleted = [deleted]
+
+        for path in deleted or []:
+            tree.get_node(path).deleted = True
+
+        return tree
+
+    def get_node(self, path):
+        """
+        Returns node of a dotted path, adding missing nodes.
+
+        :param path: Dotted path.
+        :type path: str
+        :return: PatchTree
+        """
+        node = self
+        for key in str(path).split('.'):
+            try:
+                node = node.children[key]
+            except KeyError:
+                child = node.children[key] = PatchTree()
+                node = child
+        return node
+
 
 class InnerFieldTypeMixin:
     __field_type__ = None
@@ -143,6 +503,374 @@ class InnerFieldTypeMixin:
         return self.__field_type__ or self.__class__.__field_type__
 
 
+def get_field_signature(field):
+    """
+    Returns a hashable value which identifies field definition.
+    """
+
+    def freeze(value):
+        if isinstance(value, dict):
+            return tuple(sorted((k, freeze(v)) for k, v in value.items()))
+        elif isinstance(value, (list, tuple)):
+            return tuple(freeze(v) for v in value)
+        return value
+
+    definition = field.export_definition()
+    # Definitions of same field class are exported with same key order, so plain items are enough
+    # when they are hashable.
+    signature = (field.__class__, tuple(definition.items()))
+    try:
+        hash(signature)
+    except TypeError:
+        signature = (field.__class__, freeze(definition))
+        try:
+            hash(signature)
+        except TypeError:
+            return field.__class__, id(field)
+    return signature
+
+
+class FieldSchema:
+    """
+    Picklable definition of a sequence of fields. Schemas are shared by every model or list with same
+    fields, so pickle stores each schema once per dump and instances only reference it. Fields of a
+    loaded schema are built once and shared by every instance which uses it.
+    """
+
+    __slots__ = ('definitions', '_fields', '_classes', '__weakref__')
+
+    _schemas = weakref.WeakValueDictionary()
+
+    def __init__(self, definitions):
+        """
+        :param definitions: Field classes and definitions.
+        :type definitions: tuple
+        """
+        self.definitions = definitions
+        self._fields = None
+        self._classes = {}
+
+    @classmethod
+    def from_fields(cls, fields):
+        """
+        Returns schema of a sequence of fields.
+
+        :param fields: Fields.
+        :return: FieldSchema
+        """
+        fields = tuple(fields)
+        signatures = tuple(get_field_signature(field) for field in fields)
+
+        try:
+            return cls._schemas[signatures]
+        except KeyError:
+            schema = cls(tuple((field.__class__, field.export_definition()) for field in fields))
+            if all(isinstance(signature[1], tuple) for signature in signatures):
+                cls._schemas[signatures] = schema
+            return schema
+
+    def get_fields(self):
+        """
+        Returns fields of schema. They are built on first call.
+
+        :return: tuple
+        """
+        if self._fields is None:
+            self._fields = tuple(field_class(**definition) for field_class, definition in self.definitions)
+        return self._fields
+
+    def get_class(self, base, builder):
+        """
+        Returns a class derived from schema, built on first call for each base class.
+
+        :param base: Base class.
+        :param builder: Function to build class from base class and schema.
+        :return: class
+        """
+        try:
+            return self._classes[base]
+        except KeyError:
+            result = self._classes[base] = builder(base, self)
+            return result
+
+    def __reduce__(self):
+        return FieldSchema, (self.definitions,)
+
+
+class LazyValue:
+    """
+    Placeholder for a child value which is not built yet. It keeps raw data and a function to build
+    real value from it. It behaves like an untouched child: operations which could be answered using raw
+    data do not build it, anything else builds it and delegates on real value.
+    """
+
+    __slots__ = ('data', 'builder', 'modified', 'value', 'parent', 'access_mode')
+
+    def __init__(self, data, builder, modified=False):
+        """
+        :param data: Raw data.
+        :param builder: Function to build real value from raw data.
+        :param modified: Whether real value will be modified once built.
+        :type modified: bool
+        """
+        self.data = data
+        self.builder = builder
+        self.modified = modified
+        self.value = None
+        self.parent = None
+        self.access_mode = None
+
+    def materialize(self):
+        """
+        Returns real value, building it if it is necessary.
+        """
+        if self.builder is None:
+            return self.value
+
+        value = self.builder(self.data)
+        try:
+            if self.parent is not None and self.parent() is not None:
+                # Memoized data of ancestors was exported without real value
+                self.parent()._invalidate_export()
+                value.set_parent(self.parent())
+            if self.access_mode is not None:
+                value.set_access_mode(self.access_mode)
+            if not self.modified and value.is_modified():
+                value.flat_data()
+        except AttributeError:
+            pass
+
+        self.value = value
+        self.data = None
+        self.builder = None
+        return value
+
+    def is_built(self):
+        """
+        Returns whether real value is already built.
+        """
+        return self.builder is None
+
+    def set_parent(self, value):
+        self.parent = weakref.ref(value)
+        if self.builder is None:
+            self.value.set_parent(value)
+
+    def set_access_mode(self, value):
+        self.access_mode = value
+        if self.builder is None:
+            self.value.set_access_mode(value)
+
+    def is_modified(self):
+        if self.builder is None:
+            return self.value.is_modified()
+        return self.modified
+
+    def export_data(self):
+        if self.builder is not None:
+            return self.data
+        try:
+            return self.value.export_data()
+        except AttributeError:
+            return self.value
+
+    def _get_exported_data(self):
+        if self.builder is not None:
+            return self.data
+        return export_value(self.value)
+
+    def export_original_data(self):
+        if self.builder is not None and not self.modified:
+            return self.data
+        value = self.materialize()
+        try:
+            return value.export_original_data()
+        except AttributeError:
+            return value
+
+    def export_modifications(self):
+        if self.builder is not None and not self.modified:
+            return {}
+        return self.materialize().export_modifications()
+
+    def export_deleted_fields(self):
+        if self.builder is not None:
+            return []
+        return self.value.export_deleted_fields()
+
+    def flat_data(self):
+        if self.builder is not None:
+            self.modified = False
+        else:
+            self.value.flat_data()
+
+    def clear_modified_data(self):
+        if self.builder is None or self.modified:
+            self.materialize().clear_modified_data()
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return getattr(self.materialize(), name)
+
+    def __reduce__(self):
+        return materialize, (self.materialize(),)
+
+
+class SharedValue(LazyValue):
+    """
+    Placeholder for a child shared with other model after a copy. It behaves like a copy of shared
+    child, so all its data is modified data until it is flattened. Read operations are answered by
+    shared child. Anything else copies shared child and delegates on copy. Shared child is copied
+    before it is modified as well, so placeholder always sees data as it was when model was copied.
+    """
+
+    __slots__ = ('__weakref__',)
+
+    def __init__(self, value):
+        """
+        :param value: Shared child.
+        :type value: BaseData
+        """
+        super(SharedValue, self).__init__(value, self._copy_value, modified=True)
+
+    @staticmethod
+    def _copy_value(value):
+        return value.copy()
+
+    def is_modified(self):
+        if self.builder is not None and not self.modified:
+            return False
+        return self.materialize().is_modified()
+
+    def export_data(self):
+        if self.builder is None:
+            return self.value.export_data()
+        return self.data.export_data()
+
+    def _get_exported_data(self):
+        if self.builder is None:
+            return export_value(self.value)
+        return self.data._get_exported_data()
+
+    def export_original_data(self):
+        if self.builder is not None and not self.modified:
+            return self.data.export_data()
+        return self.materialize().export_original_data()
+
+
+def share_value(value, memo=None):
+    """
+    Returns a value to be used by a copy of a model. Inner models and lists are shared until they
+    are modified, pending placeholders are duplicated and any other value is returned as it is.
+    Like copies, shared values are modified.
+
+    :param value: Value to share.
+    :param memo: Dictionary used to share the same placeholder for the same value.
+    :type memo: dict
+    """
+    if memo is not None:
+        try:
+            return memo[id(value)]
+        except KeyError:
+            result = memo[id(value)] = share_value(value)
+            return result
+
+    if isinstance(value, SharedValue):
+        if value.builder is not None:
+            return value.data._share()
+        value = value.value
+    elif isinstance(value, LazyValue):
+        if value.builder is not None:
+            return LazyValue(value.data, value.builder, modified=True)
+        value = value.value
+
+    if isinstance(value, BaseData):
+        return value._share()
+    return value
+
+
+def export_value(value):
+    """
+    Returns exported data of a value. Exported data of models and lists is memoized, so it must not be
+    modified.
+    """
+    get_exported_data = getattr(value, '_get_exported_data', None)
+    if get_exported_data is not None:
+        return get_exported_data()
+
+    export_data = getattr(value, 'export_data', None)
+    return export_data() if export_data is not None else value
+
+
+def copy_exported(value):
+    """
+    Returns a copy of exported data. Dictionaries and lists are copied, any other value is shared.
+    """
+    value_type = type(value)
+    if value_type is dict:
+        return {key: copy_exported(item) for key, item in value.items()}
+    if value_type is list:
+        return [copy_exported(item) for item in value]
+    return value
+
+
+def materialize(value):
+    """
+    Returns real value of a :class:`LazyValue` or value itself.
+    """
+    if isinstance(value, LazyValue):
+        return value.materialize()
+    return value
+
+
+def diff_value(result, key, value, other):
+    """
+    Adds to result changes needed to turn a value into other one, like
+    :meth:`~dirty_models.models.BaseModel.export_modifications` does. Placeholders sharing the same
+    data are equal without looking inside them. Placeholders which are not modified since they were shared
+    are compared with shared value, so they are not copied.
+
+    :param result: Dictionary of changes.
+    :type result: dict
+    :param key: Field name or list index of value.
+    :param value: Current value.
+    :param other: New value.
+    """
+    if value is other:
+        return
+
+    if isinstance(value, LazyValue) and isinstance(other, LazyValue) \
+            and not value.is_built() and not other.is_built():
+        if value.data is other.data:
+            return
+        if not isinstance(value, SharedValue) and not isinstance(other, SharedValue) and value.data == other.data:
+            return
+
+    if isinstance(value, SharedValue) and not value.is_built():
+        value = value.data
+    if isinstance(other, SharedValue) and not other.is_built():
+        other = other.data
+
+    value = materialize(value)
+    other = materialize(other)
+    if value is other:
+        return
+
+    if isinstance(value, BaseData) and isinstance(other, BaseData) \
+            and isinstance(value.__original_data__, list) == isinstance(other.__original_data__, list):
+        changes = value.diff(other)
+        try:
+            result.update({'{}.{}'.format(key, f): v for f, v in changes.items()})
+        except AttributeError:
+            result[key] = changes
+        return
+
+    other = export_value(other)
+    if export_value(value) != other:
+        result[key] = copy_exported(other)
+
+
 class Unlocker():
     """
     Unlocker instances helps to lock and unlock models easily
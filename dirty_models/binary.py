@@ -0,0 +1,598 @@
+"""
+Compact binary codec for dirty models.
+
+Encoded data uses MessagePack format, so plain data could be read by any MessagePack library. Other
+values use extension types:
+
+* :class:`~datetime.datetime`, :class:`~datetime.date`, :class:`~datetime.time` and
+  :class:`~datetime.timedelta` are packed as numbers. Time zones are kept as fixed UTC offsets.
+
+* :class:`~enum.Enum` members are stored as their values. They are decoded as members of
+  enumeration of their :class:`~dirty_models.fields.EnumField` field.
+
+* Integers which do not fit in 64 bits.
+
+Fields of models with a declared structure are written by their position on model structure
+instead of by their name, so data must be decoded using same model class. Dynamic models and
+hash maps are written by name.
+
+Decoded data is used to build models through trusted construction path
+(:meth:`~dirty_models.models.BaseModel.from_trusted`), so it is not validated again and inner
+models and lists are built on first access.
+"""
+
+from datetime import date, datetime, time, timedelta, timezone
+from enum import Enum
+from struct import Struct
+from weakref import WeakKeyDictionary
+
+from .fields import ArrayField, EnumField, HashMapField, ModelField, MultiTypeField
+from .model_types import ListModel
+from .models import BaseDynamicModel, BaseModel, HashMapModel
+
+__all__ = ['BinaryEncoder', 'BinaryDecoder', 'encode', 'decode']
+
+EXT_DATETIME = 1
+EXT_DATE = 2
+EXT_TIME = 3
+EXT_TIMEDELTA = 4
+EXT_ENUM = 5
+EXT_BIGINT = 6
+
+_uint8 = Struct('>BB')
+_uint16 = Struct('>BH')
+_uint32 = Struct('>BI')
+_uint64 = Struct('>BQ')
+_int8 = Struct('>Bb')
+_int16 = Struct('>Bh')
+_int32 = Struct('>Bi')
+_int64 = Struct('>Bq')
+_float64 = Struct('>Bd')
+_ext8 = Struct('>BBb')
+_ext16 = Struct('>BHb')
+_ext32 = Struct('>BIb')
+_datetime = Struct('>HBBBBBI')
+_date = Struct('>HBB')
+_time = Struct('>BBBI')
+_timedelta = Struct('>iII')
+_offset = Struct('>q')
+
+_field_indexes = WeakKeyDictionary()
+
+
+def _get_field_index(model_class):
+    """
+    Returns a tuple with fields of a model class in structure order as ``(name, field)`` pairs, and
+    a dictionary which maps field names to their encoded positions and fields. Classes with no declared
+    structure have no index.
+    """
+    try:
+        return _field_indexes[model_class]
+    except KeyError:
+        pass
+
+    if model_class is None or issubclass(model_class, (BaseDynamicModel, HashMapModel)):
+        index = None
+    else:
+        fields = tuple(model_class.__structure__.items())
+        encoder = BinaryEncoder()
+        positions = {}
+        for pos, (name, field) in enumerate(fields):
+            encoder.buffer = bytearray()
+            encoder.write(pos)
+            positions[name] = bytes(encoder.buffer), field
+        index = fields, positions
+    _field_indexes[model_class] = index
+    return index
+
+
+def _resolve_field(field, kind):
+    """
+    Returns field, or field type of a multi type field, which is instance of kind.
+    """
+    if isinstance(field, kind):
+        return field
+    if isinstance(field, MultiTypeField):
+        for field_type in field.field_types:
+            if isinstance(field_type, kind):
+                return field_type
+    return None
+
+
+def _get_inner_field(field, name):
+    """
+    Returns field of a key of a model field value.
+    """
+    try:
+        return field.model_class.__structure__[name]
+    except (AttributeError, KeyError):
+        pass
+    if isinstance(field, HashMapField):
+        return field.field_type
+    return None
+
+
+def _get_item_field(field):
+    """
+    Returns field of items of an array field value.
+    """
+    field = _resolve_field(field, ArrayField)
+    return field.field_type if field is not None else None
+
+
+def _get_root_field(obj_class, field_type=None):
+    if issubclass(obj_class, HashMapModel):
+        return HashMapField(model_class=obj_class, field_type=field_type)
+    elif issubclass(obj_class, BaseModel):
+        return ModelField(model_class=obj_class)
+    elif issubclass(obj_class, ListModel) and field_type is not None:
+        return ArrayField(field_type=field_type)
+    return None
+
+
+class BinaryEncoder:
+    """
+    Encodes data exported from models, guided by their fields.
+    """
+
+    def __init__(self):
+        self.buffer = bytearray()
+        self._writers = {str: self._write_str,
+                         int: self._write_int,
+                         float: self._write_float,
+                         bool: self._write_bool,
+                         type(None): self._write_none,
+                         dict: self._write_dict,
+                         list: self._write_list,
+                         tuple: self._write_list,
+                         bytes: self._write_bytes,
+                         bytearray: self._write_bytes,
+                         datetime: self._write_datetime,
+                         date: self._write_date,
+                         time: self._write_time,
+                         timedelta: self._write_timedelta}
+
+    def encode(self, obj):
+        """
+        Encodes a model, a list model or plain data.
+
+        :param obj: Object to encode.
+        :return: Encoded data.
+        :rtype: bytes
+        """
+        field = None
+        if isinstance(obj, (BaseModel, ListModel)):
+            field_type = obj.get_field_type() if isinstance(obj, (HashMapModel, ListModel)) else None
+            field = _get_root_field(obj.__class__, field_type)
+            obj = obj._get_exported_data()
+
+        self.write(obj, field)
+        return bytes(self.buffer)
+
+    def write(self, value, field=None):
+        """
+        Writes a value to buffer.
+
+        :param value: Value to write.
+        :param field: Field of value, if it is known.
+        """
+        try:
+            writer = self._writers[value.__class__]
+        except KeyError:
+            writer = self._get_writer(value)
+        writer(value, field)
+
+    def _get_writer(self, value):
+        if isinstance(value, Enum):
+            return self._write_enum
+        elif isinstance(value, (BaseModel, ListModel)):
+            return self._write_model
+        elif isinstance(value, datetime):
+            return self._write_datetime
+        for cls, writer in self._writers.items():
+            if isinstance(value, cls):
+                return writer
+        raise TypeError('Object of type {0} could not be encoded'.format(value.__class__.__name__))
+
+    def _write_none(self, value, field):
+        self.buffer.append(0xc0)
+
+    def _write_bool(self, value, field):
+        self.buffer.append(0xc3 if value else 0xc2)
+
+    def _write_int(self, value, field):
+        if 0 <= value < 0x80:
+            self.buffer.append(value)
+        elif -0x20 <= value < 0:
+            self.buffer.append(value & 0xff)
+        elif 0 <= value < 0x10000:
+            self.buffer += _uint8.pack(0xcc, value) if value < 0x100 else _uint16.pack(0xcd, value)
+        elif 0 <= value < 0x10000000000000000:
+            self.buffer += _uint32.pack(0xce, value) if value < 0x100000000 else _uint64.pack(0xcf, value)
+        elif -0x8000 <= value < 0:
+            self.buffer += _int8.pack(0xd0, value) if value >= -0x80 else _int16.pack(0xd1, value)
+        elif -0x8000000000000000 <= value < 0:
+            self.buffer += _int32.pack(0xd2, value) if value >= -0x80000000 else _int64.pack(0xd3, value)
+        else:
+            self._write_ext(EXT_BIGINT, value.to_bytes(value.bit_length() // 8 + 1, 'big', signed=True))
+
+    def _write_float(self, value, field):
+        self.buffer += _float64.pack(0xcb, value)
+
+    def _write_str(self, value, field):
+        data = value.encode('utf-8')
+        size = len(data)
+        if size < 0x20:
+            self.buffer.append(0xa0 | size)
+        elif size < 0x100:
+            self.buffer += _uint8.pack(0xd9, size)
+        elif size < 0x10000:
+            self.buffer += _uint16.pack(0xda, size)
+        else:
+            self.buffer += _uint32.pack(0xdb, size)
+        self.buffer += data
+
+    def _write_bytes(self, value, field):
+        size = len(value)
+        if size < 0x100:
+            self.buffer += _uint8.pack(0xc4, size)
+        elif size < 0x10000:
+            self.buffer += _uint16.pack(0xc5, size)
+        else:
+            self.buffer += _uint32.pack(0xc6, size)
+        self.buffer += value
+
+    def _write_header(self, size, fix, header16, header32):
+        if size < 0x10:
+            self.buffer.append(fix | size)
+        elif size < 0x10000:
+            self.buffer += _uint16.pack(header16, size)
+        else:
+            self.buffer += _uint32.pack(header32, size)
+
+    def _write_list(self, value, field):
+        self._write_header(len(value), 0x90, 0xdc, 0xdd)
+        item_field = _get_item_field(field)
+        write = self.write
+        for item in value:
+            write(item, item_field)
+
+    def _write_dict(self, value, field):
+        self._write_header(len(value), 0x80, 0xde, 0xdf)
+        field = _resolve_field(field, ModelField)
+        field_index = _get_field_index(field.model_class) if field is not None else None
+        write = self.write
+
+        if field_index is not None:
+            positions = field_index[1]
+            try:
+                items = [(positions[key], item) for key, item in value.items()]
+            except KeyError:
+                pass
+            else:
+                buffer = self.buffer
+                for (position, item_field), item in items:
+                    buffer += position
+                    write(item, item_field)
+                return
+
+        for key, item in value.items():
+            write(key)
+            write(item, _get_inner_field(field, key))
+
+    def _write_model(self, value, field):
+        self.write(value._get_exported_data(), field)
+
+    def _write_ext(self, ext_type, data):
+        size = len(data)
+        if size < 0x100:
+            self.buffer += _ext8.pack(0xc7, size, ext_type)
+        elif size < 0x10000:
+            self.buffer += _ext16.pack(0xc8, size, ext_type)
+        else:
+            self.buffer += _ext32.pack(0xc9, size, ext_type)
+        self.buffer += data
+
+    def _pack_offset(self, value):
+        offset = value.utcoffset()
+        if offset is None:
+            return b''
+        return _offset.pack(offset // timedelta(microseconds=1))
+
+    def _write_datetime(self, value, field):
+        self._write_ext(EXT_DATETIME, _datetime.pack(value.year, value.month, value.day, value.hour,
+                                                     value.minute, value.second, value.microsecond) +
+                        self._pack_offset(value))
+
+    def _write_date(self, value, field):
+        self._write_ext(EXT_DATE, _date.pack(value.year, value.month, value.day))
+
+    def _write_time(self, value, field):
+        self._write_ext(EXT_TIME, _time.pack(value.hour, value.minute, value.second, value.microsecond) +
+                        self._pack_offset(value))
+
+    def _write_timedelta(self, value, field):
+        self._write_ext(EXT_TIMEDELTA, _timedelta.pack(value.days, value.seconds, value.microseconds))
+
+    def _write_enum(self, value, field):
+        encoder = self.__class__()
+        encoder.write(value.value)
+        self._write_ext(EXT_ENUM, encoder.buffer)
+
+
+class BinaryDecoder:
+    """
+    Decodes data, guided by fields, to a form which could be used to build models through trusted
+    construction path.
+    """
+
+    def __init__(self, data):
+        """
+        :param data: Encoded data.
+        :type data: bytes
+        """
+        self.data = bytes(data)
+        self.pos = 0
+        self._readers = {0xc0: self._read_none,
+                         0xc2: self._read_false,
+                         0xc3: self._read_true,
+                         0xc4: self._read_bin8,
+                         0xc5: self._read_bin16,
+                         0xc6: self._read_bin32,
+                         0xc7: self._read_ext8,
+                         0xc8: self._read_ext16,
+                         0xc9: self._read_ext32,
+                         0xcb: self._read_float64,
+                         0xcc: self._read_uint8,
+                         0xcd: self._read_uint16,
+                         0xce: self._read_uint32,
+                         0xcf: self._read_uint64,
+                         0xd0: self._read_int8,
+                         0xd1: self._read_int16,
+                         0xd2: self._read_int32,
+                         0xd3: self._read_int64,
+                         0xd9: self._read_str8,
+                         0xda: self._read_str16,
+                         0xdb: self._read_str32,
+                         0xdc: self._read_array16,
+                         0xdd: self._read_array32,
+                         0xde: self._read_map16,
+                         0xdf: self._read_map32}
+        self._ext_readers = {EXT_DATETIME: self._read_datetime,
+                             EXT_DATE: self._read_date,
+                             EXT_TIME: self._read_time,
+                             EXT_TIMEDELTA: self._read_timedelta,
+                             EXT_ENUM: self._read_enum,
+                             EXT_BIGINT: self._read_bigint}
+
+    def decode(self, field=None):
+        """
+        Decodes whole data.
+
+        :param field: Field of encoded value, if it is known.
+        :return: Decoded value.
+        """
+        value = self.read(field)
+        if self.pos != len(self.data):
+            raise ValueError('Extra data after encoded value')
+        return value
+
+    def read(self, field=None):
+        """
+        Reads a value.
+
+        :param field: Field of value, if it is known.
+        :return: Decoded value.
+        """
+        try:
+            header = self.data[self.pos]
+        except IndexError:
+            raise ValueError('Unexpected end of data')
+        self.pos += 1
+
+        if header < 0x80:
+            return header
+        elif header >= 0xe0:
+            return header - 0x100
+        elif header >= 0xa0 and header < 0xc0:
+            return self._read_str(header & 0x1f)
+        elif header >= 0x90 and header < 0xa0:
+            return self._read_array(header & 0x0f, field)
+        elif header < 0x90:
+            return self._read_map(header & 0x0f, field)
+
+        try:
+            reader = self._readers[header]
+        except KeyError:
+            raise ValueError('Unknown type 0x{0:02x} at position {1}'.format(header, self.pos - 1))
+        return reader(field)
+
+    def _take(self, size):
+        start = self.pos
+        end = self.pos = start + size
+        if end > len(self.data):
+            raise ValueError('Unexpected end of data')
+        return self.data[start:end]
+
+    def _unpack(self, struct):
+        """
+        Unpacks a number which follows header. Structs include header byte.
+        """
+        start = self.pos - 1
+        self.pos = start + struct.size
+        if self.pos > len(self.data):
+            raise ValueError('Unexpected end of data')
+        return struct.unpack_from(self.data, start)[1]
+
+    def _read_none(self, field):
+        return None
+
+    def _read_false(self, field):
+        return False
+
+    def _read_true(self, field):
+        return True
+
+    def _read_uint8(self, field):
+        return self._unpack(_uint8)
+
+    def _read_uint16(self, field):
+        return self._unpack(_uint16)
+
+    def _read_uint32(self, field):
+        return self._unpack(_uint32)
+
+    def _read_uint64(self, field):
+        return self._unpack(_uint64)
+
+    def _read_int8(self, field):
+        return self._unpack(_int8)
+
+    def _read_int16(self, field):
+        return self._unpack(_int16)
+
+    def _read_int32(self, field):
+        return self._unpack(_int32)
+
+    def _read_int64(self, field):
+        return self._unpack(_int64)
+
+    def _read_float64(self, field):
+        return self._unpack(_float64)
+
+    def _read_str(self, size):
+        return self._take(size).decode('utf-8')
+
+    def _read_str8(self, field):
+        return self._read_str(self._unpack(_uint8))
+
+    def _read_str16(self, field):
+        return self._read_str(self._unpack(_uint16))
+
+    def _read_str32(self, field):
+        return self._read_str(self._unpack(_uint32))
+
+    def _read_bin8(self, field):
+        return self._take(self._unpack(_uint8))
+
+    def _read_bin16(self, field):
+        return self._take(self._unpack(_uint16))
+
+    def _read_bin32(self, field):
+        return self._take(self._unpack(_uint32))
+
+    def _read_array(self, size, field):
+        item_field = _get_item_field(field)
+        read = self.read
+        return [read(item_field) for _ in range(size)]
+
+    def _read_array16(self, field):
+        return self._read_array(self._unpack(_uint16), field)
+
+    def _read_array32(self, field):
+        return self._read_array(self._unpack(_uint32), field)
+
+    def _read_map(self, size, field):
+        field = _resolve_field(field, ModelField)
+        field_index = _get_field_index(field.model_class) if field is not None else None
+        read = self.read
+        result = {}
+        for _ in range(size):
+            key = read()
+            if field_index is not None and key.__class__ is int:
+                try:
+                    key, item_field = field_index[0][key]
+                except IndexError:
+                    raise ValueError('Unknown field position {0} for model {1}'.format(key,
+                                                                                       field.model_class.__name__))
+                result[key] = read(item_field)
+            else:
+                result[key] = read(_get_inner_field(field, key))
+        return result
+
+    def _read_map16(self, field):
+        return self._read_map(self._unpack(_uint16), field)
+
+    def _read_map32(self, field):
+        return self._read_map(self._unpack(_uint32), field)
+
+    def _read_ext(self, size, field):
+        ext_type = self._take(1)[0]
+        try:
+            reader = self._ext_readers[ext_type]
+        except KeyError:
+            raise ValueError('Unknown extension type {0}'.format(ext_type))
+        return reader(self._take(size), field)
+
+    def _read_ext8(self, field):
+        return self._read_ext(self._unpack(_uint8), field)
+
+    def _read_ext16(self, field):
+        return self._read_ext(self._unpack(_uint16), field)
+
+    def _read_ext32(self, field):
+        return self._read_ext(self._unpack(_uint32), field)
+
+    def _unpack_tzinfo(self, data, size):
+        if len(data) == size:
+            return None
+        return timezone(timedelta(microseconds=_offset.unpack_from(data, size)[0]))
+
+    def _read_datetime(self, data, field):
+        return datetime(*_datetime.unpack_from(data), tzinfo=self._unpack_tzinfo(data, _datetime.size))
+
+    def _read_date(self, data, field):
+        return date(*_date.unpack(data))
+
+    def _read_time(self, data, field):
+        return time(*_time.unpack_from(data), tzinfo=self._unpack_tzinfo(data, _time.size))
+
+    def _read_timedelta(self, data, field):
+        return timedelta(*_timedelta.unpack(data))
+
+    def _read_enum(self, data, field):
+        value = self.__class__(data).decode()
+        field = _resolve_field(field, EnumField)
+        if field is None:
+            return value
+        return field.enum_class(value)
+
+    def _read_bigint(self, data, field):
+        return int.from_bytes(data, 'big', signed=True)
+
+
+def encode(obj):
+    """
+    Encodes a model, a list model or plain data.
+
+    :param obj: Object to encode.
+    :return: Encoded data.
+    :rtype: bytes
+    """
+    return BinaryEncoder().encode(obj)
+
+
+def decode(obj_class, data, field_type=None, **kwargs):
+    """
+    Decodes data encoded from a model or a list model of same class.
+
+    :param obj_class: Model class or list model class. Use ``None`` to decode plain data.
+    :param data: Encoded data.
+    :type data: bytes
+    :param field_type: Field type of items for hash map models and list models.
+    :return: Model, list model or plain data.
+    """
+    if obj_class is None:
+        return BinaryDecoder(data).decode()
+
+    value = BinaryDecoder(data).decode(_get_root_field(obj_class, field_type))
+    if issubclass(obj_class, ListModel):
+        if not isinstance(value, list):
+            raise TypeError('Encoded data is not a list')
+        return obj_class.from_trusted(value, field_type=field_type)
+
+    if not isinstance(value, dict):
+        raise TypeError('Encoded data is not a model')
+    if field_type is not None:
+        kwargs['field_type'] = field_type
+    return obj_class.from_trusted(value, **kwargs)
@@ -2,14 +2,16 @@
 Fields to be used with dirty models.
 """
 
+import re
 from collections.abc import Mapping
 from datetime import date, datetime, time, timedelta
 from enum import Enum
-from functools import wraps
+from functools import lru_cache, wraps
 
 from dateutil.parser import parse as dateutil_parse
+from dateutil.tz import tzoffset, tzutc
 
-from .base import AccessMode, Creating
+from .base import UNUSABLE, AccessMode, Creating, LazyValue, touch_access_modes
 from .model_types import ListModel
 
 __all__ = ['IntegerField', 'FloatField', 'BooleanField', 'StringField', 'StringIdField', 'DateTimeBaseField',
@@ -17,9 +19,20 @@ __all__ = ['IntegerField', 'FloatField', 'BooleanField', 'StringField', 'StringI
            'HashMapField', 'BlobField', 'MultiTypeField', 'EnumField', 'BytesField', 'BaseField']
 
 
+CONVERSION_METHODS = ('check_value', 'can_use_value', 'use_value', 'convert_value', 'convert_value_creating')
+
+
+def accept_value(value, creating=False):
+    """Converter for values which are already field's type"""
+    return value
+
+
 class BaseField:
     """Base field descriptor."""
 
+    #: Maximum number of value types with a cached converter.
+    converters_size = 256
+
     def __init__(self, name=None, alias=None, getter=None, setter=None, read_only=None,
                  default=None, title=None, doc=None, metadata=None, access_mode=AccessMode.READ_AND_WRITE,
                  json_schema=None):
@@ -32,15 +45,38 @@ class BaseField:
         self._name = None
         self.name = name
         self.alias = alias
-        self.access_mode = access_mode
+        self._access_mode = access_mode
         self.default = default
         self.title = title
         self.metadata = metadata
         self.json_schema = json_schema
         self._getter = getter
         self._setter = setter
+        self._converters = {}
         self.__doc__ = doc or self.get_field_docstring()
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_converters'] = {}
+        return state
+
+    def __setstate__(self, state):
+        if 'access_mode' in state:
+            state = state.copy()
+            state['_access_mode'] = state.pop('access_mode')
+        self.__dict__.update(state)
+
+    @property
+    def access_mode(self):
+        """Access mode of field."""
+        return self._access_mode
+
+    @access_mode.setter
+    def access_mode(self, value):
+        if value != self._access_mode:
+            self._access_mode = value
+            touch_access_modes()
+
     def get_field_docstring(self):
         dcstr = '{0} field'.format(self.__class__.__name__)
         if self.access_mode:
@@ -91,10 +127,122 @@ class BaseField:
         """Checks whether value is field's type"""
         return False
 
+    def adopt_value(self, value):
+        """Returns trusted value to be stored as it is, without checks or conversions"""
+        return value
+
     def can_use_value(self, value):
         """Checks whether value could be converted to field's type"""
         return True
 
+    def check_value_type(self, value_type):
+        """
+        Checks whether every value of exact type ``value_type`` is field's type, like :meth:`check_value`
+        does for a value.
+
+        :param value_type: Type of values.
+        :type value_type: type
+        :return: ``True`` or ``False``, or ``None`` when it depends on value.
+        """
+        if type(self).check_value is BaseField.check_value:
+            return False
+        return None
+
+    def can_use_value_type(self, value_type):
+        """
+        Checks whether every value of exact type ``value_type`` could be converted to field's type, like
+        :meth:`can_use_value` does for a value.
+
+        :param value_type: Type of values.
+        :type value_type: type
+        :return: ``True`` or ``False``, or ``None`` when it depends on value.
+        """
+        if type(self).can_use_value is BaseField.can_use_value:
+            return True
+        return None
+
+    def get_converter(self, value_type):
+        """
+        Returns a function ``converter(value, creating)`` for values of exact type ``value_type``. It returns
+        value converted to field's type, like :meth:`use_value` does, or
+        :data:`~dirty_models.base.UNUSABLE` when value could not be used. Converters are built once per type.
+
+        :param value_type: Type of values.
+        :type value_type: type
+        :return: function
+        """
+        try:
+            return self._converters[value_type]
+        except KeyError:
+            pass
+
+        converter = self.build_converter(value_type)
+        if len(self._converters) < self.converters_size:
+            self._converters[value_type] = converter
+        return converter
+
+    def build_converter(self, value_type):
+        """
+        Builds converter for values of exact type ``value_type``. Field classes could return specialized
+        converters for types they know, but only when their conversion methods are not overridden.
+        See :meth:`get_converter`.
+
+        :param value_type: Type of values.
+        :type value_type: type
+        :return: function
+        """
+        field_class = type(self)
+        check_value = self.check_value
+        can_use_value = self.can_use_value
+
+        if field_class.use_value is not BaseField.use_value:
+            use_value = self.use_value
+
+            def converter(value, creating=False):
+                if check_value(value) or can_use_value(value):
+                    return use_value(value, creating=creating)
+                return UNUSABLE
+
+            return converter
+
+        if issubclass(value_type, Enum) and getattr(field_class.can_use_value, 'use_enum_value', False) \
+                and getattr(field_class.convert_value, 'use_enum_value', False) \
+                and field_class.convert_value_creating is BaseField.convert_value_creating:
+            get_converter = self.get_converter
+
+            def enum_converter(value, creating=False):
+                if check_value(value):
+                    return value
+                value = value.value
+                if isinstance(value, Enum):
+                    return UNUSABLE
+                return get_converter(type(value))(value, creating)
+
+            return enum_converter
+
+        convert_value = self.convert_value
+        convert_value_creating = self.convert_value_creating
+
+        def converter(value, creating=False):
+            if check_value(value):
+                return value
+            if can_use_value(value):
+                return convert_value_creating(value) if creating else convert_value(value)
+            return UNUSABLE
+
+        return converter
+
+    def overrides_conversion(self, field_class):
+        """
+        Returns whether field's class overrides any conversion method of ``field_class``.
+
+        :param field_class: Field class which defines specialized converters.
+        :type field_class: type
+        :rtype: bool
+        """
+        cls = type(self)
+        return any(getattr(cls, name) is not getattr(field_class, name) for name in CONVERSION_METHODS)
+
     def set_value(self, obj, value):
         """Sets value to model"""
         obj.set_field_value(self.name, value)
@@ -129,22 +277,75 @@ class BaseField:
             self._setter(self, obj, value)
             return
 
-        from dirty_models.utils import Factory
+        if value is None:
+            self.delete_value(obj)
+        else:
+            self._set_converted_value(obj, value)
 
-        def set_value(v):
-            if value is None:
-                self.delete_value(obj)
-            elif self.check_value(v) or self.can_use_value(v):
-                self.set_value(obj, self.use_value(v, creating=obj.is_creating()))
-            elif isinstance(value, Factory):
-                set_value(v())
+    def _set_converted_value(self, obj, value):
+        try:
+            converter = self._converters[type(value)]
+        except KeyError:
+            converter = self.get_converter(type(value))
 
-        set_value(value)
+        value_converted = converter(value, obj.is_creating())
+        if value_converted is not UNUSABLE:
+            self.set_value(obj, value_converted)
+        else:
+            from dirty_models.utils import Factory
+
+            if isinstance(value, Factory):
+                self._set_converted_value(obj, value())
 
     def __delete__(self, obj):
         self._check_name()
         self.delete_value(obj)
 
+    def build_importer(self):
+        """
+        Returns a function ``importer(obj, value)`` which sets value to model like :meth:`__set__` does,
+        but with field methods already resolved. It is used by model classes to compile their import plan.
+        """
+        self._check_name()
+
+        if type(self).__set__ is not BaseField.__set__:
+            return self.__set__
+
+        if self._setter:
+            setter = self._setter
+
+            def custom_importer(obj, value):
+                setter(self, obj, value)
+
+            return custom_importer
+
+        from dirty_models.utils import Factory
+
+        converters = self._converters
+        get_converter = self.get_converter
+        set_value = self.set_value
+        delete_value = self.delete_value
+
+        def set_converted_value(obj, value):
+            try:
+                converter = converters[type(value)]
+            except KeyError:
+                converter = get_converter(type(value))
+
+            value_converted = converter(value, obj.is_creating())
+            if value_converted is not UNUSABLE:
+                set_value(obj, value_converted)
+            elif isinstance(value, Factory):
+                set_converted_value(obj, value())
+
+        def importer(obj, value):
+            if value is None:
+                delete_value(obj)
+            else:
+                set_converted_value(obj, value)
+
+        return importer
+
 
 def can_use_enum(func):
     """
@@ -158,6 +359,7 @@ def can_use_enum(func):
 
         return func(self, value)
 
+    inner.use_enum_value = True
     return inner
 
 
@@ -177,6 +379,7 @@ def convert_enum(func):
 
         return func(self, value)
 
+    inner.use_enum_value = True
     return inner
 
 
@@ -215,6 +418,34 @@ class IntegerField(BaseField):
                 pass
         return False
 
+    def check_value_type(self, value_type):
+        if type(self).check_value is IntegerField.check_value:
+            return issubclass(value_type, int)
+        return super(IntegerField, self).check_value_type(value_type)
+
+    def can_use_value_type(self, value_type):
+        if type(self).can_use_value is IntegerField.can_use_value and not issubclass(value_type, (Enum, str)):
+            return issubclass(value_type, float)
+        return super(IntegerField, self).can_use_value_type(value_type)
+
+    def build_converter(self, value_type):
+        if self.overrides_conversion(IntegerField):
+            pass
+        elif value_type in (int, bool):
+            return accept_value
+        elif value_type is float:
+            return lambda value, creating=False: int(value)
+        elif value_type is str:
+            def converter(value, creating=False):
+                try:
+                    return int(value, 0)
+                except ValueError:
+                    return UNUSABLE
+
+            return converter
+
+        return super(IntegerField, self).build_converter(value_type)
+
 
 class FloatField(BaseField):
     """
@@ -245,6 +476,35 @@ class FloatField(BaseField):
         else:
             return True
 
+    def check_value_type(self, value_type):
+        if type(self).check_value is FloatField.check_value:
+            return issubclass(value_type, float)
+        return super(FloatField, self).check_value_type(value_type)
+
+    def can_use_value_type(self, value_type):
+        if type(self).can_use_value is FloatField.can_use_value and not issubclass(value_type, Enum):
+            if issubclass(value_type, (int, float)):
+                return True
+            elif issubclass(value_type, (dict, list, tuple, set, type(None))):
+                return False
+        return super(FloatField, self).can_use_value_type(value_type)
+
+    def build_converter(self, value_type):
+        if self.overrides_conversion(FloatField):
+            pass
+        elif value_type is float:
+            return accept_value
+        elif value_type in (int, bool, str):
+            def converter(value, creating=False):
+                try:
+                    return float(value)
+                except ValueError:
+                    return UNUSABLE
+
+            return converter
+
+        return super(FloatField, self).build_converter(value_type)
+
 
 class BooleanField(BaseField):
     """
@@ -276,6 +536,28 @@ class BooleanField(BaseField):
     def can_use_value(self, value):
         return isinstance(value, (int, str))
 
+    def check_value_type(self, value_type):
+        if type(self).check_value is BooleanField.check_value:
+            return issubclass(value_type, bool)
+        return super(BooleanField, self).check_value_type(value_type)
+
+    def can_use_value_type(self, value_type):
+        if type(self).can_use_value is BooleanField.can_use_value and not issubclass(value_type, Enum):
+            return issubclass(value_type, (int, str))
+        return super(BooleanField, self).can_use_value_type(value_type)
+
+    def build_converter(self, value_type):
+        if self.overrides_conversion(BooleanField):
+            pass
+        elif value_type is bool:
+            return accept_value
+        elif value_type is int:
+            return lambda value, creating=False: bool(value)
+        elif value_type is str:
+            return lambda value, creating=False: value.lower().strip() in ('true', 'yes')
+
+        return super(BooleanField, self).build_converter(value_type)
+
 
 class StringField(BaseField):
     """
@@ -302,6 +584,26 @@ class StringField(BaseField):
     def can_use_value(self, value):
         return isinstance(value, (int, float))
 
+    def check_value_type(self, value_type):
+        if type(self).check_value is StringField.check_value:
+            return issubclass(value_type, str)
+        return super(StringField, self).check_value_type(value_type)
+
+    def can_use_value_type(self, value_type):
+        if type(self).can_use_value is StringField.can_use_value and not issubclass(value_type, Enum):
+            return issubclass(value_type, (int, float))
+        return super(StringField, self).can_use_value_type(value_type)
+
+    def build_converter(self, value_type):
+        if self.overrides_conversion(StringField):
+            pass
+        elif value_type is str:
+            return accept_value
+        elif value_type in (int, float, bool):
+            return lambda value, creating=False: str(value)
+
+        return super(StringField, self).build_converter(value_type)
+
 
 class StringIdField(StringField):
     """
@@ -325,12 +627,135 @@ class StringIdField(StringField):
             self.delete_value(obj)
 
 
+ISO_DATETIME_REGEX = re.compile(r'(\d{4})-(\d{2})-(\d{2})'
+                                r'(?:[T ](\d{2}):(\d{2})(?::(\d{2})(?:\.(\d{1,6}))?)?'
+                                r'(?:(Z)|([+-])(\d{2}):?(\d{2}))?)?$')
+
+ISO_TIME_REGEX = re.compile(r'(\d{2}):(\d{2})(?::(\d{2})(?:\.(\d{1,6}))?)?$')
+
+UTC = tzutc()
+
+#: Formats which are equivalent to :meth:`datetime.datetime.isoformat` for naive datetimes, with
+#: separator, time specification and suffix.
+ISO_DATETIME_FORMATS = {'%Y-%m-%dT%H:%M:%S': ('T', 'seconds', ''),
+                        '%Y-%m-%dT%H:%M:%SZ': ('T', 'seconds', 'Z'),
+                        '%Y-%m-%dT%H:%M:%S.%f': ('T', 'microseconds', ''),
+                        '%Y-%m-%dT%H:%M:%S.%fZ': ('T', 'microseconds', 'Z'),
+                        '%Y-%m-%d %H:%M:%S': (' ', 'seconds', ''),
+                        '%Y-%m-%d %H:%M:%S.%f': (' ', 'microseconds', '')}
+
+ISO_DATE_FORMAT = '%Y-%m-%d'
+
+
+def parse_iso_datetime(value):
+    """
+    Parses a strict ISO 8601 (RFC 3339) datetime string, like ``2012-09-11T13:02:41.123Z``. ``Z`` and
+    zero offsets are always :class:`dateutil.tz.tzutc`, other offsets are :class:`dateutil.tz.tzoffset`
+    and strings with no timezone are naive. Unlike :func:`dateutil.parser.parse`, it never returns
+    :class:`dateutil.tz.tzlocal` on hosts whose local timezone is UTC.
+
+    :param value: String.
+    :type value: str
+    :return: Parsed datetime or ``None`` when string is not a strict ISO 8601 datetime.
+    :rtype: datetime.datetime
+    """
+    match = ISO_DATETIME_REGEX.match(value)
+    if match is None:
+        return None
+
+    year, month, day, hour, minute, second, fraction, utc, sign, tz_hours, tz_minutes = match.groups()
+    if utc:
+        tzinfo = UTC
+    elif sign:
+        offset = int(tz_hours) * 3600 + int(tz_minutes) * 60
+        if offset == 0:
+            tzinfo = UTC
+        else:
+            tzinfo = tzoffset(None, offset if sign == '+' else -offset)
+    else:
+        tzinfo = None
+
+    try:
+        return datetime(int(year), int(month), int(day),
+                        int(hour or 0), int(minute or 0), int(second or 0),
+                        int(fraction.ljust(6, '0')) if fraction else 0, tzinfo)
+    except ValueError:
+        return None
+
+
+def parse_iso_time(value):
+    """
+    Parses a strict ISO 8601 time string with no timezone, like ``13:02:41``.
+
+    :param value: String.
+    :type value: str
+    :return: Parsed time or ``None`` when string is not a strict ISO 8601 time.
+    :rtype: datetime.time
+    """
+    match = ISO_TIME_REGEX.match(value)
+    if match is None:
+        return None
+
+    hour, minute, second, fraction = match.groups()
+    try:
+        return time(int(hour), int(minute), int(second or 0), int(fraction.ljust(6, '0')) if fraction else 0)
+    except ValueError:
+        return None
+
+
+def build_value_formatter(formatter):
+    """
+    Returns a function to cast a date, time or datetime to string using a formatter description.
+    Common ISO 8601 formats use :meth:`~datetime.datetime.isoformat`, which is faster than
+    :meth:`~datetime.datetime.strftime`.
+
+    :param formatter: ``None`` to use :class:`str`, a callable or a string format.
+    :return: function
+    """
+    if formatter is None:
+        return str
+    elif callable(formatter):
+        return formatter
+
+    try:
+        sep, timespec, suffix = ISO_DATETIME_FORMATS[formatter]
+    except KeyError:
+        pass
+    else:
+        def format_iso_datetime(value):
+            if type(value) is datetime and value.tzinfo is None and value.year >= 1000:
+                return value.isoformat(sep, timespec) + suffix
+            return value.strftime(formatter)
+
+        return format_iso_datetime
+
+    if formatter == ISO_DATE_FORMAT:
+        def format_iso_date(value):
+            if type(value) is date and value.year >= 1000:
+                return value.isoformat()
+            return value.strftime(formatter)
+
+        return format_iso_date
+
+    def format_value(value):
+        return value.strftime(formatter)
+
+    return format_value
+
+
 class DateTimeBaseField(BaseField):
-    """Base field for time or/and date fields."""
+    """
+    Base field for time or/and date fields.
+
+    Strings are parsed using parser defined on ``parse_format``. When it is not defined, strict ISO 8601
+    strings are parsed directly and anything else is parsed by :func:`dateutil.parser.parse`.
+    Parser and formatter are resolved once, and again only when ``parse_format`` or ``date_parsers``
+    change.
+    """
 
     date_parsers = {}
 
-    def __init__(self, parse_format=None, **kwargs):
+    def __init__(self, parse_format=None, parse_cache_size=0, format_cache_size=0, **kwargs):
         """
 
         :param parse_format: String format to cast string to datetime. It could be
@@ -340,36 +765,160 @@ class DateTimeBaseField(BaseField):
                 * ``formatter`` key to set how datetime must be formatted. It could be a callable.
 
         :type parse_format: str or dict
+
+        :param parse_cache_size: Maximum number of parsed strings to keep. Parsed values are not cached
+                                 when it is ``0``.
+
+        :type parse_cache_size: int
+
+        :param format_cache_size: Maximum number of formatted values to keep. Formatted values are not
+                                  cached when it is ``0``.
+
+        :type format_cache_size: int
         """
         super(DateTimeBaseField, self).__init__(**kwargs)
         self.parse_format = parse_format
+        self.parse_cache_size = parse_cache_size
+        self.format_cache_size = format_cache_size
+        self._resolution = None
+
+    def __getstate__(self):
+        state = super(DateTimeBaseField, self).__getstate__()
+        state['_resolution'] = None
+        return state
 
     def export_definition(self):
         result = super(DateTimeBaseField, self).export_definition()
         result['parse_format'] = self.parse_format
+        if self.parse_cache_size:
+            result['parse_cache_size'] = self.parse_cache_size
+        if self.format_cache_size:
+            result['format_cache_size'] = self.format_cache_size
         return result
 
-    def get_parsed_value(self, value):
+    def _get_resolution(self):
         """
-        Helper to cast string to datetime using :member:`parse_format`.
-
-        :param value: String representing a datetime
-        :type value: str
-        :return: datetime
+        Returns parser description, string parser and value formatter, resolved from :member:`parse_format`
+        and :member:`date_parsers`. They are resolved again only when any of them changes.
         """
+        parse_format = self.parse_format
+        date_parsers = self.date_parsers
+        entry = date_parsers.get(parse_format) if isinstance(parse_format, str) else None
+
+        resolution = self._resolution
+        if resolution is not None and resolution[0] is parse_format and resolution[1] is date_parsers \
+                and resolution[2] is entry:
+            return resolution[3]
 
         def get_parser(parser_desc):
             try:
                 return parser_desc['parser']
             except TypeError:
                 try:
-                    return get_parser(self.date_parsers[parser_desc])
+                    return get_parser(date_parsers[parser_desc])
                 except KeyError:
                     return parser_desc
             except KeyError:
                 pass
 
-        parser = get_parser(self.parse_format)
+        def get_formatter(parser_desc):
+            try:
+                return parser_desc['formatter']
+            except TypeError:
+                if isinstance(parser_desc, str):
+                    try:
+                        return get_formatter(date_parsers[parser_desc])
+                    except KeyError:
+                        return parser_desc
+                else:
+                    pass
+            except KeyError:
+                try:
+                    if isinstance(parser_desc['parser'], str):
+                        return parser_desc['parser']
+                except KeyError:
+                    pass
+
+        string_parser = self.parse_string
+        if self.parse_cache_size:
+            string_parser = lru_cache(maxsize=self.parse_cache_size)(string_parser)
+
+        value_formatter = build_value_formatter(get_formatter(parse_format))
+        if self.format_cache_size:
+            value_formatter = self._build_format_cache(value_formatter)
+
+        result = get_parser(parse_format), string_parser, value_formatter
+        self._resolution = parse_format, date_parsers, entry, result
+        return result
+
+    def _build_format_cache(self, value_formatter):
+        """
+        Wraps value formatter with a bounded LRU cache. Timezone and fold are part of key, because
+        aware values which represent same instant are equal.
+        """
+        @lru_cache(maxsize=self.format_cache_size)
+        def format_cached(value, tzinfo, fold):
+            return value_formatter(value)
+
+        def format_value(value):
+            return format_cached(value, getattr(value, 'tzinfo', None), getattr(value, 'fold', 0))
+
+        format_value.cache_info = format_cached.cache_info
+        format_value.cache_clear = format_cached.cache_clear
+        return format_value
+
+    def get_string_parser(self):
+        """
+        Returns function to cast a string to field's type, like :meth:`parse_string` does. When
+        ``parse_cache_size`` is defined, it is a bounded LRU cache of parsed strings, so its statistics
+        are available using its ``cache_info()`` method.
+
+        :return: function
+        """
+        return self._get_resolution()[1]
+
+    def convert_string(self, value, creating=False):
+        """
+        Converter for strings. See :meth:`get_converter`.
+        """
+        return self.get_string_parser()(value)
+
+    def parse_string(self, value):
+        """
+        Casts a string to field's type.
+
+        :param value: String.
+        :type value: str
+        :return: Parsed value or ``None`` when string could not be parsed.
+        """
+        try:
+            if not self.parse_format:
+                return self.parse_default(value)
+            return self.convert_parsed_value(self.get_parsed_value(value))
+        except Exception:
+            return None
+
+    def parse_default(self, value):
+        """
+        Casts a string to field's type when no :member:`parse_format` is defined.
+        """
+        return parse_iso_datetime(value) or dateutil_parse(value)
+
+    def convert_parsed_value(self, value):
+        """
+        Converts a value returned by parser to field's type.
+        """
+        return value
+
+    def get_parsed_value(self, value):
+        """
+        Helper to cast string to datetime using :member:`parse_format`.
+
+        :param value: String representing a datetime
+        :type value: str
+        :return: datetime
+        """
+        parser = self._get_resolution()[0]
 
         if parser is None:
             try:
@@ -389,34 +938,17 @@ class DateTimeBaseField(BaseField):
         :type value: datetime
         :return: str
         """
+        return self._get_resolution()[2](value)
 
-        def get_formatter(parser_desc):
-            try:
-                return parser_desc['formatter']
-            except TypeError:
-                if isinstance(parser_desc, str):
-                    try:
-                        return get_formatter(self.date_parsers[parser_desc])
-                    except KeyError:
-                        return parser_desc
-                else:
-                    pass
-            except KeyError:
-                try:
-                    if isinstance(parser_desc['parser'], str):
-                        return parser_desc['parser']
-                except KeyError:
-                    pass
-
-        formatter = get_formatter(self.parse_format)
-
-        if formatter is None:
-            return str(value)
-
-        if callable(formatter):
-            return formatter(value)
+    def get_value_formatter(self):
+        """
+        Returns function to cast a value to string, like :meth:`get_formatted_value` does. When
+        ``format_cache_size`` is defined, formatted values are kept on a bounded LRU cache, so its
+        statistics are available using its ``cache_info()`` method.
 
-        return value.strftime(format=formatter)
+        :return: function
+        """
+        return self._get_resolution()[2]
 
 
 class TimeField(DateTimeBaseField):
@@ -465,24 +997,43 @@ class TimeField(DateTimeBaseField):
         elif isinstance(value, int):
             return self.convert_value(datetime.fromtimestamp(value, tz=self.default_timezone))
         elif isinstance(value, str):
-            try:
-                if not self.parse_format:
-                    value = dateutil_parse(value)
-                    return value.time()
-
-                return self.convert_value(self.get_parsed_value(value))
-            except Exception:
-                return None
+            return self.get_string_parser()(value)
         elif isinstance(value, datetime):
             return value.timetz()
 
+    def parse_default(self, value):
+        return parse_iso_time(value) or super(TimeField, self).parse_default(value).time()
+
+    def convert_parsed_value(self, value):
+        return self.convert_value(value)
+
     def check_value(self, value):
         return isinstance(value, time)
 
+    def build_converter(self, value_type):
+        if self.overrides_conversion(TimeField):
+            pass
+        elif value_type is time:
+            return accept_value
+        elif value_type is str:
+            return self.convert_string
+
+        return super(TimeField, self).build_converter(value_type)
+
     @can_use_enum
     def can_use_value(self, value):
         return isinstance(value, (int, str, datetime, list, dict))
 
+    def check_value_type(self, value_type):
+        if type(self).check_value is TimeField.check_value:
+            return issubclass(value_type, time)
+        return super(TimeField, self).check_value_type(value_type)
+
+    def can_use_value_type(self, value_type):
+        if type(self).can_use_value is TimeField.can_use_value and not issubclass(value_type, Enum):
+            return issubclass(value_type, (int, str, datetime, list, dict))
+        return super(TimeField, self).can_use_value_type(value_type)
+
     def set_value(self, obj, value: time):
         if self.default_timezone and value.tzinfo is None:
             value = value.replace(tzinfo=self.default_timezone)
@@ -524,24 +1075,43 @@ class DateField(DateTimeBaseField):
         elif isinstance(value, int):
             return self.convert_value(datetime.fromtimestamp(value))
         elif isinstance(value, str):
-            try:
-                if not self.parse_format:
-                    value = dateutil_parse(value)
-                    return value.date()
-
-                return self.convert_value(self.get_parsed_value(value))
-            except Exception:
-                return None
+            return self.get_string_parser()(value)
         elif isinstance(value, datetime):
             return value.date()
 
+    def parse_default(self, value):
+        return super(DateField, self).parse_default(value).date()
+
+    def convert_parsed_value(self, value):
+        return self.convert_value(value)
+
     def check_value(self, value):
         return type(value) is date
 
+    def build_converter(self, value_type):
+        if self.overrides_conversion(DateField):
+            pass
+        elif value_type is date:
+            return accept_value
+        elif value_type is str:
+            return self.convert_string
+
+        return super(DateField, self).build_converter(value_type)
+
     @can_use_enum
     def can_use_value(self, value):
         return isinstance(value, (int, str, datetime, list, dict))
 
+    def check_value_type(self, value_type):
+        if type(self).check_value is DateField.check_value:
+            return value_type is date
+        return super(DateField, self).check_value_type(value_type)
+
+    def can_use_value_type(self, value_type):
+        if type(self).can_use_value is DateField.can_use_value and not issubclass(value_type, Enum):
+            return issubclass(value_type, (int, str, datetime, list, dict))
+        return super(DateField, self).can_use_value_type(value_type)
+
 
 class DateTimeField(DateTimeBaseField):
     """
@@ -595,13 +1165,7 @@ class DateTimeField(DateTimeBaseField):
         elif isinstance(value, int):
             return datetime.fromtimestamp(value, tz=self.default_timezone)
         elif isinstance(value, str):
-            try:
-                if not self.parse_format:
-                    return dateutil_parse(value)
-
-                return self.get_parsed_value(value)
-            except Exception:
-                return None
+            return self.get_string_parser()(value)
         elif isinstance(value, date):
             return datetime(year=value.year, month=value.month,
                             day=value.day)
@@ -609,10 +1173,30 @@ class DateTimeField(DateTimeBaseField):
     def check_value(self, value):
         return type(value) is datetime
 
+    def build_converter(self, value_type):
+        if self.overrides_conversion(DateTimeField):
+            pass
+        elif value_type is datetime:
+            return accept_value
+        elif value_type is str:
+            return self.convert_string
+
+        return super(DateTimeField, self).build_converter(value_type)
+
     @can_use_enum
     def can_use_value(self, value):
         return isinstance(value, (int, str, date, dict, list))
 
+    def check_value_type(self, value_type):
+        if type(self).check_value is DateTimeField.check_value:
+            return value_type is datetime
+        return super(DateTimeField, self).check_value_type(value_type)
+
+    def can_use_value_type(self, value_type):
+        if type(self).can_use_value is DateTimeField.can_use_value and not issubclass(value_type, Enum):
+            return issubclass(value_type, (int, str, date, dict, list))
+        return super(DateTimeField, self).can_use_value_type(value_type)
+
     def set_value(self, obj, value):
         if self.default_timezone:
             if value.tzinfo is None:
@@ -655,6 +1239,26 @@ class TimedeltaField(BaseField):
     def can_use_value(self, value):
         return isinstance(value, (int, float))
 
+    def check_value_type(self, value_type):
+        if type(self).check_value is TimedeltaField.check_value:
+            return value_type is timedelta
+        return super(TimedeltaField, self).check_value_type(value_type)
+
+    def can_use_value_type(self, value_type):
+        if type(self).can_use_value is TimedeltaField.can_use_value and not issubclass(value_type, Enum):
+            return issubclass(value_type, (int, float))
+        return super(TimedeltaField, self).can_use_value_type(value_type)
+
+    def build_converter(self, value_type):
+        if self.overrides_conversion(TimedeltaField):
+            pass
+        elif value_type is timedelta:
+            return accept_value
+        elif value_type in (int, float, bool):
+            return lambda value, creating=False: timedelta(seconds=value)
+
+        return super(TimedeltaField, self).build_converter(value_type)
+
 
 class ModelField(BaseField):
     """
@@ -668,10 +1272,23 @@ class ModelField(BaseField):
     * :class:`dict`.
 
     * :class:`collections.abc.Mapping`.
+
+    **Lazy mode:**
+
+    When ``lazy`` is ``True``, a dictionary set to an empty field is stored as it is and the model
+    is built on first access. Meanwhile, :meth:`~dirty_models.models.BaseModel.export_data` returns
+    the stored dictionary, so it is not copied, converted nor filtered.
     """
 
-    def __init__(self, model_class=None, **kwargs):
+    def __init__(self, model_class=None, lazy=False, **kwargs):
+        """
+
+        :param model_class: Model class to use. By default, model where field is defined.
+        :param lazy: Whether model must be built on first access.
+        :type lazy: bool
+        """
         self._model_class = model_class
+        self.lazy = lazy
 
         try:
             self._model_setter = kwargs.pop('setter')
@@ -683,6 +1300,8 @@ class ModelField(BaseField):
     def export_definition(self):
         result = super(ModelField, self).export_definition()
         result['model_class'] = self.model_class
+        if self.lazy:
+            result['lazy'] = self.lazy
         return result
 
     def get_field_docstring(self):
@@ -708,12 +1327,40 @@ class ModelField(BaseField):
     def convert_value_creating(self, value):
         return self._model_class.create_new_model(value)
 
+    def adopt_value(self, value):
+        if self.check_value(value):
+            return value
+        return LazyValue(value, self.build_trusted_value)
+
+    def build_trusted_value(self, value):
+        """Builds model using trusted data"""
+        return self._model_class.from_trusted(value)
+
     def check_value(self, value):
         return isinstance(value, self._model_class)
 
     def can_use_value(self, value):
         return isinstance(value, (dict, Mapping))
 
+    def check_value_type(self, value_type):
+        if type(self).check_value is ModelField.check_value and self._model_class is not None:
+            return issubclass(value_type, self._model_class)
+        return super(ModelField, self).check_value_type(value_type)
+
+    def can_use_value_type(self, value_type):
+        if type(self).can_use_value is ModelField.can_use_value:
+            return issubclass(value_type, (dict, Mapping))
+        return super(ModelField, self).can_use_value_type(value_type)
+
+    def build_converter(self, value_type):
+        if value_type is dict and not self.overrides_conversion(ModelField):
+            def converter(value, creating=False):
+                return self._model_class.create_new_model(value) if creating else self._model_class(value)
+
+            return converter
+
+        return super(ModelField, self).build_converter(value_type)
+
     def __set__(self, obj, value):
         if self._model_setter:
             self._model_setter(self, obj, value)
@@ -723,13 +1370,60 @@ class ModelField(BaseField):
 
         original = self.get_value(obj)
         if original is None:
+            if self.lazy and self._set_lazy_value(obj, value):
+                return
             super(ModelField, self).__set__(obj, value)
-        elif self.check_value(value):
+        else:
+            self._update_model(original, value)
+
+    def _set_lazy_value(self, obj, value):
+        if self.check_value(value) or not self.can_use_value(value):
+            return False
+
+        builder = self.convert_value_creating if obj.is_creating() else self.convert_value
+        self.set_value(obj, LazyValue(value, builder, modified=True))
+        return True
+
+    def _update_model(self, original, value):
+        if self.check_value(value):
             original.clear()
             original.import_data(value.export_data())
         elif self.can_use_value(value):
             original.import_data(value)
 
+    def build_importer(self):
+        if type(self).__set__ is not ModelField.__set__:
+            return self.__set__
+
+        if self._model_setter:
+            setter = self._model_setter
+
+            def custom_importer(obj, value):
+                setter(self, obj, value)
+
+            return custom_importer
+
+        set_new_value = super(ModelField, self).build_importer()
+        get_value = self.get_value
+        update_model = self._update_model
+
+        if self.lazy:
+            base_set_new_value = set_new_value
+            set_lazy_value = self._set_lazy_value
+
+            def set_new_value(obj, value):
+                if not set_lazy_value(obj, value):
+                    base_set_new_value(obj, value)
+
+        def importer(obj, value):
+            original = get_value(obj)
+            if original is None:
+                set_new_value(obj, value)
+            else:
+                update_model(original, value)
+
+        return importer
+
 
 class InnerFieldTypeMixin:
 
@@ -767,12 +1461,31 @@ class ArrayField(InnerFieldTypeMixin, BaseField):
     * :class:`set`.
 
     * :class:`tuple`.
+
+    **Lazy mode:**
+
+    When ``lazy`` is ``True``, items which field type could use are stored as they are and they are converted
+    on first access. See :class:`~dirty_models.model_types.ListModel`.
     """
 
-    def __init__(self, autolist=False, **kwargs):
+    def __init__(self, autolist=False, lazy=False, **kwargs):
+        """
+
+        :param autolist: Whether a single item must be converted to a list with one item.
+        :type autolist: bool
+        :param lazy: Whether items must be converted on first access.
+        :type lazy: bool
+        """
         self._autolist = autolist
+        self.lazy = lazy
         super(ArrayField, self).__init__(**kwargs)
 
+    def export_definition(self):
+        result = super(ArrayField, self).export_definition()
+        if self.lazy:
+            result['lazy'] = self.lazy
+        return result
+
     def get_field_docstring(self):
         if self.field_type:
             return 'Array of {0}'.format(self.field_type.get_field_docstring())
@@ -781,18 +1494,21 @@ class ArrayField(InnerFieldTypeMixin, BaseField):
         """
         Helper to convert a single item
         """
-        if not self.field_type.check_value(element) and self._field_type.can_use_value(element):
-            return self.field_type.convert_value(element)
-        return element
+        element_converted = self._field_type.get_converter(type(element))(element)
+        if element_converted is UNUSABLE:
+            return element
+        return element_converted
 
     def convert_value(self, value):
         if isinstance(value, (set, list, tuple, ListModel)):
+            if self.lazy:
+                return ListModel(value, field_type=self.field_type, lazy=True)
             return ListModel([self._convert_element(element) for element in value], field_type=self.field_type)
         elif self.autolist:
             return ListModel([self._convert_element(value)], field_type=self.field_type)
 
     def convert_value_creating(self, value):
-        lst = ListModel(field_type=self.field_type)
+        lst = ListModel(field_type=self.field_type, lazy=self.lazy)
 
         with Creating(lst):
             lst.extend(value)
@@ -804,6 +1520,15 @@ class ArrayField(InnerFieldTypeMixin, BaseField):
             return False
         return True
 
+    def adopt_value(self, value):
+        if self.check_value(value):
+            return value
+        return LazyValue(value, self.build_trusted_value)
+
+    def build_trusted_value(self, value):
+        """Builds list using trusted data"""
+        return ListModel.from_trusted(value, field_type=self.field_type)
+
     def can_use_value(self, value):
         if isinstance(value, (set, list, tuple, ListModel)):
             if len(value) == 0:
@@ -817,6 +1542,17 @@ class ArrayField(InnerFieldTypeMixin, BaseField):
         else:
             return False
 
+    def check_value_type(self, value_type):
+        if type(self).check_value is ArrayField.check_value and not issubclass(value_type, ListModel):
+            return False
+        return super(ArrayField, self).check_value_type(value_type)
+
+    def can_use_value_type(self, value_type):
+        if type(self).can_use_value is ArrayField.can_use_value and not self.autolist \
+                and not issubclass(value_type, (set, list, tuple, ListModel)):
+            return False
+        return super(ArrayField, self).can_use_value_type(value_type)
+
     @property
     def autolist(self):
         """
@@ -855,6 +1591,9 @@ class HashMapField(InnerFieldTypeMixin, ModelField):
     def convert_value(self, value):
         return self._model_class(data=value, field_type=self.field_type)
 
+    def build_trusted_value(self, value):
+        return self._model_class.from_trusted(value, field_type=self.field_type)
+
 
 class BlobField(BaseField):
     """
@@ -878,8 +1617,14 @@ class MultiTypeField(BaseField):
             if isinstance(field_type, tuple):
                 field_type = field_type[0](**field_type[1])
             self._field_types.append(field_type if field_type else BaseField())
+        self._dispatch_table = {}
         super(MultiTypeField, self).__init__(**kwargs)
 
+    def __getstate__(self):
+        state = super(MultiTypeField, self).__getstate__()
+        state['_dispatch_table'] = {}
+        return state
+
     def get_field_docstring(self):
         if len(self._field_types):
             return 'Multiple type values are allowed:\n\n{0}'.format(
@@ -901,7 +1646,46 @@ class MultiTypeField(BaseField):
             if ft.can_use_value(value):
                 return ft.convert_value_creating(value)
 
+    def build_converter(self, value_type):
+        if self.overrides_conversion(MultiTypeField):
+            return super(MultiTypeField, self).build_converter(value_type)
+
+        dispatch = self._get_dispatch(value_type)
+        if dispatch is not None:
+            ft, checked = dispatch
+            if ft is None:
+                return lambda value, creating=False: UNUSABLE
+            elif checked:
+                return accept_value
+            elif type(ft).use_value is BaseField.use_value:
+                return ft.get_converter(value_type)
+
+            convert_value = ft.convert_value
+            convert_value_creating = ft.convert_value_creating
+            return lambda value, creating=False: convert_value_creating(value) if creating else convert_value(value)
+
+        field_types = self._field_types
+
+        def converter(value, creating=False):
+            for ft in field_types:
+                if ft.check_value(value):
+                    return value
+            for ft in field_types:
+                if ft.can_use_value(value):
+                    return ft.convert_value_creating(value) if creating else ft.convert_value(value)
+            return UNUSABLE
+
+        return converter
+
     def check_value(self, value):
+        try:
+            dispatch = self._dispatch_table[type(value)]
+        except KeyError:
+            dispatch = self._get_dispatch(type(value))
+
+        if dispatch is not None:
+            return dispatch[1]
+
         for ft in self._field_types:
             if ft.check_value(value):
                 return True
@@ -913,7 +1697,23 @@ class MultiTypeField(BaseField):
                 return True
         return False
 
+    def adopt_value(self, value):
+        try:
+            return self.get_field_type_by_value(value).adopt_value(value)
+        except TypeError:
+            return value
+
     def get_field_type_by_value(self, value):
+        try:
+            dispatch = self._dispatch_table[type(value)]
+        except KeyError:
+            dispatch = self._get_dispatch(type(value))
+
+        if dispatch is not None:
+            if dispatch[0] is None:
+                raise TypeError("Value `{0}` can not be used on field `{1}`".format(value, self.name))
+            return dispatch[0]
+
         for ft in self._field_types:
             if ft.check_value(value):
                 return ft
@@ -923,6 +1723,45 @@ class MultiTypeField(BaseField):
 
         raise TypeError("Value `{0}` can not be used on field `{1}`".format(value, self.name))
 
+    def _get_dispatch(self, value_type):
+        try:
+            return self._dispatch_table[value_type]
+        except KeyError:
+            pass
+
+        dispatch = self._build_dispatch(value_type)
+        if len(self._dispatch_table) < self.converters_size:
+            self._dispatch_table[value_type] = dispatch
+        return dispatch
+
+    def _build_dispatch(self, value_type):
+        for ft in self._field_types:
+            checked = ft.check_value_type(value_type)
+            if checked is None:
+                return None
+            elif checked:
+                return ft, True
+
+        for ft in self._field_types:
+            usable = ft.can_use_value_type(value_type)
+            if usable is None:
+                return None
+            elif usable:
+                return ft, False
+
+        return None, False
+
+    def get_dispatch_table(self):
+        """
+        Returns inner field types chosen by value type, for types already seen whose choice does not
+        depend on value. Those types are mapped to ``None`` when their values could not be used.
+        Choices are shared by conversion, validation and formatting.
+
+        :rtype: dict
+        """
+        return {value_type: dispatch[0] for value_type, dispatch in self._dispatch_table.items()
+                if dispatch is not None}
+
     @property
     def field_types(self):
         return self._field_types.copy()
@@ -937,20 +1776,75 @@ class EnumField(BaseField):
     * Any value of enumeration.
 
     * Any member name of enumeration.
+
+    * Any member name or string value of enumeration in any case, if ``case_insensitive`` is set.
     """
 
-    def __init__(self, enum_class, *args, **kwargs):
+    def __init__(self, enum_class, *args, case_insensitive=False, **kwargs):
         """
 
         :param enum_class: Enumeration class
         :type enum_class: enum.Enum
+        :param case_insensitive: Whether member names and string values are matched in any case.
+        :type case_insensitive: bool
         """
+        self._case_insensitive = case_insensitive
         self.enum_class = enum_class
         super(EnumField, self).__init__(*args, **kwargs)
 
+    @property
+    def enum_class(self):
+        """Enum_class getter: enumeration class used on field"""
+        return self._enum_class
+
+    @enum_class.setter
+    def enum_class(self, enum_class):
+        """Enum_class setter: enumeration class used on field. It builds member lookup tables."""
+        self._enum_class = enum_class
+        self._build_lookups()
+
+    @property
+    def case_insensitive(self):
+        """Case_insensitive getter: whether member names and string values are matched in any case"""
+        return self._case_insensitive
+
+    @case_insensitive.setter
+    def case_insensitive(self, value):
+        """Case_insensitive setter: whether member names and string values are matched in any case"""
+        self._case_insensitive = value
+        self._build_lookups()
+
+    def _build_lookups(self):
+        self._value_members = {}
+        self._name_members = {}
+        self._folded_members = None
+        self._uses_missing = False
+
+        if self._enum_class is None:
+            return
+
+        missing = getattr(getattr(self._enum_class, '_missing_', None), '__func__', None)
+        self._uses_missing = missing is not Enum._missing_.__func__
+        for member in self._enum_class:
+            try:
+                self._value_members.setdefault(member.value, member)
+            except TypeError:
+                self._uses_missing = True
+        self._name_members = dict(self._enum_class.__members__)
+
+        if self._case_insensitive:
+            self._folded_members = {}
+            for value, member in self._value_members.items():
+                if isinstance(value, str):
+                    self._folded_members.setdefault(value.casefold(), member)
+            for name, member in self._name_members.items():
+                self._folded_members.setdefault(name.casefold(), member)
+
     def export_definition(self):
         result = super(EnumField, self).export_definition()
         result['enum_class'] = self.enum_class
+        if self.case_insensitive:
+            result['case_insensitive'] = self.case_insensitive
 
         return result
 
@@ -961,26 +1855,72 @@ class EnumField(BaseField):
             dcstr += ' (:class:`{0}`)'.format('.'.join([self.enum_class.__module__, self.enum_class.__name__]))
         return dcstr
 
-    def convert_value(self, value):
+    def get_member(self, value):
+        """
+        Returns member of enumeration which is value, or whose value or name is value.
+        Lookup tables are used, so no exception is raised on misses.
+
+        :param value: Member, value or name of member.
+        :return: Member or ``None`` if value could not be used.
+        """
+        if isinstance(value, self._enum_class):
+            return value
+
         try:
-            return self.enum_class(value)
-        except ValueError:
+            return self._value_members[value]
+        except KeyError:
+            pass
+        except TypeError:
+            try:
+                return self._enum_class(value)
+            except (ValueError, TypeError):
+                return None
+
+        if self._uses_missing:
+            try:
+                return self._enum_class(value)
+            except ValueError:
+                pass
+
+        try:
+            return self._name_members[value]
+        except KeyError:
+            pass
+
+        if self._folded_members is not None and isinstance(value, str):
+            return self._folded_members.get(value.casefold())
+        return None
+
+    def convert_value(self, value):
+        member = self.get_member(value)
+        if member is None:
             return getattr(self.enum_class, value)
+        return member
 
     def check_value(self, value):
         return isinstance(value, self.enum_class)
 
-    def can_use_value(self, value):
-        try:
-            self.enum_class(value)
-            return True
-        except ValueError:
-            pass
+    def check_value_type(self, value_type):
+        if type(self).check_value is EnumField.check_value:
+            return issubclass(value_type, self.enum_class)
+        return super(EnumField, self).check_value_type(value_type)
 
-        try:
-            return value in self.enum_class.__members__.keys()
-        except Exception:
-            return False
+    def build_converter(self, value_type):
+        if self.overrides_conversion(EnumField):
+            return super(EnumField, self).build_converter(value_type)
+
+        get_member = self.get_member
+
+        def converter(value, creating=False):
+            member = get_member(value)
+            if member is None:
+                return UNUSABLE
+            return member
+
+        return converter
+
+    def can_use_value(self, value):
+        return self.get_member(value) is not None
 
 
 class BytesField(BaseField):
@@ -1020,6 +1960,26 @@ class BytesField(BaseField):
     def check_value(self, value):
         return isinstance(value, bytes)
 
+    def build_converter(self, value_type):
+        if self.overrides_conversion(BytesField):
+            pass
+        elif value_type is bytes:
+            return accept_value
+        elif value_type is str:
+            return lambda value, creating=False: value.encode()
+
+        return super(BytesField, self).build_converter(value_type)
+
     @can_use_enum
     def can_use_value(self, value):
         return isinstance(value, (int, str, list, ListModel, bytearray))
+
+    def check_value_type(self, value_type):
+        if type(self).check_value is BytesField.check_value:
+            return issubclass(value_type, bytes)
+        return super(BytesField, self).check_value_type(value_type)
+
+    def can_use_value_type(self, value_type):
+        if type(self).can_use_value is BytesField.can_use_value and not issubclass(value_type, Enum):
+            return issubclass(value_type, (int, str, list, ListModel, bytearray))
+        return super(BytesField, self).can_use_value_type(value_type)
@@ -0,0 +1,282 @@
+"""
+Change journal for dirty models.
+
+A journal is started on a root model using :meth:`~dirty_models.models.BaseModel.start_journal`. Every
+write on root model or on any inner model or list is recorded as an entry. Entries for the same field
+(or the same list) are coalesced, so journal size depends on how many fields were changed, not on how
+many times they were changed.
+
+Modification exports of root model (:meth:`~dirty_models.models.BaseModel.export_modifications`,
+:meth:`~dirty_models.models.BaseModel.export_modified_data` and
+:meth:`~dirty_models.models.BaseModel.export_deleted_fields`) look up only recorded places, instead of
+walking the whole tree.
+"""
+
+from .base import BaseData, LazyValue
+from .model_types import ListModel
+
+__all__ = ['ChangeJournal']
+
+
+def _unwrap(value):
+    """
+    Returns real value of a built placeholder, ``None`` for a placeholder which is not built yet
+    (nothing could be written inside it) or value itself.
+    """
+    if isinstance(value, LazyValue):
+        return value.value if value.is_built() else None
+    return value
+
+
+def _get_child(node, key):
+    """
+    Returns real value of a model field or a list item, or ``None``. Modified data goes first.
+    """
+    for data in (node.__modified_data__, node.__original_data__):
+        try:
+            value = data[key]
+        except (KeyError, IndexError, TypeError):
+            continue
+        if value is not None:
+            return _unwrap(value)
+    return None
+
+
+def _get_original_child(node, key):
+    """
+    Returns real value of a model field or a list item on original data, or ``None``.
+    """
+    try:
+        return _unwrap(node.__original_data__[key])
+    except (KeyError, IndexError, TypeError):
+        return None
+
+
+def _export(value, method):
+    try:
+        return getattr(value, method)()
+    except AttributeError:
+        return value
+
+
+class ChangeJournal:
+    """
+    Append-only journal of changes made on a model tree. Each entry is a tuple ``(path, op, value)``, where
+    ``path`` is dotted path of changed field (or changed list), ``op`` is name of operation and ``value`` is
+    value written, if any.
+
+    Journal could only answer modification exports if model was not modified when journal was started. Otherwise,
+    root model uses its regular exports until it is flattened or its modified data is cleared.
+    """
+
+    def __init__(self, root):
+        """
+        :param root: Root model.
+        :type root: dirty_models.models.BaseModel
+        """
+        self.root = root
+        self.complete = not root.is_modified()
+        self._entries = {}
+        self._keys = {}
+
+    def record(self, node, key, op, value=None):
+        """
+        Records an operation. It replaces any previous entry for the same node and key.
+
+        :param node: Model or list where operation was done.
+        :param key: Field name, or ``None`` for operations on whole model or list.
+        :param op: Operation name.
+        :param value: Value written.
+        """
+        entry_key = (id(node), key)
+        self._entries.pop(entry_key, None)
+        self._entries[entry_key] = (node, key, op, value)
+
+    def reset(self):
+        """
+        Removes all entries. It must be used when root model has no modifications at all.
+        """
+        self._entries = {}
+        self._keys = {}
+        self.complete = True
+
+    def get_checkpoint(self):
+        """
+        Returns current entries and completeness of journal, to be restored using :meth:`restore`.
+        """
+        return self._entries, self.complete
+
+    def restore(self, checkpoint):
+        """
+        Restores entries and completeness of journal from a checkpoint. Entries recorded after checkpoint
+        are kept, so journal still knows about any place which was changed meanwhile.
+
+        :param checkpoint: Result of :meth:`get_checkpoint`.
+        """
+        entries, self.complete = checkpoint
+        if entries is not self._entries:
+            entries.update(self._entries)
+            self._entries = entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def entries(self):
+        """
+        Returns a list of entries ``(path, op, value)`` in same order as they were recorded. Entries for models
+        and lists which are not in model tree anymore are omitted.
+
+        :return: list
+        """
+        result = []
+        for node, key, op, value in self._entries.values():
+            path = self._get_path(node)
+            if path is None:
+                continue
+            if key is not None:
+                path += (key,)
+            result.append(('.'.join(str(k) for k in path), op, value))
+        return result
+
+    def _get_key(self, parent, child):
+        """
+        Returns key of child in parent or ``None``. Keys are cached and verified before using them.
+        """
+        try:
+            key = self._keys[id(child)]
+        except KeyError:
+            pass
+        else:
+            if _get_child(parent, key) is child or _get_original_child(parent, key) is child:
+                return key
+
+        for data in (parent.__modified_data__, parent.__original_data__):
+            try:
+                items = data.items()
+            except AttributeError:
+                items = enumerate(data or [])
+
+            for key, value in items:
+                if _unwrap(value) is child:
+                    self._keys[id(child)] = key
+                    return key
+        return None
+
+    def _get_path(self, node):
+        """
+        Returns a tuple with keys from root model to node, or ``None`` if node is not in model tree.
+        """
+        path = []
+        while node is not self.root:
+            parent = node.get_parent()
+            if parent is None:
+                return None
+            key = self._get_key(parent, node)
+            if key is None:
+                return None
+            path.append(key)
+            node = parent
+
+        path.reverse()
+        return tuple(path)
+
+    def _iter_paths(self):
+        """
+        Iterates over paths to look up. Clearing a model expands to all its deleted fields.
+        """
+        for node, key, op, value in self._entries.values():
+            path = self._get_path(node)
+            if path is None:
+                continue
+            if key is not None:
+                yield path + (key,)
+            elif op == 'clear' and not isinstance(node, ListModel):
+                for name in node.__deleted_fields__:
+                    yield path + (name,)
+            else:
+                yield path
+
+    def export_modifications(self):
+        """
+        Returns same result as :meth:`~dirty_models.models.BaseModel.export_modifications` of root model.
+        """
+        result = {}
+        for path in self._iter_paths():
+            node = self.root
+            prefix = []
+            for key in path:
+                if isinstance(node, ListModel):
+                    if node.__modified_data__ is not None:
+                        break
+                elif key in node.__deleted_fields__:
+                    node = None
+                    break
+                elif node.__modified_data__.get(key) is not None:
+                    result['.'.join(prefix + [str(key)])] = _export(node.__modified_data__[key], 'export_data')
+                    node = None
+                    break
+
+                node = _get_original_child(node, key)
+                if not isinstance(node, BaseData):
+                    break
+                prefix.append(str(key))
+
+            if isinstance(node, ListModel) and node.__modified_data__ is not None:
+                result['.'.join(prefix)] = node.export_data()
+
+        return result
+
+    def export_deleted_fields(self):
+        """
+        Returns same items as :meth:`~dirty_models.models.BaseModel.export_deleted_fields` of root model.
+        """
+        result = []
+        for path in self._iter_paths():
+            node = self.root
+            prefix = []
+            for key in path:
+                if isinstance(node, ListModel):
+                    if node.__modified_data__ is not None:
+                        break
+                elif key in node.__deleted_fields__:
+                    name = '.'.join(prefix + [str(key)])
+                    if name not in result:
+                        result.append(name)
+                    break
+
+                node = _get_original_child(node, key)
+                if not isinstance(node, BaseData):
+                    break
+                prefix.append(str(key))
+
+        return result
+
+    def export_modified_data(self):
+        """
+        Returns same result as :meth:`~dirty_models.models.BaseModel.export_modified_data` of root model.
+        Lists are exported as a whole.
+        """
+        result = {}
+        for path in self._iter_paths():
+            node = self.root
+            container = result
+            for key in path:
+                if key in node.__deleted_fields__:
+                    container[key] = None
+                    break
+                elif node.__modified_data__.get(key) is not None:
+                    container[key] = _export(node.__modified_data__[key], 'export_modified_data')
+                    break
+
+                node = _get_original_child(node, key)
+                if not isinstance(node, BaseData) or not node.is_modified():
+                    break
+                elif isinstance(node, ListModel):
+                    container[key] = node.export_modified_data()
+                    break
+
+                if not isinstance(container.get(key), dict):
+                    container[key] = {}
+                container = container[key]
+
+        return result
@@ -0,0 +1,273 @@
+"""
+JSON backends for dirty models.
+
+Models are encoded in two steps. First, a formatter iterator formats fields (dates, enumerations,
+timedeltas...) and skips hidden ones, building plain dictionaries and lists. It is made once and it is
+memoized on models and lists until they are written. Then, a backend encodes plain data. So, faster JSON
+libraries could be used with no formatting code on them.
+
+Standard library backend is always available. Backends for ``orjson`` and ``ujson`` are available when
+those libraries are installed, and fastest available backend is used by default.
+"""
+
+import json
+
+from .model_types import ListModel
+from .models import BaseModel
+from .utils import BaseFormatterIter, ListFormatterIter, ModelFormatterIter
+
+__all__ = ['BaseJSONBackend',
+           'StdlibJSONBackend',
+           'OrjsonBackend',
+           'UJSONBackend',
+           'register_backend',
+           'get_backend',
+           'set_default_backend',
+           'prepare',
+           'dumps',
+           'loads']
+
+
+class BaseJSONBackend:
+    """
+    Base JSON backend. Backends only encode and decode plain data: dictionaries, lists, strings, numbers,
+    booleans and ``None``.
+    """
+
+    name = None
+
+    @classmethod
+    def is_available(cls):
+        """
+        Returns whether backend library is installed.
+        """
+        return True
+
+    def dumps(self, data):  # pragma: no cover
+        """
+        Encodes plain data as a JSON document.
+
+        :param data: Plain data.
+        :return: JSON document.
+        :rtype: str
+        """
+        raise NotImplementedError()
+
+    def loads(self, document):  # pragma: no cover
+        """
+        Decodes a JSON document.
+
+        :param document: JSON document.
+        :type document: str or bytes
+        :return: Plain data.
+        """
+        raise NotImplementedError()
+
+
+class StdlibJSONBackend(BaseJSONBackend):
+    """
+    Backend using standard library :mod:`json` module. Any keyword argument is passed to
+    :func:`json.dumps`, so output is same as :class:`~dirty_models.utils.JSONEncoder` by default.
+    """
+
+    name = 'stdlib'
+
+    def __init__(self, **kwargs):
+        self.encoder = json.JSONEncoder(**kwargs)
+
+    def dumps(self, data):
+        return self.encoder.encode(data)
+
+    def loads(self, document):
+        return json.loads(document)
+
+
+class OrjsonBackend(BaseJSONBackend):
+    """
+    Backend using ``orjson`` library. Output is compact and non-ASCII characters are not escaped.
+    ``NaN`` and infinite floats are encoded as ``null``.
+    """
+
+    name = 'orjson'
+
+    def __init__(self):
+        import orjson
+        self.orjson = orjson
+        self.option = orjson.OPT_NON_STR_KEYS
+
+    @classmethod
+    def is_available(cls):
+        try:
+            import orjson  # noqa
+        except ImportError:
+            return False
+        return True
+
+    def dumps(self, data):
+        return self.orjson.dumps(data, option=self.option).decode('utf-8')
+
+    def loads(self, document):
+        return self.orjson.loads(document)
+
+
+class UJSONBackend(BaseJSONBackend):
+    """
+    Backend using ``ujson`` library. Output is compact.
+    """
+
+    name = 'ujson'
+
+    def __init__(self):
+        import ujson
+        self.ujson = ujson
+
+    @classmethod
+    def is_available(cls):
+        try:
+            import ujson  # noqa
+        except ImportError:
+            return False
+        return True
+
+    def dumps(self, data):
+        return self.ujson.dumps(data)
+
+    def loads(self, document):
+        return self.ujson.loads(document)
+
+
+_backend_classes = {}
+_backend_preference = []
+_backends = {}
+_default_backend = None
+
+
+def register_backend(backend_class, preferred=False):
+    """
+    Registers a backend class by its name.
+
+    :param backend_class: Backend class.
+    :type backend_class: type
+    :param preferred: Whether backend must be preferred over already registered ones as default backend.
+    :type preferred: bool
+    """
+    global _default_backend
+
+    _backend_classes[backend_class.name] = backend_class
+    if backend_class.name in _backend_preference:
+        _backend_preference.remove(backend_class.name)
+    _backend_preference.insert(0 if preferred else len(_backend_preference), backend_class.name)
+    _backends.pop(backend_class.name, None)
+    _default_backend = None
+
+
+register_backend(OrjsonBackend)
+register_backend(UJSONBackend)
+register_backend(StdlibJSONBackend)
+
+
+def get_backend(name=None):
+    """
+    Returns a backend instance. Backends are instantiated once.
+
+    :param name: Backend name. Default backend is returned when it is ``None``.
+    :type name: str
+    :return: Backend.
+    :rtype: BaseJSONBackend
+    """
+    global _default_backend
+
+    if name is None:
+        if _default_backend is None:
+            _default_backend = get_backend(next(n for n in _backend_preference
+                                                if _backend_classes[n].is_available()))
+        return _default_backend
+
+    try:
+        return _backends[name]
+    except KeyError:
+        pass
+
+    try:
+        backend_class = _backend_classes[name]
+    except KeyError:
+        raise ValueError("Unknown JSON backend '{0}'".format(name))
+
+    if not backend_class.is_available():
+        raise ImportError("JSON backend '{0}' is not installed".format(name))
+
+    backend = _backends[name] = backend_class()
+    return backend
+
+
+def set_default_backend(backend=None):
+    """
+    Sets default backend. Fastest available backend is used when it is ``None``.
+
+    :param backend: Backend name or instance.
+    :type backend: str or BaseJSONBackend
+    """
+    global _default_backend
+
+    if isinstance(backend, str):
+        backend = get_backend(backend)
+    _default_backend = backend
+
+
+def prepare(obj, formatter_class=ModelFormatterIter):
+    """
+    Formats models and lists as plain data. Formatted data of models and lists is memoized, so it must
+    not be modified.
+
+    :param obj: Model, list model, formatter iterator or plain data which could contain them.
+    :param formatter_class: Formatter iterator class used for models.
+    :return: Plain data.
+    """
+    if isinstance(obj, BaseModel):
+        return formatter_class(obj)._format()
+    elif isinstance(obj, ListModel):
+        return ListFormatterIter(obj=obj, field=obj.get_field_type(),
+                                 parent_formatter=formatter_class(None))._format()
+    elif isinstance(obj, BaseFormatterIter):
+        return obj._format()
+    elif isinstance(obj, dict):
+        return {k: prepare(v, formatter_class) for k, v in obj.items()}
+    elif isinstance(obj, (list, tuple)):
+        return [prepare(v, formatter_class) for v in obj]
+    return obj
+
+
+def dumps(obj, backend=None, formatter_class=ModelFormatterIter):
+    """
+    Encodes a model, a list model or plain data which could contain them as a JSON document.
+
+    :param obj: Object to encode.
+    :param backend: Backend name or instance. Default backend is used when it is ``None``.
+    :type backend: str or BaseJSONBackend
+    :param formatter_class: Formatter iterator class used for models.
+    :return: JSON document.
+    :rtype: str
+    """
+    if not isinstance(backend, BaseJSONBackend):
+        backend = get_backend(backend)
+    return backend.dumps(prepare(obj, formatter_class))
+
+
+def loads(document, model_class=None, backend=None, **kwargs):
+    """
+    Decodes a JSON document. When a model class is given, a model is built from decoded data.
+
+    :param document: JSON document.
+    :type document: str or bytes
+    :param model_class: Model class.
+    :type model_class: type
+    :param backend: Backend name or instance. Default backend is used when it is ``None``.
+    :type backend: str or BaseJSONBackend
+    :return: Model or plain data.
+    """
+    if not isinstance(backend, BaseJSONBackend):
+        backend = get_backend(backend)
+    data = backend.loads(document)
+    if model_class is None:
+        return data
+    return model_class(data=data, **kwargs)
@@ -0,0 +1,569 @@
+"""
+Streaming JSON helpers for dirty models.
+"""
+
+import codecs
+import io
+import re
+from json import JSONDecodeError
+from json.decoder import scanstring
+from json.encoder import encode_basestring, encode_basestring_ascii
+from json.scanner import NUMBER_RE
+
+from .base import Unlocker
+from .fields import ArrayField, HashMapField, ModelField
+from .model_types import ListModel
+from .models import BaseModel
+from .utils import BaseFormatterIter, BaseModelFormatterIter, ListFormatterIter, ModelFormatterIter
+
+__all__ = ['iter_json_events', 'load_model', 'iter_list_items', 'JSONWriter', 'iterencode', 'dump']
+
+WHITESPACE = ' \t\n\r'
+
+NUMBER_CHARS_RE = re.compile(r'[-+.eE0-9]*')
+
+STRING_SPECIAL_RE = re.compile(r'["\\\x00-\x1f]')
+
+ESCAPE_CHARS = frozenset('"\\/bfnrt')
+
+HEX_DIGITS = frozenset('0123456789abcdefABCDEF')
+
+LITERALS = {'true': True, 'false': False, 'null': None}
+
+START_MAP = 'start_map'
+END_MAP = 'end_map'
+MAP_KEY = 'map_key'
+START_ARRAY = 'start_array'
+END_ARRAY = 'end_array'
+VALUE = 'value'
+
+
+class JSONTokenizer:
+    """
+    Incremental JSON tokenizer. It reads a file object by chunks and it yields parser events
+    as tuples ``(event, value)``.
+
+    Events are ``start_map``, ``map_key``, ``end_map``, ``start_array``, ``end_array`` and ``value``.
+    """
+
+    def __init__(self, fp, chunk_size=65536):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.decoder = None
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+
+    def _read(self):
+        """
+        Reads a new chunk and appends it to buffer. Returns whether something was read.
+        """
+        if self.eof:
+            return False
+
+        chunk = self.fp.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            if self.decoder is not None:
+                self.decoder.decode(b'', final=True)
+            return False
+
+        if isinstance(chunk, bytes):
+            if self.decoder is None:
+                self.decoder = codecs.getincrementaldecoder('utf-8')()
+            chunk = self.decoder.decode(chunk)
+
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def _next_char(self):
+        """
+        Returns next non whitespace character without consuming it, or ``None`` at the end of file.
+        """
+        while True:
+            buffer = self.buffer
+            pos = self.pos
+            length = len(buffer)
+            while pos < length and buffer[pos] in WHITESPACE:
+                pos += 1
+            self.pos = pos
+            if pos < length:
+                return buffer[pos]
+            if not self._read():
+                return None
+
+    def _error(self, msg):
+        return JSONDecodeError(msg, self.buffer, self.pos)
+
+    def _read_string(self):
+        """
+        Reads string which starts at current position. Its end is looked for while chunks are read, checking
+        escapes and control characters once, so malformed strings fail without reading the rest of file.
+        """
+        search = self.pos + 1
+        while True:
+            buffer = self.buffer
+            match = STRING_SPECIAL_RE.search(buffer, search)
+            if match is None:
+                search = len(buffer)
+            elif match.group() != '\\':
+                # End of string or a control character, which is reported by scanstring
+                break
+            else:
+                index = match.start()
+                esc = buffer[index + 1:index + 2]
+                size = 6 if esc == 'u' else 2
+                if index + size > len(buffer):
+                    # Escape is not complete yet
+                    search = index
+                elif esc in ESCAPE_CHARS or (esc == 'u' and HEX_DIGITS.issuperset(buffer[index + 2:index + 6])):
+                    search = index + size
+                    continue
+                else:
+                    break
+
+            offset = search - self.pos
+            if not self._read():
+                break
+            search = self.pos + offset
+
+        value, end = scanstring(self.buffer, self.pos + 1)
+        self.pos = end
+        return value
+
+    def _read_number(self):
+        while True:
+            match = NUMBER_CHARS_RE.match(self.buffer, self.pos)
+            if match.end() < len(self.buffer) or not self._read():
+                break
+
+        match = NUMBER_RE.match(self.buffer, self.pos)
+        if match is None:
+            raise self._error('Expecting value')
+
+        integer, frac, exp = match.groups()
+        self.pos = match.end()
+        if frac or exp:
+            return float(integer + (frac or '') + (exp or ''))
+        return int(integer)
+
+    def _read_literal(self):
+        for literal, value in LITERALS.items():
+            while len(self.buffer) - self.pos < len(literal) and self._read():
+                pass
+            if self.buffer.startswith(literal, self.pos):
+                self.pos += len(literal)
+                return value
+        raise self._error('Expecting value')
+
+    def _read_scalar(self, char):
+        if char == '"':
+            return self._read_string()
+        elif char in '-0123456789':
+            return self._read_number()
+        return self._read_literal()
+
+    def __iter__(self):
+        stack = []
+        expect_value = True
+
+        while True:
+            char = self._next_char()
+            if char is None:
+                if stack or expect_value:
+                    raise self._error('Unexpected end of document')
+                return
+
+            if not stack and not expect_value:
+                raise self._error('Extra data')
+
+            if char == '{':
+                self.pos += 1
+                stack.append(END_MAP)
+                yield START_MAP, None
+                char = self._next_char()
+                if char == '}':
+                    self.pos += 1
+                    stack.pop()
+                    expect_value = False
+                    yield END_MAP, None
+                    continue
+                yield self._read_key()
+                expect_value = True
+            elif char == '[':
+                self.pos += 1
+                stack.append(END_ARRAY)
+                yield START_ARRAY, None
+                if self._next_char() == ']':
+                    self.pos += 1
+                    stack.pop()
+                    expect_value = False
+                    yield END_ARRAY, None
+                    continue
+                expect_value = True
+            elif char in '}]':
+                if not stack or expect_value or (char == '}') != (stack[-1] == END_MAP):
+                    raise self._error('Unexpected character')
+                self.pos += 1
+                expect_value = False
+                yield stack.pop(), None
+            elif char == ',':
+                if not stack or expect_value:
+                    raise self._error('Unexpected character')
+                self.pos += 1
+                if stack[-1] == END_MAP:
+                    yield self._read_key()
+                expect_value = True
+            elif expect_value:
+                value = self._read_scalar(char)
+                expect_value = False
+                yield VALUE, value
+            else:
+                raise self._error('Unexpected character')
+
+    def _read_key(self):
+        if self._next_char() != '"':
+            raise self._error('Expecting property name enclosed in double quotes')
+        key = self._read_string()
+        if self._next_char() != ':':
+            raise self._error("Expecting ':' delimiter")
+        self.pos += 1
+        return MAP_KEY, key
+
+
+def iter_json_events(fp, chunk_size=65536):
+    """
+    Iterates over JSON parser events reading file object by chunks.
+
+    :param fp: File object opened in text or binary mode (UTF-8).
+    :param chunk_size: Size of chunks to read.
+    :type chunk_size: int
+    :return: Iterator of tuples ``(event, value)``.
+    """
+    return iter(JSONTokenizer(fp, chunk_size=chunk_size))
+
+
+def build_value(events, event, value):
+    """
+    Builds a plain python value from events. First event must be already consumed.
+    """
+    if event == VALUE:
+        return value
+    elif event == START_MAP:
+        result = {}
+        for event, key in events:
+            if event == END_MAP:
+                return result
+            result[key] = build_value(events, *next(events))
+    elif event == START_ARRAY:
+        result = []
+        for event, value in events:
+            if event == END_ARRAY:
+                return result
+            result.append(build_value(events, event, value))
+
+    raise ValueError('Unexpected event: {0}'.format(event))
+
+
+def skip_value(events, event):
+    """
+    Consumes events of a value without building it. First event must be already consumed.
+    """
+    depth = 0 if event == VALUE else 1
+    while depth:
+        event, _ = next(events)
+        if event in (START_MAP, START_ARRAY):
+            depth += 1
+        elif event in (END_MAP, END_ARRAY):
+            depth -= 1
+
+
+def _new_model(field):
+    if isinstance(field, HashMapField):
+        return field.model_class(field_type=field.field_type)
+    return field.model_class()
+
+
+def fill_model(events, model):
+    """
+    Sets fields to model from events of a JSON object. Event ``start_map`` must be already consumed.
+    Inner objects and arrays are built as models and lists as soon as they are read, using
+    field types.
+    """
+    is_dynamic = hasattr(model, '_define_new_field_by_value')
+    with Unlocker(model):
+        for event, key in events:
+            if event == END_MAP:
+                return model
+
+            event, value = next(events)
+            field = model.get_field_obj(key)
+            if field is None and not is_dynamic:
+                model._not_allowed_field(key)
+                skip_value(events, event)
+                continue
+
+            model._import_data({key: build_field_value(events, event, value, field)})
+
+    raise ValueError('Unexpected end of events')
+
+
+def build_field_value(events, event, value, field):
+    """
+    Builds value for a field from events. First event must be already consumed.
+    """
+    if event == START_MAP and isinstance(field, ModelField):
+        return fill_model(events, _new_model(field))
+    elif event == START_ARRAY and isinstance(field, ArrayField):
+        result = []
+        for event, value in events:
+            if event == END_ARRAY:
+                return result
+            result.append(build_field_value(events, event, value, field.field_type))
+    return build_value(events, event, value)
+
+
+def load_model(fp, model_class, flat=False, chunk_size=65536, **kwargs):
+    """
+    Builds a model from a JSON object stored in a file object. Document is read by chunks and
+    fields are set as soon as they are read, so whole document is never loaded as a dictionary.
+
+    :param fp: File object opened in text or binary mode (UTF-8).
+    :param model_class: Model class.
+    :param flat: Whether data must be set as original data.
+    :type flat: bool
+    :param chunk_size: Size of chunks to read.
+    :type chunk_size: int
+    :return: model
+    """
+    events = iter_json_events(fp, chunk_size=chunk_size)
+    event, _ = next(events)
+    if event != START_MAP:
+        raise TypeError('Impossible to import data')
+
+    model = fill_model(events, model_class(**kwargs))
+    for _ in events:
+        pass
+
+    if flat:
+        model.flat_data()
+    return model
+
+
+def iter_list_items(fp, field_type=None, chunk_size=65536):
+    """
+    Iterates over items of a JSON array stored in a file object. Each item is converted using
+    field type and yielded as soon as it is read. Items which could not be used by field type are
+    skipped.
+
+    :param fp: File object opened in text or binary mode (UTF-8).
+    :param field_type: Field type of items.
+    :type field_type: dirty_models.fields.BaseField
+    :param chunk_size: Size of chunks to read.
+    :type chunk_size: int
+    :return: Iterator of items.
+    """
+    events = iter_json_events(fp, chunk_size=chunk_size)
+    event, _ = next(events)
+    if event != START_ARRAY:
+        raise TypeError('Impossible to import data')
+
+    for event, value in events:
+        if event == END_ARRAY:
+            break
+
+        value = build_field_value(events, event, value, field_type)
+        if field_type is None:
+            yield value
+        elif field_type.check_value(value):
+            yield value
+        elif field_type.can_use_value(value):
+            yield field_type.use_value(value)
+
+    for _ in events:
+        pass
+
+
+class JSONWriter:
+    """
+    Encodes models as JSON walking them directly, with no intermediate dictionaries. Fields are formatted
+    by a formatter iterator class, like :class:`~dirty_models.utils.JSONEncoder` does, so hidden fields
+    are skipped and field formats are used. Encoded document is yielded by chunks, so memory used does not
+    depend on document size.
+
+    Formatted data memoized on models and lists is used when it exists, but it is never built.
+    """
+
+    SCALAR_TYPES = frozenset([int, float, bool, type(None)])
+    FLUSH_PARTS = 1024
+
+    def __init__(self, formatter_class=ModelFormatterIter, chunk_size=65536, ensure_ascii=True, allow_nan=True):
+        """
+        :param formatter_class: Formatter iterator class used for models.
+        :type formatter_class: dirty_models.utils.BaseModelFormatterIter
+        :param chunk_size: Approximate size of yielded chunks.
+        :type chunk_size: int
+        :param ensure_ascii: Whether non-ASCII characters must be escaped.
+        :type ensure_ascii: bool
+        :param allow_nan: Whether ``NaN`` and infinite floats are allowed.
+        :type allow_nan: bool
+        """
+        self.formatter_class = formatter_class
+        self.chunk_size = chunk_size
+        self.flush_parts = min(chunk_size, self.FLUSH_PARTS)
+        self.encode_string = encode_basestring_ascii if ensure_ascii else encode_basestring
+        self.allow_nan = allow_nan
+
+    def iterencode(self, obj):
+        """
+        Yields JSON document of an object by chunks.
+
+        :param obj: Model, list model or any JSON serializable value.
+        :return: Iterator of strings.
+        """
+        parts = []
+        buffer = ''
+        for _ in self._write_value(obj, parts):
+            buffer += ''.join(parts)
+            parts.clear()
+            if len(buffer) >= self.chunk_size:
+                yield buffer
+                buffer = ''
+
+        buffer += ''.join(parts)
+        if buffer:
+            yield buffer
+
+    def _encode_float(self, value):
+        if value != value:
+            text = 'NaN'
+        elif value == float('inf'):
+            text = 'Infinity'
+        elif value == float('-inf'):
+            text = '-Infinity'
+        else:
+            return float.__repr__(value)
+
+        if not self.allow_nan:
+            raise ValueError('Out of range float values are not JSON compliant: {0}'.format(value))
+        return text
+
+    def _encode_scalar(self, value):
+        if isinstance(value, str):
+            return self.encode_string(value)
+        elif value is None:
+            return 'null'
+        elif value is True:
+            return 'true'
+        elif value is False:
+            return 'false'
+        elif isinstance(value, int):
+            return int.__repr__(value)
+        elif isinstance(value, float):
+            return self._encode_float(value)
+
+        raise TypeError('Object of type {0} is not JSON serializable'.format(value.__class__.__name__))
+
+    def _encode_key(self, key):
+        if isinstance(key, str):
+            return self.encode_string(key)
+        elif isinstance(key, float):
+            return self.encode_string(self._encode_float(key))
+        elif key is None or isinstance(key, (int, bool)):
+            return self.encode_string(self._encode_scalar(key))
+
+        raise TypeError('Keys must be str, int, float, bool or None, not {0}'.format(key.__class__.__name__))
+
+    def _write_value(self, value, parts):
+        """
+        Appends encoded value to parts. It is a generator which yields whenever parts must be flushed.
+        """
+        if isinstance(value, BaseModel):
+            value = self.formatter_class(value)
+        elif isinstance(value, ListModel):
+            value = ListFormatterIter(obj=value, field=value.get_field_type(),
+                                      parent_formatter=self.formatter_class(None))
+
+        if isinstance(value, BaseModelFormatterIter):
+            key = value._get_memo_key()
+            memoized = value.model._find_memoized(key) if value.model is not None and key is not None else None
+            yield from self._write_items(memoized.items() if memoized is not None else value, parts)
+        elif isinstance(value, ListFormatterIter):
+            memoized = None
+            key = value._get_memo_key()
+            if isinstance(value.obj, ListModel) and key is not None:
+                memoized = value.obj._find_memoized(key)
+            yield from self._write_list(memoized if memoized is not None else value, parts)
+        elif isinstance(value, BaseFormatterIter):
+            yield from self._write_value(value._format(), parts)
+        elif isinstance(value, dict):
+            yield from self._write_items(value.items(), parts)
+        elif isinstance(value, (list, tuple)):
+            yield from self._write_list(value, parts)
+        else:
+            parts.append(self._encode_scalar(value))
+
+    def _write_items(self, items, parts):
+        encode_string = self.encode_string
+        scalar_types = self.SCALAR_TYPES
+        separator = '{'
+        for key, value in items:
+            parts.append(separator)
+            parts.append(encode_string(key) if key.__class__ is str else self._encode_key(key))
+            parts.append(': ')
+            if value.__class__ is str:
+                parts.append(encode_string(value))
+            elif value.__class__ in scalar_types:
+                parts.append(self._encode_scalar(value))
+            else:
+                yield from self._write_value(value, parts)
+            separator = ', '
+
+            if len(parts) >= self.flush_parts:
+                yield
+
+        parts.append('{}' if separator == '{' else '}')
+
+    def _write_list(self, items, parts):
+        encode_string = self.encode_string
+        scalar_types = self.SCALAR_TYPES
+        separator = '['
+        for value in items:
+            parts.append(separator)
+            if value.__class__ is str:
+                parts.append(encode_string(value))
+            elif value.__class__ in scalar_types:
+                parts.append(self._encode_scalar(value))
+            else:
+                yield from self._write_value(value, parts)
+            separator = ', '
+
+            if len(parts) >= self.flush_parts:
+                yield
+
+        parts.append('[]' if separator == '[' else ']')
+
+
+def iterencode(obj, **kwargs):
+    """
+    Yields JSON document of a model, a list model or any JSON serializable value by chunks, walking
+    it directly. See :class:`JSONWriter`.
+
+    :param obj: Object to encode.
+    :return: Iterator of strings.
+    """
+    return JSONWriter(**kwargs).iterencode(obj)
+
+
+def dump(obj, fp, **kwargs):
+    """
+    Writes JSON document of a model, a list model or any JSON serializable value to a file object by
+    chunks. See :class:`JSONWriter`.
+
+    :param obj: Object to encode.
+    :param fp: File object opened in text or binary mode (UTF-8).
+    """
+    binary = isinstance(fp, (io.RawIOBase, io.BufferedIOBase)) or 'b' in getattr(fp, 'mode', '')
+    for chunk in iterencode(obj, **kwargs):
+        fp.write(chunk.encode('utf-8') if binary else chunk)
@@ -1,11 +1,12 @@
 """
 Internal types for dirty models
 """
-from functools import wraps
+from functools import partial, wraps
 
 import itertools
 
-from .base import AccessMode, BaseData, InnerFieldTypeMixin
+from .base import UNUSABLE, AccessMode, BaseData, FieldSchema, InnerFieldTypeMixin, LazyValue, diff_value, \
+    export_value, materialize, share_value, track_modified
 
 __all__ = ['ListModel']
 
@@ -21,11 +22,13 @@ def modified_data_decorator(function):
         """Decorator function"""
 
         if self.get_access_mode() == AccessMode.READ_AND_WRITE:
+            self._before_write()
+            self._record_change(None, function.__name__.strip('_'))
             self.initialise_modified_data()
             return function(self, *args, **kwargs)
         return lambda: None
 
-    return func
+    return track_modified(func)
 
 
 def restore_list_model_from_data(list_class, field, common_data, original_list, modified_list):
@@ -39,6 +42,26 @@ def restore_list_model_from_data(list_class, field, common_data, original_list,
         model.__modified_data__ = [common_data[i] for i in modified_list]
         list(map(model._prepare_child, model.__modified_data__))
 
+    model.__modified_state__ = None
+    return model
+
+
+def recover_list_model_from_data(list_class, schema, original_data, modified_data):
+    """
+    Function to reconstruct a list from a schema of its field type and its original and modified items.
+    Necessary for pickle an object
+    """
+    fields = schema.get_fields()
+    model = list_class(field_type=fields[0]) if fields else list_class()
+
+    model.__original_data__ = original_data
+    list(map(model._prepare_child, original_data))
+
+    if modified_data is not None:
+        model.__modified_data__ = modified_data
+        list(map(model._prepare_child, modified_data))
+
+    model.__modified_state__ = None
     return model
 
 
@@ -47,29 +70,154 @@ class ListModel(InnerFieldTypeMixin, BaseData):
     Dirty model for a list. It has the behavior to work as a list implementing its methods
     and has also the methods export_data, export_modified_data, import_data and flat_data
     to work also as a model, storing original and modified values.
+
+    **Lazy mode:**
+
+    When ``lazy`` is ``True``, items added using :meth:`extend` (so, items used to build list too) which
+    field type could use (see :meth:`~dirty_models.fields.BaseField.can_use_value`) are stored as they are
+    and they are converted on first access. Meanwhile, :meth:`export_data` returns them as they were added.
+    Any other item is validated at once, so items which could not be used by field type are dropped like
+    in eager mode, and length, indexing and iteration do not depend on which items were accessed. Lazy items
+    which could not be converted after all raise :class:`ValueError` when they are accessed.
     """
 
+    __lazy__ = False
+    __lazy_items__ = False
+
     def __init__(self, seq=None, *args, **kwargs):
+        if kwargs.pop('lazy', False):
+            self.__lazy__ = True
         super(ListModel, self).__init__(*args, **kwargs)
         self.__original_data__ = []
         self.__modified_data__ = None
         if seq is not None:
             self.extend(seq)
 
-    def get_validated_object(self, value):
+    @classmethod
+    def from_trusted(cls, seq, field_type=None):
+        """
+        Builds a list using items as original data without any validation or conversion.
+
+        :param seq: Iterable with valid items.
+        :param field_type: Field type of items.
+        :return: ListModel
+        """
+        model = cls(field_type=field_type) if field_type is not None else cls()
+        try:
+            adopt_value = model.get_field_type().adopt_value
+        except AttributeError:
+            model.__original_data__ = list(seq)
+        else:
+            model.__original_data__ = [adopt_value(item) for item in seq]
+            model.__lazy_items__ = True
+        list(map(model._prepare_child, model.__original_data__))
+        model.__modified_state__ = None
+        return model
+
+    def copy(self):
+        """
+        Creates a copy of list. Copy has no original data: all its items, and data of its inner models
+        and lists, are modified data.
+
+        Inner models and lists are not copied but shared between both lists until one of them modifies
+        them (or gets them).
+        """
+        model = self.__class__(field_type=self.__field_type__)
+        model.__lazy__ = self.__lazy__
+
+        memo = {}
+        data = self.__modified_data__ if self.__modified_data__ is not None else self.__original_data__
+        model.__modified_data__ = [share_value(value, memo) for value in data]
+        list(map(model._prepare_child, model.__modified_data__))
+
+        model.__lazy_items__ = any(isinstance(value, LazyValue) for value in memo.values())
+        return model
+
+    @staticmethod
+    def iter_json(fp, field_type=None, **kwargs):
+        """
+        Iterates over items of a JSON array stored in a file object. Each item is converted using
+        field type and yielded as soon as it is read. See :func:`dirty_models.json_stream.iter_list_items`.
+
+        :param fp: File object opened in text or binary mode (UTF-8).
+        :param field_type: Field type of items.
+        :type field_type: dirty_models.fields.BaseField
+        :return: Iterator of items.
+        """
+        from .json_stream import iter_list_items
+        return iter_list_items(fp, field_type=field_type, **kwargs)
+
+    def get_validated_object(self, value, creating=None):
         """
         Returns the value validated by the field_type
         """
+        if creating is None:
+            creating = self.is_creating()
         try:
-            if self.get_field_type().check_value(value) or self.get_field_type().can_use_value(value):
-                data = self.get_field_type().use_value(value, creating=self.is_creating())
-                self._prepare_child(data)
-                return data
-            else:
-                return None
+            data = self.get_field_type().get_converter(type(value))(value, creating)
         except AttributeError:
             return value
 
+        if data is UNUSABLE:
+            return None
+        self._prepare_child(data)
+        return data
+
+    def _get_lazy_object(self, value):
+        """
+        Returns a placeholder which converts value on first access, if field type could use value.
+        Otherwise, value is validated at once, so it is ``None`` when it could not be used.
+        """
+        try:
+            field_type = self.get_field_type()
+            lazy = not field_type.check_value(value) and field_type.can_use_value(value)
+        except AttributeError:
+            lazy = False
+
+        if not lazy:
+            return self.get_validated_object(value)
+
+        self.__lazy_items__ = True
+        lazy_value = LazyValue(value, partial(self._build_lazy_object, creating=self.is_creating()),
+                               modified=True)
+        self._prepare_child(lazy_value)
+        return lazy_value
+
+    def _build_lazy_object(self, value, creating):
+        """
+        Converts value of a lazy item. Field type said it could use value, so it is an error if it could not.
+        """
+        data = self.get_validated_object(value, creating=creating)
+        if data is None:
+            raise ValueError('Item {0!r} could not be used by field type'.format(value))
+        return data
+
+    def _get_item(self, data, index):
+        """
+        Returns item, building it if it is necessary
+        """
+        value = data[index]
+        if isinstance(value, LazyValue):
+            value = data[index] = value.materialize()
+        return value
+
+    def _iter_items(self, data):
+        for index, value in enumerate(data):
+            if isinstance(value, LazyValue):
+                value = data[index] = value.materialize()
+            yield value
+
+    def _materialize_items(self):
+        """
+        Builds all lazy items
+        """
+        if self.__lazy_items__:
+            for data in (self.__original_data__, self.__modified_data__):
+                if data:
+                    for index, value in enumerate(data):
+                        if isinstance(value, LazyValue):
+                            data[index] = value.materialize()
+
     def _prepare_child(self, value):
         super(ListModel, self)._prepare_child(value)
 
@@ -111,12 +259,25 @@ class ListModel(InnerFieldTypeMixin, BaseData):
             except AttributeError as ex:
                 raise KeyError(str(ex))
 
+        if self.__lazy_items__:
+            self._materialize_slice(item)
+
         if self.__modified_data__ is not None:
             val = self.__modified_data__.__getitem__(item)
             if val is not None:
                 return val
         return self.__original_data__.__getitem__(item)
 
+    def _materialize_slice(self, item):
+        for data in (self.__modified_data__, self.__original_data__):
+            if not data:
+                continue
+            if isinstance(item, slice):
+                for index in range(*item.indices(len(data))):
+                    self._get_item(data, index)
+            elif -len(data) <= item < len(data):
+                self._get_item(data, item)
+
     @modified_data_decorator
     def __delitem__(self, key):
         """
@@ -154,20 +315,27 @@ class ListModel(InnerFieldTypeMixin, BaseData):
         """
         Gets the index in the list for a value
         """
+        self._materialize_items()
         if self.__modified_data__ is not None:
             return self.__modified_data__.index(value)
         return self.__original_data__.index(value)
 
+    @track_modified
     def clear(self):
         """
         Resets our list, keeping original data
         """
+        self._before_write()
+        self._record_change(None, 'clear')
         self.__modified_data__ = None
 
+    @track_modified
     def clear_all(self):
         """
         Resets our list
         """
+        self._before_write()
+        self._record_change(None, 'clear_all')
         self.__original_data__ = []
         self.__modified_data__ = None
 
@@ -176,6 +344,7 @@ class ListModel(InnerFieldTypeMixin, BaseData):
         """
         Deleting an element from the list
         """
+        self._materialize_items()
         return self.__modified_data__.remove(value)
 
     @modified_data_decorator
@@ -183,6 +352,11 @@ class ListModel(InnerFieldTypeMixin, BaseData):
         """
         Given an iterable, it adds the elements to our list
         """
+        if self.__lazy__:
+            values = [self._get_lazy_object(value) for value in iterable]
+            self.__modified_data__.extend([value for value in values if value is not None])
+            return
+
         for value in iterable:
             self.append(value)
 
@@ -192,12 +366,13 @@ class ListModel(InnerFieldTypeMixin, BaseData):
         Obtains and delete the element from the list
         """
         if self.__modified_data__ is not None:
-            return self.__modified_data__.pop(*args)
+            return materialize(self.__modified_data__.pop(*args))
 
     def count(self, value):
         """
         Gives the number of occurrencies of a value in the list
         """
+        self._materialize_items()
         if self.__modified_data__ is not None:
             return self.__modified_data__.count(value)
         return self.__original_data__.count(value)
@@ -216,16 +391,19 @@ class ListModel(InnerFieldTypeMixin, BaseData):
         Sorts the list
         """
         if self.__modified_data__:
+            self._materialize_items()
             self.__modified_data__.sort()
 
     def __iter__(self):
         """
         Defined behaviour for our iterable to be iterated
         """
-        if self.__modified_data__ is not None:
-            return self.__modified_data__.__iter__()
-        return self.__original_data__.__iter__()
+        data = self.__modified_data__ if self.__modified_data__ is not None else self.__original_data__
+        if self.__lazy_items__:
+            return self._iter_items(data)
+        return data.__iter__()
 
+    @track_modified
     def flat_data(self):
         """
         Function to pass our modified values to the original ones
@@ -236,33 +414,26 @@ class ListModel(InnerFieldTypeMixin, BaseData):
             Flat item
             """
             try:
-                value.flat_data()
+                if value.is_modified():
+                    value.flat_data()
                 return value
             except AttributeError:
                 return value
 
+        if not self.is_modified():
+            return
+
+        self._before_write()
+        self._record_change(None, 'flat')
         modified_data = self.__modified_data__ if self.__modified_data__ is not None else self.__original_data__
         if modified_data is not None:
             self.__original_data__ = [flat_field(value) for value in modified_data]
         self.__modified_data__ = None
 
-    def export_data(self):
-        """
-        Retrieves the data in a jsoned form
-        """
-
-        def export_field(value):
-            """
-            Export item
-            """
-            try:
-                return value.export_data()
-            except AttributeError:
-                return value
-
+    def _export_data(self):
         if self.__modified_data__ is not None:
-            return [export_field(value) for value in self.__modified_data__]
-        return [export_field(value) for value in self.__original_data__]
+            return [export_value(value) for value in self.__modified_data__]
+        return [export_value(value) for value in self.__original_data__]
 
     def export_modified_data(self):
         """
@@ -273,6 +444,7 @@ class ListModel(InnerFieldTypeMixin, BaseData):
             """
             Export modified item
             """
+            value = materialize(value)
             try:
                 return value.export_modified_data()
             except AttributeError:
@@ -307,6 +479,29 @@ class ListModel(InnerFieldTypeMixin, BaseData):
 
         return result
 
+    def diff(self, other):
+        """
+        Returns changes needed to turn list into other list, with same shape as
+        :meth:`export_modifications` result: whole other list if they have different length or
+        changes on each item otherwise.
+
+        :param other: List to compare with.
+        :type other: ListModel
+        :return: dict or list
+        """
+        if other is self:
+            return {}
+
+        data = self.__modified_data__ if self.__modified_data__ is not None else self.__original_data__
+        other_data = other.__modified_data__ if other.__modified_data__ is not None else other.__original_data__
+        if len(data) != len(other_data):
+            return other.export_data()
+
+        result = {}
+        for index, (value, other_value) in enumerate(zip(data, other_data)):
+            diff_value(result, index, value, other_value)
+        return result
+
     def export_original_data(self):
         """
         Retrieves the original_data
@@ -350,6 +545,35 @@ class ListModel(InnerFieldTypeMixin, BaseData):
                 for key in data:
                     child_delete_from_str(key)
 
+    def _apply_patch(self, tree):
+        if self.get_access_mode() != AccessMode.READ_AND_WRITE:
+            return
+
+        deleted = []
+        for key, node in tree.children.items():
+            try:
+                index = int(key)
+            except ValueError:
+                continue
+
+            if not -len(self) <= index < len(self):
+                continue
+            index %= len(self)
+
+            if node.has_value:
+                self[index] = node.value
+
+            if node.children:
+                child = self[index]
+                if isinstance(child, BaseData):
+                    child._apply_patch(node)
+
+            if node.deleted:
+                deleted.append(index)
+
+        for index in sorted(deleted, reverse=True):
+            self.pop(index)
+
     def export_deleted_fields(self):
         """
         Returns a list with any deleted fields form original data.
@@ -359,7 +583,7 @@ class ListModel(InnerFieldTypeMixin, BaseData):
         if self.__modified_data__ is not None:
             return result
 
-        for index, item in enumerate(self):
+        for index, item in enumerate(self.__original_data__):
             try:
                 deleted_fields = item.export_deleted_fields()
                 result.extend(['{}.{}'.format(index, key) for key in deleted_fields])
@@ -367,10 +591,7 @@ class ListModel(InnerFieldTypeMixin, BaseData):
                 pass
         return result
 
-    def is_modified(self):
-        """
-        Returns whether list is modified or not
-        """
+    def _is_modified(self):
         if self.__modified_data__ is not None:
             return True
         for value in self.__original_data__:
@@ -382,18 +603,37 @@ class ListModel(InnerFieldTypeMixin, BaseData):
 
         return False
 
+    @track_modified
     def clear_modified_data(self):
         """
         Clears only the modified data
         """
+        if not self.is_modified():
+            return
+
+        self._before_write()
+        self._record_change(None, 'clear_modified_data')
         self.__modified_data__ = None
 
         for value in self.__original_data__:
             try:
-                value.clear_modified_data()
+                if value.is_modified():
+                    value.clear_modified_data()
             except AttributeError:
                 pass
 
+    def _save_undo(self, key):
+        # Original data is always replaced, never changed in place
+        modified_data = self.__modified_data__
+        return self.__original_data__, list(modified_data) if modified_data is not None else None
+
+    @track_modified
+    def _undo(self, key, saved):
+        self.__original_data__, self.__modified_data__ = saved
+        for value in itertools.chain(self.__original_data__, self.__modified_data__ or []):
+            self._restore_child(value)
+        self._record_change(None, 'rollback')
+
     def _update_access_mode(self):
         for value in itertools.chain(self.__original_data__ if self.__original_data__ else [],
                                      self.__modified_data__ if self.__modified_data__ else []):
@@ -519,21 +759,16 @@ class ListModel(InnerFieldTypeMixin, BaseData):
         return str([item for item in self])
 
     def __contains__(self, item):
+        self._materialize_items()
         return item in self.__modified_data__ if self.__modified_data__ is not None else item in self.__original_data__
 
     def __reduce__(self):
-        orginal_list = [id(i) for i in self.__original_data__]
-        common_data = {id(i): i for i in self.__original_data__}
-
-        try:
-            modified_list = [id(i) for i in self.__modified_data__]
-            common_data.update({id(i): i for i in self.__modified_data__ if id(i) not in common_data})
-        except TypeError:
-            modified_list = None
-
-        return restore_list_model_from_data, (self.__class__,
-                                              (self.get_field_type().__class__,
-                                               self.get_field_type().export_definition()),
-                                              common_data,
-                                              orginal_list,
-                                              modified_list)
+        """
+        Reduce function to allow dumpable by pickle. Items shared by original and modified data are
+        stored once by pickle itself.
+        """
+        field_type = self.get_field_type()
+        return recover_list_model_from_data, (self.__class__,
+                                              FieldSchema.from_fields([field_type] if field_type else []),
+                                              self.__original_data__,
+                                              self.__modified_data__)
@@ -2,28 +2,281 @@
 Base models for dirty_models.
 """
 
-from collections.abc import Mapping
+from collections.abc import Mapping, MutableMapping
 from copy import deepcopy
 from datetime import date, datetime, time, timedelta
 from enum import Enum
 
 import itertools
+import weakref
 
 from dirty_models.fields import DateField, EnumField, TimeField, TimedeltaField
-from .base import AccessMode, BaseData, Creating, InnerFieldTypeMixin
+from .base import UNUSABLE, AccessMode, BaseData, Creating, FieldSchema, InnerFieldTypeMixin, LazyValue, PatchTree, \
+    diff_value, export_value, get_field_signature, share_value, touch_access_modes, track_modified
 from .fields import ArrayField, BaseField, BooleanField, DateTimeField, FloatField, IntegerField, ModelField, \
     StringField
+from .journal import ChangeJournal
 from .model_types import ListModel
+from .transaction import Transaction
 
 __all__ = ['BaseModel', 'DynamicModel', 'FastDynamicModel', 'HashMapModel', 'DirtyModelMeta', 'CamelCaseMeta']
 
 
+class CompactDataView(MutableMapping):
+    """
+    Dictionary-like view of original or modified data of a compact model. Each field value
+    is stored in its own slot and empty slots are missing keys.
+    """
+
+    __slots__ = ('model', 'members')
+
+    def __init__(self, model, members):
+        self.model = model
+        self.members = members
+
+    def __getitem__(self, key):
+        try:
+            return self.members[key].__get__(self.model)
+        except (KeyError, AttributeError):
+            raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        try:
+            member = self.members[key]
+        except KeyError:
+            raise KeyError("Field '{0}' is not declared on compact model '{1}'".format(key,
+                                                                                       type(self.model).__name__))
+        member.__set__(self.model, value)
+
+    def __delitem__(self, key):
+        try:
+            self.members[key].__delete__(self.model)
+        except (KeyError, AttributeError):
+            raise KeyError(key)
+
+    def __iter__(self):
+        model = self.model
+        for key, member in self.members.items():
+            try:
+                member.__get__(model)
+            except AttributeError:
+                continue
+            yield key
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def copy(self):
+        return dict(self.items())
+
+    def __repr__(self):
+        return repr(self.copy())
+
+    def __reduce__(self):
+        return dict, (self.copy(),)
+
+
+class CompactDeletedView:
+    """
+    List-like view of deleted fields of a compact model. Deleted fields are stored as a bitmask.
+    """
+
+    __slots__ = ('model', 'names', 'bits')
+
+    def __init__(self, model, names, bits):
+        self.model = model
+        self.names = names
+        self.bits = bits
+
+    def __iter__(self):
+        mask = self.model.__deleted_mask__
+        for name in self.names:
+            if mask & self.bits[name]:
+                yield name
+
+    def __len__(self):
+        return bin(self.model.__deleted_mask__).count('1')
+
+    def __contains__(self, name):
+        try:
+            return bool(self.model.__deleted_mask__ & self.bits[name])
+        except KeyError:
+            return False
+
+    def append(self, name):
+        self.model.__deleted_mask__ |= self.bits[name]
+
+    def remove(self, name):
+        if name not in self:
+            raise ValueError('{0} is not in list'.format(name))
+        self.model.__deleted_mask__ &= ~self.bits[name]
+
+    def copy(self):
+        return list(self)
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(self.copy())
+
+    def __reduce__(self):
+        return list, (self.copy(),)
+
+
+class CompactData:
+    """
+    Descriptor which stores a dictionary of field values on slots of a compact model.
+    """
+
+    def __init__(self, members):
+        self.members = members
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        return CompactDataView(obj, self.members)
+
+    def __set__(self, obj, value):
+        value = dict(value)
+        for member in self.members.values():
+            try:
+                member.__delete__(obj)
+            except AttributeError:
+                pass
+
+        view = CompactDataView(obj, self.members)
+        for key, item in value.items():
+            view[key] = item
+
+
+class CompactDeletedFields:
+    """
+    Descriptor which stores a list of deleted fields as a bitmask on a compact model.
+    """
+
+    def __init__(self, names):
+        self.names = tuple(names)
+        self.bits = {name: 1 << pos for pos, name in enumerate(self.names)}
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        return CompactDeletedView(obj, self.names, self.bits)
+
+    def __set__(self, obj, value):
+        mask = 0
+        for name in value:
+            mask |= self.bits[name]
+        obj.__deleted_mask__ = mask
+
+
+class AccessModeOverrides(dict):
+    """
+    Access modes overridden by a model class. Changing them makes formatted data memoized before
+    to be built again.
+    """
+
+    def __setitem__(self, key, value):
+        super(AccessModeOverrides, self).__setitem__(key, value)
+        touch_access_modes()
+
+    def __delitem__(self, key):
+        super(AccessModeOverrides, self).__delitem__(key)
+        touch_access_modes()
+
+    def pop(self, *args):
+        try:
+            return super(AccessModeOverrides, self).pop(*args)
+        finally:
+            touch_access_modes()
+
+    def popitem(self):
+        try:
+            return super(AccessModeOverrides, self).popitem()
+        finally:
+            touch_access_modes()
+
+    def setdefault(self, key, default=None):
+        try:
+            return super(AccessModeOverrides, self).setdefault(key, default)
+        finally:
+            touch_access_modes()
+
+    def update(self, *args, **kwargs):
+        super(AccessModeOverrides, self).update(*args, **kwargs)
+        touch_access_modes()
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def clear(self):
+        super(AccessModeOverrides, self).clear()
+        touch_access_modes()
+
+
 class DirtyModelMeta(type):
     """
     Metaclass for dirty_models. It sets automatic fieldnames and
     automatic model_class for ModelField fields.
+
+    Models with ``__compact__ = True`` are built with ``__slots__``: each field has a slot for
+    its original value and other one for its modified value, and deleted fields are a bitmask.
+    They have no instance dictionary, so they use much less memory, but accessing data is
+    slower. Only statically declared fields could be stored. Compact models could only inherit from
+    :class:`~dirty_models.models.BaseModel` or other compact models, and their subclasses are compact too.
     """
 
+    COMPACT_BASE_SLOTS = ('__locked__', '__access_mode__', '__is_creating__', '__parent__', '__owners__',
+                          '__shared_by__', '__state_cache__', '__state_token__', '__modified_state__', '__journal__',
+                          '__transaction__', '__export_cache__', '__deleted_mask__', '__weakref__')
+
+    def __new__(mcs, name, bases, classdict):
+        compact = classdict.get('__compact__')
+        if compact is None:
+            compact = any(getattr(base, '__compact__', False) for base in bases)
+
+        if compact:
+            classdict = dict(classdict)
+            slots, size = mcs.get_compact_slots(bases, classdict)
+            classdict['__slots__'] = tuple(classdict.get('__slots__', ())) + slots
+            classdict['__compact_size__'] = size
+
+        return super(DirtyModelMeta, mcs).__new__(mcs, name, bases, classdict)
+
+    @classmethod
+    def get_compact_slots(mcs, bases, classdict):
+        """
+        Returns slots needed by a compact model and number of field positions.
+        Fields get positions when class is initialised, because their names are not known yet.
+        """
+        for base in bases:
+            if base.__dictoffset__:
+                raise TypeError("Compact model could not inherit from '{0}', because it is not "
+                                "a compact model".format(base.__name__))
+
+        compact_bases = [base for base in bases if getattr(base, '__compact__', False)]
+        size = max([base.__compact_size__ for base in compact_bases] or [0])
+        known_names = set()
+        for base in compact_bases:
+            known_names.update(base.__compact_index__.keys())
+
+        names = set()
+        for base in bases:
+            names.update(getattr(base, '__structure__', {}).keys())
+
+        new_fields = {id(field) for key, field in classdict.items()
+                      if isinstance(field, BaseField) and not key.startswith('__')}
+        total = size + len(names - known_names) + len(new_fields)
+
+        slots = () if compact_bases else mcs.COMPACT_BASE_SLOTS
+        for pos in range(size, total):
+            slots += ('_original_{0}'.format(pos), '_modified_{0}'.format(pos))
+        return slots, total
+
     def __init__(cls, name, bases, classdict):
         super(DirtyModelMeta, cls).__init__(name, bases, classdict)
 
@@ -68,7 +321,21 @@ class DirtyModelMeta(type):
         override_field_access_modes.update({cls.get_field_obj(k).name: v
                                             for k, v in cls.__override_field_access_modes__.items()})
 
-        cls.__override_field_access_modes__ = override_field_access_modes
+        super(DirtyModelMeta, cls).__setattr__('__override_field_access_modes__',
+                                               AccessModeOverrides(override_field_access_modes))
+        cls.__import_plan__ = cls.compile_import_plan()
+        cls.__format_plans__ = {}
+        cls.__field_names__ = tuple(cls.__structure__.keys())
+        cls.__field_positions__ = {name: pos for pos, name in enumerate(cls.__field_names__)}
+
+        if cls.__compact__:
+            cls.prepare_compact_storage()
+
+    def __setattr__(cls, name, value):
+        if name == '__override_field_access_modes__':
+            value = AccessModeOverrides(value)
+            touch_access_modes()
+        super(DirtyModelMeta, cls).__setattr__(name, value)
 
     def process_base_field(cls, field, key):
         """
@@ -110,6 +377,50 @@ class DirtyModelMeta(type):
         except AttributeError:
             pass
 
+    def prepare_compact_storage(cls):
+        """
+        Assigns a position to each field and sets descriptors for data containers of a compact model.
+        """
+        index = {}
+        pos = 0
+        for base in cls.__bases__:
+            if getattr(base, '__compact__', False):
+                index.update(base.__compact_index__)
+                pos = max(pos, base.__compact_size__)
+
+        for name in cls.__structure__.keys():
+            if name not in index:
+                index[name] = pos
+                pos += 1
+
+        cls.__compact_index__ = index
+        cls.__original_data__ = CompactData({name: getattr(cls, '_original_{0}'.format(p))
+                                             for name, p in index.items()})
+        cls.__modified_data__ = CompactData({name: getattr(cls, '_modified_{0}'.format(p))
+                                             for name, p in index.items()})
+        cls.__deleted_fields__ = CompactDeletedFields(index.keys())
+
+    def compile_import_plan(cls):
+        """
+        Builds a dictionary which maps every field name and alias to an importer function.
+        Importers are shared by all names of a field.
+
+        :return: dict
+        """
+        importers = {}
+        plan = {}
+        for field in cls.__structure__.values():
+            for name in itertools.chain([field.name], field.alias or []):
+                field_obj = getattr(cls, name, None)
+                if not isinstance(field_obj, BaseField):
+                    continue
+                try:
+                    plan[name] = importers[id(field_obj)]
+                except KeyError:
+                    plan[name] = importers[id(field_obj)] = field_obj.build_importer()
+
+        return plan
+
     def check_structure(cls):
         names = set()
         fields = {key: field for key, field in cls.__dict__.items() if isinstance(field, BaseField)}
@@ -152,12 +463,14 @@ def set_model_internal_data(model, original_data, modified_data, deleted_data):
     Set internal data to model.
     """
     model.__original_data__ = original_data
-    list(map(model._prepare_child, model.__original_data__))
+    list(map(model._prepare_child, model.__original_data__.values()))
 
     model.__modified_data__ = modified_data
-    list(map(model._prepare_child, model.__modified_data__))
+    list(map(model._prepare_child, model.__modified_data__.values()))
 
     model.__deleted_fields__ = deleted_data
+    model.__modified_state__ = None
+    model._invalidate_export()
 
     return model
 
@@ -172,14 +485,87 @@ def recover_model_from_data(model_class, original_data, modified_data, deleted_d
     return set_model_internal_data(model, original_data, modified_data, deleted_data)
 
 
+def pack_fields(model_class, names):
+    """
+    Replaces field names by their positions on model class structure. Positions are packed as bytes
+    when possible. Names which are not in structure are kept.
+
+    :param model_class: Model class.
+    :param names: Iterable of field names.
+    :return: bytes or tuple
+    """
+    if not names:
+        return b''
+
+    field_positions = model_class.__field_positions__
+    try:
+        return bytes(map(field_positions.__getitem__, names))
+    except (KeyError, ValueError):
+        return tuple(field_positions.get(name, name) for name in names)
+
+
+def unpack_fields(model_class, positions):
+    """
+    Replaces field positions on model class structure by their names.
+
+    :param model_class: Model class.
+    :param positions: Packed positions.
+    :return: list
+    """
+    field_names = model_class.__field_names__
+    return [field_names[pos] if isinstance(pos, int) else pos for pos in positions]
+
+
+def pack_model_data(model):
+    """
+    Returns original data, modified data and deleted fields of a model as field positions and tuples
+    of values.
+
+    :param model: Model.
+    :return: tuple
+    """
+    model_class = model.__class__
+    original_data = model.__original_data__
+    modified_data = model.__modified_data__
+    return (pack_fields(model_class, original_data.keys()), tuple(original_data.values()),
+            pack_fields(model_class, modified_data.keys()), tuple(modified_data.values()),
+            pack_fields(model_class, model.__deleted_fields__))
+
+
+def unpack_model_data(model, original_fields, original_values, modified_fields, modified_values, deleted_fields):
+    """
+    Sets data packed by :func:`pack_model_data` to a model.
+    """
+    model_class = model.__class__
+    return set_model_internal_data(model,
+                                   dict(zip(unpack_fields(model_class, original_fields), original_values)),
+                                   dict(zip(unpack_fields(model_class, modified_fields), modified_values)),
+                                   unpack_fields(model_class, deleted_fields))
+
+
+def recover_model_from_packed_data(model_class, *data):
+    """
+    Function to reconstruct a model from data packed by :func:`pack_model_data`.
+    Necessary for pickle an object
+    """
+    return unpack_model_data(model_class._new_empty(), *data)
+
+
 class BaseModel(BaseData, metaclass=DirtyModelMeta):
     """
     Base model with dirty feature. It stores original data and saves
     modifications in other side.
     """
 
+    __slots__ = ()
+
     __default_data__ = {}
     __override_field_access_modes__ = {}
+    __import_plan__ = {}
+    __format_plans__ = {}
+    __field_names__ = ()
+    __field_positions__ = {}
+    __compact__ = False
 
     def __init__(self, data=None, flat=False, *args, **kwargs):
         super(BaseModel, self).__init__(*args, **kwargs)
@@ -202,8 +588,7 @@ class BaseModel(BaseData, metaclass=DirtyModelMeta):
         Reduce function to allow dumpable by pickle
         """
 
-        return recover_model_from_data, (self.__class__, self.__original_data__,
-                                         self.__modified_data__, self.__deleted_fields__,)
+        return recover_model_from_packed_data, (self.__class__,) + pack_model_data(self)
 
     def get_real_name(self, name):
         obj = self.get_field_obj(name)
@@ -212,6 +597,7 @@ class BaseModel(BaseData, metaclass=DirtyModelMeta):
         except AttributeError:
             return None
 
+    @track_modified
     def set_field_value(self, name, value):
         """
         Set the value to the field modified_data
@@ -221,6 +607,8 @@ class BaseModel(BaseData, metaclass=DirtyModelMeta):
         if not name or not self._can_write_field(name):
             return
 
+        self._before_write()
+        self._record_change(name, 'set', value)
         if name in self.__deleted_fields__:
             self.__deleted_fields__.remove(name)
         if self.__original_data__.get(name) == value:
@@ -250,9 +638,15 @@ class BaseModel(BaseData, metaclass=DirtyModelMeta):
             return None
         modified = self.__modified_data__.get(name)
         if modified is not None:
+            if isinstance(modified, LazyValue):
+                modified = self.__modified_data__[name] = modified.materialize()
             return modified
-        return self.__original_data__.get(name)
+        value = self.__original_data__.get(name)
+        if isinstance(value, LazyValue):
+            value = self.__original_data__[name] = value.materialize()
+        return value
 
+    @track_modified
     def delete_field_value(self, name):
         """
         Mark this field to be deleted
@@ -260,12 +654,15 @@ class BaseModel(BaseData, metaclass=DirtyModelMeta):
         name = self.get_real_name(name)
 
         if name and self._can_write_field(name):
+            self._before_write()
+            self._record_change(name, 'delete')
             if name in self.__modified_data__:
                 self.__modified_data__.pop(name)
 
             if name in self.__original_data__ and name not in self.__deleted_fields__:
                 self.__deleted_fields__.append(name)
 
+    @track_modified
     def reset_field_value(self, name):
         """
         Resets value of a field
@@ -273,6 +670,8 @@ class BaseModel(BaseData, metaclass=DirtyModelMeta):
         name = self.get_real_name(name)
 
         if name and self._can_write_field(name):
+            self._before_write()
+            self._record_change(name, 'reset')
             if name in self.__modified_data__:
                 del self.__modified_data__[name]
 
@@ -314,11 +713,17 @@ class BaseModel(BaseData, metaclass=DirtyModelMeta):
         self._import_data(data)
 
     def _import_data(self, data):
+        plan = self.__import_plan__
         for key, value in data.items():
-            if not self.get_field_obj(key):
-                self._not_allowed_field(key)
-                continue
-            setattr(self, key, value)
+            try:
+                importer = plan[key]
+            except KeyError:
+                if not self.get_field_obj(key):
+                    self._not_allowed_field(key)
+                    continue
+                setattr(self, key, value)
+            else:
+                importer(self, value)
 
     def _not_allowed_field(self, name):
         pass
@@ -353,10 +758,37 @@ class BaseModel(BaseData, metaclass=DirtyModelMeta):
             child = getattr(self, keys[0])
             child.import_deleted_fields(keys[1])
 
-    def export_data(self):
+    def apply_modifications(self, modifications, deleted=None):
         """
-        Get the results with the modified_data
+        Applies a change set shaped like :meth:`export_modifications` and :meth:`export_deleted_fields`
+        results. Paths are grouped by their keys, so each inner model or list is looked up once and all its
+        values are imported at once.
+
+        :param modifications: Dictionary of values by dotted path: ``{'parent_field.0.child_field': value}``.
+        :type modifications: dict
+        :param deleted: Dotted paths of fields to delete.
+        :type deleted: list or str
         """
+        self._apply_patch(PatchTree.build(modifications, deleted))
+
+    def _apply_patch(self, tree):
+        if self.get_access_mode() != AccessMode.READ_AND_WRITE:
+            return
+
+        values = {key: node.value for key, node in tree.children.items() if node.has_value}
+        if values:
+            self._import_data(values)
+
+        for key, node in tree.children.items():
+            if node.children:
+                child = self.get_field_value(key)
+                if isinstance(child, BaseData):
+                    child._apply_patch(node)
+
+            if node.deleted:
+                self.delete_field_value(key)
+
+    def _export_data(self):
         result = {}
         data = self.__original_data__.copy()
         data.update(self.__modified_data__)
@@ -364,10 +796,7 @@ class BaseModel(BaseData, metaclass=DirtyModelMeta):
             if key in self.__deleted_fields__:
                 continue
 
-            try:
-                result[key] = value.export_data()
-            except AttributeError:
-                result[key] = value
+            result[key] = export_value(value)
 
         return result
 
@@ -375,6 +804,9 @@ class BaseModel(BaseData, metaclass=DirtyModelMeta):
         """
         Get the modified data
         """
+        if self.__journal__ is not None and self.__journal__.complete:
+            return self.__journal__.export_modified_data()
+
         # TODO: why None? Try to get a better flag
         result = {key: None for key in self.__deleted_fields__}
 
@@ -401,6 +833,8 @@ class BaseModel(BaseData, metaclass=DirtyModelMeta):
         """
         Returns model modifications.
         """
+        if self.__journal__ is not None and self.__journal__.complete:
+            return self.__journal__.export_modifications()
 
         result = {}
 
@@ -427,6 +861,39 @@ class BaseModel(BaseData, metaclass=DirtyModelMeta):
 
         return result
 
+    def diff(self, other):
+        """
+        Returns changes needed to turn model into other model, with same shape as
+        :meth:`export_modifications` result. Removed fields get ``None``. Both trees are walked
+        once, and inner models and lists shared by both models (for example, after a
+        :meth:`copy`) are not looked into.
+
+        :param other: Model to compare with.
+        :type other: BaseModel
+        :return: dict
+        """
+        result = {}
+        if other is self:
+            return result
+
+        fields = self.get_fields()
+        other_fields = other.get_fields()
+        for name in itertools.chain(fields, [name for name in other_fields if name not in fields]):
+            diff_value(result, name, self._get_stored_value(name), other._get_stored_value(name))
+
+        return result
+
+    def _get_stored_value(self, name):
+        """
+        Returns value stored for a field, with no placeholder built, or ``None``.
+        """
+        if name in self.__deleted_fields__:
+            return None
+        value = self.__modified_data__.get(name)
+        if value is None:
+            value = self.__original_data__.get(name)
+        return value
+
     def get_original_field_value(self, name):
         """
         Returns original field value or None
@@ -455,6 +922,9 @@ class BaseModel(BaseData, metaclass=DirtyModelMeta):
         Resturns a list with any deleted fields form original data.
         In tree models, deleted fields on children will be appended.
         """
+        if self.__journal__ is not None and self.__journal__.complete:
+            return self.__journal__.export_deleted_fields()
+
         result = self.__deleted_fields__.copy()
 
         for key, value in self.__original_data__.items():
@@ -468,6 +938,7 @@ class BaseModel(BaseData, metaclass=DirtyModelMeta):
 
         return result
 
+    @track_modified
     def flat_data(self):
         """
         Pass all the data from modified_data to original_data
@@ -478,46 +949,189 @@ class BaseModel(BaseData, metaclass=DirtyModelMeta):
             Flat field data
             """
             try:
-                value.flat_data()
+                if value.is_modified():
+                    value.flat_data()
                 return value
             except AttributeError:
                 return value
 
-        modified_dict = self.__original_data__
+        if not self.is_modified():
+            return
+
+        self._before_write()
+        self._record_change(None, 'flat')
+        modified_dict = dict(self.__original_data__)
         modified_dict.update(self.__modified_data__)
         self.__original_data__ = {k: flat_field(v)
                                   for k, v in modified_dict.items()
                                   if k not in self.__deleted_fields__}
+        self.__modified_data__ = {}
+        self.__deleted_fields__ = []
+        self._reset_journal()
 
-        self.clear_modified_data()
-
+    @track_modified
     def clear_modified_data(self):
         """
         Clears only the modified data
         """
+        if not self.is_modified():
+            return
+
+        self._before_write()
+        self._record_change(None, 'clear_modified_data')
         self.__modified_data__ = {}
         self.__deleted_fields__ = []
 
         for value in self.__original_data__.values():
             try:
-                value.clear_modified_data()
+                if value.is_modified():
+                    value.clear_modified_data()
             except AttributeError:
                 pass
 
+        self._reset_journal()
+
+    @track_modified
     def clear(self):
         """
         Clears all the data in the object, keeping original data
         """
+        self._before_write()
+        self._record_change(None, 'clear')
         self.__modified_data__ = {}
         self.__deleted_fields__ = [field for field in self.__original_data__.keys()]
 
+    @track_modified
     def clear_all(self):
         """
         Clears all the data in the object
         """
+        self._before_write()
+        self._record_change(None, 'clear_all')
         self.__modified_data__ = {}
         self.__original_data__ = {}
         self.__deleted_fields__ = []
+        self._reset_journal()
+
+    def _reset_journal(self):
+        """
+        Empties own journal of model, after an operation which leaves it with no modifications.
+        """
+        if self.__journal__ is not None:
+            self.__journal__.reset()
+
+    def _save_undo(self, key):
+        if key is not None:
+            return key in self.__modified_data__, self.__modified_data__.get(key), key in self.__deleted_fields__
+
+        # Original data is replaced, never changed in place, so a plain dictionary does not need to be copied
+        original_data = self.__original_data__
+        if not isinstance(original_data, dict):
+            original_data = dict(original_data)
+        modified_data = dict(self.__modified_data__)
+        deleted_fields = list(self.__deleted_fields__)
+
+        journal_checkpoint = self.__journal__.get_checkpoint() if self.__journal__ is not None else None
+        return original_data, modified_data, deleted_fields, journal_checkpoint
+
+    @track_modified
+    def _undo(self, key, saved):
+        if key is not None:
+            is_modified, value, is_deleted = saved
+            if is_modified:
+                self.__modified_data__[key] = value
+                self._restore_child(value)
+            else:
+                self.__modified_data__.pop(key, None)
+
+            if is_deleted and key not in self.__deleted_fields__:
+                self.__deleted_fields__.append(key)
+            elif not is_deleted and key in self.__deleted_fields__:
+                self.__deleted_fields__.remove(key)
+
+            self._record_change(key, 'rollback')
+            return
+
+        original_data, modified_data, deleted_fields, journal_checkpoint = saved
+        keys = set(itertools.chain(self.__original_data__.keys(), self.__modified_data__.keys(),
+                                   original_data.keys(), modified_data.keys()))
+
+        self.__original_data__ = original_data
+        self.__modified_data__ = modified_data
+        self.__deleted_fields__ = deleted_fields
+        for value in itertools.chain(original_data.values(), modified_data.values()):
+            self._restore_child(value)
+
+        if journal_checkpoint is not None and self.__journal__ is not None:
+            self.__journal__.restore(journal_checkpoint)
+        for key in keys:
+            self._record_change(key, 'rollback')
+
+    def transaction(self):
+        """
+        Starts a transaction on model, or creates a savepoint if model already has a transaction. It returns
+        a context manager: changes made on model and on its inner models and lists inside block are rolled
+        back if an exception is raised. See :class:`~dirty_models.transaction.Transaction`.
+
+        :return: Savepoint
+        :rtype: dirty_models.transaction.Savepoint
+        """
+        if self.__transaction__ is None:
+            self.__transaction__ = Transaction(self)
+            self._invalidate_state()
+        return self.__transaction__.savepoint()
+
+    def savepoint(self):
+        """
+        Creates a savepoint on current transaction of model.
+
+        :return: Savepoint
+        :rtype: dirty_models.transaction.Savepoint
+        :raises RuntimeError: If model has no transaction.
+        """
+        if self.__transaction__ is None:
+            raise RuntimeError('Model has no transaction')
+        return self.__transaction__.savepoint()
+
+    def get_transaction(self):
+        """
+        Returns current transaction of model or ``None``.
+        """
+        return self.__transaction__
+
+    def _end_transaction(self, transaction):
+        if self.__transaction__ is transaction:
+            self.__transaction__ = None
+            self._invalidate_state()
+
+    def start_journal(self):
+        """
+        Starts a change journal on model, if it is not started yet. Writes on model and on its inner models
+        and lists are recorded on journal, and :meth:`export_modifications`, :meth:`export_modified_data` and
+        :meth:`export_deleted_fields` are answered using it, so they only look up changed fields.
+        See :class:`~dirty_models.journal.ChangeJournal`.
+
+        :return: Journal
+        :rtype: dirty_models.journal.ChangeJournal
+        """
+        if self.__journal__ is None:
+            self.__journal__ = ChangeJournal(self)
+            self._invalidate_state()
+        return self.__journal__
+
+    def get_journal(self):
+        """
+        Returns change journal of model or ``None``.
+        """
+        return self.__journal__
+
+    def stop_journal(self):
+        """
+        Stops change journal of model.
+        """
+        if self.__journal__ is not None:
+            self.__journal__ = None
+            self._invalidate_state()
 
     def get_fields(self):
         """
@@ -530,10 +1144,7 @@ class BaseModel(BaseData, metaclass=DirtyModelMeta):
 
         return result
 
-    def is_modified(self):
-        """
-        Returns whether model is modified or not
-        """
+    def _is_modified(self):
         if len(self.__modified_data__) or len(self.__deleted_fields__):
             return True
 
@@ -548,9 +1159,28 @@ class BaseModel(BaseData, metaclass=DirtyModelMeta):
 
     def copy(self):
         """
-        Creates a copy of model
+        Creates a copy of model. Copy has no original data: all its data, and data of its inner models
+        and lists, is modified data.
+
+        Inner models and lists are not copied but shared between both models until one of them modifies
+        them (or gets them), so copying a model only costs a copy of its first level.
         """
-        return self.__class__(data=self.export_data())
+        model = self._new_copy()
+        memo = {}
+        data = self.__original_data__.copy()
+        data.update(self.__modified_data__)
+        deleted_fields = self.__deleted_fields__
+        set_model_internal_data(model, {},
+                                {k: share_value(v, memo) for k, v in data.items() if k not in deleted_fields},
+                                [])
+        model._update_access_mode()
+        return model
+
+    def _new_copy(self):
+        """
+        Returns a new model with no data and same structure, to be used as a copy.
+        """
+        return self._new_empty()
 
     def __iter__(self):
         def iterfunc():
@@ -744,6 +1374,157 @@ class BaseModel(BaseData, metaclass=DirtyModelMeta):
 
         return model
 
+    @classmethod
+    def load_json(cls, fp, flat=False, **kwargs):
+        """
+        Builds a model from a JSON object stored in a file object. Document is read by chunks and
+        fields are set as soon as they are read, so whole document is never loaded as a dictionary.
+        See :func:`dirty_models.json_stream.load_model`.
+
+        :param fp: File object opened in text or binary mode (UTF-8).
+        :param flat: Whether data must be set as original data.
+        :type flat: bool
+        :return: model
+        """
+        from .json_stream import load_model
+        return load_model(fp, cls, flat=flat, **kwargs)
+
+    def dump_json(self, fp, **kwargs):
+        """
+        Writes model as a JSON object to a file object. Model is walked directly and document is written
+        by chunks, so no intermediate dictionaries are built. See :func:`dirty_models.json_stream.dump`.
+
+        :param fp: File object opened in text or binary mode (UTF-8).
+        """
+        from .json_stream import dump
+        dump(self, fp, **kwargs)
+
+    @classmethod
+    def loads_json(cls, document, backend=None, **kwargs):
+        """
+        Builds a model from a JSON document using a JSON backend.
+        See :func:`dirty_models.json_backends.loads`.
+
+        :param document: JSON document.
+        :type document: str or bytes
+        :param backend: Backend name or instance. Default backend is used when it is ``None``.
+        :return: model
+        """
+        from .json_backends import loads
+        return loads(document, cls, backend=backend, **kwargs)
+
+    def dumps_json(self, backend=None, **kwargs):
+        """
+        Encodes model as a JSON document using a JSON backend. Fields are formatted once and formatted data
+        is memoized until model is written. See :func:`dirty_models.json_backends.dumps`.
+
+        :param backend: Backend name or instance. Default backend is used when it is ``None``.
+        :return: JSON document.
+        :rtype: str
+        """
+        from .json_backends import dumps
+        return dumps(self, backend=backend, **kwargs)
+
+    @classmethod
+    def _new_empty(cls, **kwargs):
+        """
+        Builds a new model with no data at all, not even default data.
+        """
+        if cls.__init__ is not BaseModel.__init__:
+            model = cls(**kwargs)
+            model.clear_all()
+            return model
+
+        model = cls.__new__(cls)
+        BaseData.__init__(model)
+        BaseModel.__setattr__(model, '__original_data__', {})
+        BaseModel.__setattr__(model, '__modified_data__', {})
+        BaseModel.__setattr__(model, '__deleted_fields__', [])
+        return model
+
+    @classmethod
+    def from_trusted(cls, data, **kwargs):
+        """
+        Builds a model using data as original data without any validation or conversion. Data must
+        be already valid, for example data exported from a model with the same structure.
+        Inner models and lists are built on first access.
+
+        :param data: Dictionary with valid data.
+        :type data: dict
+        :return: model
+        """
+        model = cls._new_empty(**kwargs)
+        model._adopt_data(data)
+        return model
+
+    def _adopt_data(self, data):
+        original_data = {}
+        for key, value in data.items():
+            field = self.get_field_obj(key)
+            if field is None or value is None:
+                continue
+            original_data[self.get_real_name(key)] = field.adopt_value(value)
+
+        set_model_internal_data(self, original_data, {}, [])
+        self._update_access_mode()
+
+    @classmethod
+    def from_many(cls, rows, flat=False, as_list_model=False):
+        """
+        Builds a model for each dictionary in an iterable. It is equivalent to build
+        each model using ``cls(data=row, flat=flat)``, but default data is converted
+        only once for all of them, and unlocked state which models have while their rows are
+        imported is computed once and dropped once for all of them.
+
+        :param rows: Iterable of dictionaries.
+        :param flat: Whether data must be set as original data.
+        :type flat: bool
+        :param as_list_model: Whether a :class:`~dirty_models.model_types.ListModel` must be returned
+                              instead of a :class:`list`.
+        :type as_list_model: bool
+        :return: list or ListModel
+        """
+        if cls.__init__ is not BaseModel.__init__:
+            models = [cls(data=row, flat=flat) for row in rows]
+        else:
+            from .utils import Factory
+
+            template = cls._new_empty()
+            template.unlock()
+            template._import_data({k: v for k, v in cls.__default_data__.items()
+                                   if not isinstance(v, Factory)})
+
+            shared_defaults = {k: v for k, v in template.__modified_data__.items()
+                               if not isinstance(v, BaseData)}
+            own_defaults = {k: v for k, v in cls.__default_data__.items() if k not in shared_defaults}
+
+            state = template._get_state()
+
+            models = []
+            for row in rows:
+                model = cls._new_empty()
+                model.__locked__ = False
+                model.__state_cache__ = state
+                model.__modified_data__.update(shared_defaults)
+                if own_defaults:
+                    model._import_data(own_defaults)
+                if isinstance(row, (dict, Mapping)):
+                    model._import_data(row)
+                model.__locked__ = True
+                model.__state_cache__ = None
+                models.append(model)
+
+            # Inner models and lists of every model cached unlocked state too
+            template._invalidate_state()
+
+            if flat:
+                for model in models:
+                    model.flat_data()
+
+        if as_list_model:
+            return ListModel(models, field_type=ModelField(model_class=cls))
+        return models
+
 
 class BaseDynamicModel(BaseModel):
     """
@@ -793,6 +1574,18 @@ class BaseDynamicModel(BaseModel):
         else:
             raise TypeError("Invalid parameter: %s. Type not supported." % (key,))
 
+    @classmethod
+    def from_trusted(cls, data, **kwargs):
+        """
+        Builds a model using data as original data. Dynamic models must inspect values in
+        order to define their fields, so data is imported as usual.
+
+        :param data: Dictionary with valid data.
+        :type data: dict
+        :return: model
+        """
+        return cls(data=data, flat=True, **kwargs)
+
     def _import_data(self, data):
         """
         Set the fields established in data to the instance
@@ -818,35 +1611,66 @@ def recover_dynamic_model_from_data(model_class, original_data, modified_data, d
     """
     model = model_class()
 
-    model.__structure__ = {k: d[0](**d[1]) for k, d in structure.items()}
+    for k, d in structure.items():
+        if not model.get_field_obj(k):
+            model._add_field(d[0](**d[1]))
 
     return set_model_internal_data(model, original_data, modified_data, deleted_data)
 
 
 class DynamicModel(BaseDynamicModel):
     """
-    DynamicModel allow to create model with no structure. Each instance has its own
-    derivated class from DynamicModels.
+    DynamicModel allow to create model with no structure. Each instance has a derivated
+    class from DynamicModels with its fields, which is shared by instances with same fields
+    defined in same order (shape). Defining a new field moves instance to a cached derivated
+    class of its shape.
     """
 
     _next_id = 0
 
-    def __init__(self, *args, **kwargs):
-        super(DynamicModel, self).__init__(*args, **kwargs)
-        self.__structure__ = {}
-
     def __new__(cls, *args, **kwargs):
-        new_class = type('DynamicModel_' + str(cls._next_id), (cls,), {'__dynamic_model__': DynamicModel})
-        cls._next_id = id(new_class)
-        return super(DynamicModel, new_class).__new__(new_class)
+        return super(DynamicModel, cls._get_root_shape()).__new__(cls._get_root_shape())
+
+    @classmethod
+    def _get_root_shape(cls):
+        """
+        Returns shape class with no fields for this class.
+        """
+        if '__shape_transitions__' in cls.__dict__:
+            return cls
+
+        try:
+            return cls.__dict__['__root_shape__']
+        except KeyError:
+            cls.__root_shape__ = cls._new_shape(cls, {})
+            return cls.__root_shape__
+
+    @staticmethod
+    def _new_shape(base, fields):
+        DynamicModel._next_id += 1
+        classdict = {'__dynamic_model__': DynamicModel,
+                     '__shape_transitions__': weakref.WeakValueDictionary()}
+        classdict.update(fields)
+        return type('DynamicModel_' + str(DynamicModel._next_id), (base,), classdict)
+
+    def _add_field(self, field_type):
+        """
+        Moves model to shape with new field.
+        """
+        cls = self.__class__
+        key = (field_type.name, get_field_signature(field_type))
+        try:
+            shape = cls.__shape_transitions__[key]
+        except KeyError:
+            shape = cls.__shape_transitions__[key] = self._new_shape(cls, {field_type.name: field_type})
+        self.__class__ = shape
 
     def _define_new_field_by_value(self, name, value):
         field_type = self._get_field_type(name, value)
 
         if not field_type:
             return False
-        self.__structure__[field_type.name] = field_type
-        setattr(self.__class__, name, field_type)
+        self._add_field(field_type)
         return True
 
     def __setattr__(self, name, value):
@@ -876,12 +1700,44 @@ class DynamicModel(BaseDynamicModel):
 
     def __reduce__(self):
         """
-        Reduce function to allow dumpable by pickle
+        Reduce function to allow dumpable by pickle. Fields are referenced by a schema shared by every
+        model of same shape.
         """
-        return recover_dynamic_model_from_data, (DynamicModel, self.__original_data__,
-                                                 self.__modified_data__, self.__deleted_fields__,
-                                                 {field.name: (field.__class__, field.export_definition())
-                                                  for field in self.__structure__.values()})
+        cls = self.__class__
+        try:
+            schema = cls.__dict__['__field_schema__']
+        except KeyError:
+            schema = cls.__field_schema__ = FieldSchema.from_fields(cls.__structure__.values())
+
+        return recover_dynamic_model_from_packed_data, (self._get_model_class(), schema) + pack_model_data(self)
+
+    @classmethod
+    def _get_model_class(cls):
+        """
+        Returns declared class of model, instead of its shape class.
+        """
+        return next(c for c in cls.__mro__ if '__shape_transitions__' not in c.__dict__)
+
+    @staticmethod
+    def _build_shape(model_class, schema):
+        """
+        Returns shape class of a model class with fields of a schema.
+        """
+        model = model_class._new_empty()
+        for field in schema.get_fields():
+            if not model.get_field_obj(field.name):
+                model._add_field(field)
+        return model.__class__
+
+
+def recover_dynamic_model_from_packed_data(model_class, schema, *data):
+    """
+    Function to reconstruct a dynamic model from a field schema and data packed by
+    :func:`pack_model_data`. Shape class is looked up once per schema.
+    Necessary for pickle an object
+    """
+    shape = schema.get_class(model_class, DynamicModel._build_shape)
+    return unpack_model_data(shape._new_empty(), *data)
 
 
 def recover_hashmap_model_from_data(model_class, original_data, modified_data, deleted_data, field_type):
@@ -894,6 +1750,15 @@ def recover_hashmap_model_from_data(model_class, original_data, modified_data, d
     return set_model_internal_data(model, original_data, modified_data, deleted_data)
 
 
+def recover_hashmap_model_from_packed_data(model_class, schema, *data):
+    """
+    Function to reconstruct a hash map model from a schema of its field type and data packed by
+    :func:`pack_model_data`.
+    Necessary for pickle an object
+    """
+    return unpack_model_data(model_class._new_empty(field_type=schema.get_fields()[0]), *data)
+
+
 class HashMapModel(InnerFieldTypeMixin, BaseModel):
     """
     Hash map model with dirty feature. It stores original data and saves
@@ -904,10 +1769,9 @@ class HashMapModel(InnerFieldTypeMixin, BaseModel):
         """
         Reduce function to allow dumpable by pickle
         """
-        return recover_hashmap_model_from_data, (self.__class__, self.__original_data__,
-                                                 self.__modified_data__, self.__deleted_fields__,
-                                                 (self.get_field_type().__class__,
-                                                  self.get_field_type().export_definition()))
+        return recover_hashmap_model_from_packed_data, ((self.__class__,
+                                                         FieldSchema.from_fields([self.get_field_type()])) +
+                                                        pack_model_data(self))
 
     def get_real_name(self, name):
         obj = self.get_field_obj(name)
@@ -923,26 +1787,23 @@ class HashMapModel(InnerFieldTypeMixin, BaseModel):
     def get_field_obj(self, name):
         return super(HashMapModel, self).get_field_obj(name) or self.get_field_type()
 
-    def copy(self):
-        """
-        Creates a copy of model
-        """
-        return self.__class__(field_type=self.get_field_type(), data=self.export_data())
+    def _new_copy(self):
+        return self._new_empty(field_type=self.get_field_type())
 
     def get_validated_object(self, value):
         """
         Returns the value validated by the field_type
         """
         try:
-            if self.get_field_type().check_value(value) or self.get_field_type().can_use_value(value):
-                data = self.get_field_type().use_value(value)
-                self._prepare_child(data)
-                return data
-            else:
-                return None
+            data = self.get_field_type().get_converter(type(value))(value)
         except AttributeError:
             return value
 
+        if data is UNUSABLE:
+            return None
+        self._prepare_child(data)
+        return data
+
     def _import_data(self, data):
         """
         Set the fields in data to the hashmap instance.
@@ -1007,6 +1868,17 @@ def recover_fast_dynamic_model_from_data(model_class, original_data, modified_da
     return set_model_internal_data(model, original_data, modified_data, deleted_data)
 
 
+def recover_fast_dynamic_model_from_packed_data(model_class, schema, *data):
+    """
+    Function to reconstruct a model from a schema of its fields and data packed by
+    :func:`pack_model_data`.
+    Necessary for pickle an object
+    """
+    model = model_class._new_empty()
+    model.__field_types__ = {field.name: field for field in schema.get_fields()}
+    return unpack_model_data(model, *data)
+
+
 class FastDynamicModel(BaseDynamicModel):
     """
     FastDynamicModel allow to create model with no structure.
@@ -1044,6 +1916,11 @@ class FastDynamicModel(BaseDynamicModel):
         struct.update(self.__field_types__)
         return struct
 
+    def _new_copy(self):
+        model = self._new_empty()
+        model.__field_types__ = self.__field_types__.copy()
+        return model
+
     def _define_new_field_by_value(self, name, value):
         field_type = self._get_field_type(name, value)
 
@@ -1104,7 +1981,6 @@ class FastDynamicModel(BaseDynamicModel):
         """
         Reduce function to allow dumpable by pickle
         """
-        return recover_fast_dynamic_model_from_data, (self.__class__, self.__original_data__,
-                                                      self.__modified_data__, self.__deleted_fields__,
-                                                      {field.name: (field.__class__, field.export_definition())
-                                                       for field in self.__field_types__.values()})
+        return recover_fast_dynamic_model_from_packed_data, ((self.__class__,
+                                                              FieldSchema.from_fields(self.__field_types__.values())) +
+                                                             pack_model_data(self))
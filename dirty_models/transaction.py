@@ -0,0 +1,146 @@
+"""
+Transactions for dirty models.
+
+A transaction is started on a root model using :meth:`~dirty_models.models.BaseModel.transaction`. Before
+a model or a list inside model tree is written for first time, its current state is saved on an undo log:
+a single field for field writes, or references to its data containers for operations on whole model or
+list. So, cost of a transaction depends on how many values were written, not on tree size.
+
+Transactions could be nested using savepoints. Rolling back a savepoint restores tree as it was when
+savepoint was created.
+"""
+
+__all__ = ['Transaction', 'Savepoint']
+
+
+class Transaction:
+    """
+    Undo log of changes made on a model tree. It is active meanwhile it has savepoints.
+    """
+
+    def __init__(self, root):
+        """
+        :param root: Root model.
+        :type root: dirty_models.models.BaseModel
+        """
+        self.root = root
+        self._log = []
+        self._seen = set()
+        self._savepoints = []
+        self._rolling_back = False
+
+    def record(self, node, key, op, value=None):
+        """
+        Saves state of a field, or a whole model or list when key is ``None``, before it is written.
+        State is saved only once for each field since last savepoint.
+
+        :param node: Model or list which is going to be written.
+        :param key: Field name, or ``None`` for operations on whole model or list.
+        :param op: Operation name.
+        :param value: Value to write.
+        """
+        if self._rolling_back or (id(node), None) in self._seen:
+            return
+
+        entry_key = (id(node), key)
+        if entry_key in self._seen:
+            return
+
+        self._seen.add(entry_key)
+        self._log.append((node, key, node._save_undo(key)))
+
+    def __len__(self):
+        return len(self._log)
+
+    def is_active(self):
+        """
+        Returns whether transaction has savepoints.
+        """
+        return bool(self._savepoints)
+
+    def savepoint(self):
+        """
+        Creates a new savepoint.
+
+        :return: Savepoint
+        :rtype: Savepoint
+        """
+        savepoint = Savepoint(self, len(self._log), self._seen)
+        self._seen = set()
+        self._savepoints.append(savepoint)
+        return savepoint
+
+    def rollback(self, savepoint):
+        """
+        Undoes every change made since savepoint was created. Savepoint is still active.
+
+        :param savepoint: Savepoint of transaction.
+        :type savepoint: Savepoint
+        """
+        self._check_savepoint(savepoint)
+        del self._savepoints[self._savepoints.index(savepoint) + 1:]
+
+        self._rolling_back = True
+        try:
+            for node, key, saved in reversed(self._log[savepoint.position:]):
+                node._undo(key, saved)
+        finally:
+            self._rolling_back = False
+
+        del self._log[savepoint.position:]
+        self._seen = set()
+
+    def release(self, savepoint):
+        """
+        Releases a savepoint and every savepoint created after it. Changes are kept. Releasing first
+        savepoint ends transaction.
+
+        :param savepoint: Savepoint of transaction.
+        :type savepoint: Savepoint
+        """
+        self._check_savepoint(savepoint)
+        index = self._savepoints.index(savepoint)
+        for released in reversed(self._savepoints[index:]):
+            self._seen |= released.seen
+
+        del self._savepoints[index:]
+        if not self._savepoints:
+            self._log = []
+            self._seen = set()
+            self.root._end_transaction(self)
+
+    def _check_savepoint(self, savepoint):
+        if savepoint not in self._savepoints:
+            raise RuntimeError('Savepoint is not active')
+
+
+class Savepoint:
+    """
+    Savepoint of a transaction. It could be used as a context manager: changes made inside block are rolled
+    back if an exception is raised, and savepoint is released when block ends.
+    """
+
+    def __init__(self, transaction, position, seen):
+        self.transaction = transaction
+        self.position = position
+        self.seen = seen
+
+    def rollback(self):
+        """
+        Undoes every change made since savepoint was created.
+        """
+        self.transaction.rollback(self)
+
+    def release(self):
+        """
+        Releases savepoint, keeping changes.
+        """
+        self.transaction.release(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            self.rollback()
+        self.release()
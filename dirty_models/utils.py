@@ -4,7 +4,7 @@ from datetime import date, datetime, time, timedelta
 from enum import Enum
 from json.encoder import JSONEncoder as BaseJSONEncoder
 
-from .base import AccessMode
+from .base import AccessMode, BaseData, copy_exported, get_access_modes_version
 from .fields import MultiTypeField
 from .model_types import ListModel
 from .models import BaseModel
@@ -66,6 +66,18 @@ class BaseFormatterIter:
     def format(self):  # pragma: no cover
         pass
 
+    def _format(self):
+        """
+        Returns formatted data which could be shared, so it must not be modified.
+        """
+        return self.format()
+
+    def _get_memo_key(self):
+        """
+        Returns key of memoized formatted data, or ``None`` when it must not be memoized.
+        """
+        return None
+
 
 class BaseFieldtypeFormatterIter(BaseFormatterIter):
 
@@ -82,7 +94,28 @@ class ListFormatterIter(BaseFieldtypeFormatterIter):
             yield self.parent_formatter.format_field(self.field, item)
 
     def format(self):
-        return list(self)
+        return copy_exported(self._format())
+
+    def _format(self):
+        if isinstance(self.obj, BaseData):
+            key = self._get_memo_key()
+            if key is not None:
+                return self.obj._get_memoized(key, self._build)
+        return self._build()
+
+    def _get_memo_key(self):
+        """
+        Formatted lists are memoized by formatter classes, unless formatters are not stock ones or have
+        their own options.
+        """
+        parent_key = self.parent_formatter._get_memo_key()
+        if parent_key is None or self.__class__.__iter__ is not ListFormatterIter.__iter__ \
+                or self.__dict__.keys() != {'obj', 'field', 'parent_formatter'}:
+            return None
+        return self.__class__, parent_key
+
+    def _build(self):
+        return [v._format() if isinstance(v, BaseFormatterIter) else v for v in self]
 
 
 class BaseModelFormatterIter(BaseModelIterator, BaseFormatterIter):
@@ -91,12 +124,50 @@ class BaseModelFormatterIter(BaseModelIterator, BaseFormatterIter):
     """
 
     def __iter__(self):
-        for name, field, value in super(BaseModelFormatterIter, self).__iter__():
-            if self.must_to_skip(name, field, value):
-                continue
+        plan = self._get_format_plan()
+        if plan is None:
+            for name, field, value in super(BaseModelFormatterIter, self).__iter__():
+                if self.must_to_skip(name, field, value):
+                    continue
+
+                yield name, self.format_field(field, value)
+            return
+
+        model = self.model
+        override_field_access_modes = model.__override_field_access_modes__
+        hidden = AccessMode.HIDDEN
+        for key in model.get_fields():
+            try:
+                name, field = plan[key]
+            except KeyError:
+                name, field = plan[key] = model.get_real_name(key), model.get_field_obj(key)
+
+            # Access modes could be changed at any time, so they are not planned
+            am = field.access_mode
+            if override_field_access_modes:
+                am = override_field_access_modes.get(name, am)
+            if am != hidden:
+                yield name, self.format_field(field, model.get_field_value(key))
+
+    def _get_format_plan(self):
+        """
+        Returns a dictionary which maps stored field names of model class to their real names and fields.
+        It is filled as fields are found and it is shared by every model of class. Models which resolve
+        fields by instance and formatters which skip fields in their own way have no plan.
+        """
+        model_class = self.model.__class__
+        try:
+            return model_class.__format_plans__[self.__class__]
+        except KeyError:
+            pass
 
-            yield name, self.format_field(field,
-                                          self.model.get_field_value(name))
+        plan = None
+        if self.__class__.must_to_skip is BaseModelFormatterIter.must_to_skip \
+                and getattr(model_class.get_field_obj, '__func__', None) is BaseModel.get_field_obj.__func__ \
+                and model_class.get_real_name is BaseModel.get_real_name:
+            plan = {}
+        model_class.__format_plans__[self.__class__] = plan
+        return plan
 
     def must_to_skip(self, name, field, value):
         am = field.access_mode
@@ -118,12 +189,40 @@ class BaseModelFormatterIter(BaseModelIterator, BaseFormatterIter):
         elif isinstance(value, ListModel):
             return ListFormatterIter(obj=value, field=value.get_field_type(), parent_formatter=self)
         elif isinstance(value, Enum):
+            if type(value.value) in PLAIN_VALUE_TYPES and type(self).format_field in PLAIN_VALUE_FORMATTERS:
+                return value.value
             return self.format_field(field, value.value)
 
         return value
 
     def format(self):
-        return {k: v.format() if isinstance(v, BaseFormatterIter) else v for k, v in self}
+        """
+        Returns formatted data. It is memoized until model is written or any field access mode changes.
+        """
+        return copy_exported(self._format())
+
+    def _format(self):
+        key = self._get_memo_key()
+        if key is None:
+            return self._build()
+        return self.model._get_memoized(key, self._build)
+
+    def _get_memo_key(self):
+        """
+        Formatted models are memoized by formatter class and version of access modes. Only formatters
+        which skip, format and iterate fields in stock way and have no attribute but model are memoized,
+        because results of other ones could depend on anything else.
+        """
+        cls = self.__class__
+        if cls.must_to_skip is not BaseModelFormatterIter.must_to_skip \
+                or cls.__iter__ is not BaseModelFormatterIter.__iter__ \
+                or cls.format_field not in PLAIN_VALUE_FORMATTERS \
+                or self.__dict__.keys() != {'model'}:
+            return None
+        return cls, get_access_modes_version()
+
+    def _build(self):
+        return {k: v._format() if isinstance(v, BaseFormatterIter) else v for k, v in self}
 
 
 class ModelFormatterIter(BaseModelFormatterIter):
@@ -139,10 +238,21 @@ class ModelFormatterIter(BaseModelFormatterIter):
                 return str(value)
         elif isinstance(value, timedelta):
             return value.total_seconds()
+        elif isinstance(value, Enum) and type(value.value) in PLAIN_VALUE_TYPES \
+                and type(self).format_field in PLAIN_VALUE_FORMATTERS:
+            return value.value
 
         return super(ModelFormatterIter, self).format_field(field, value)
 
 
+#: Types of enumeration values which are formatted as they are.
+PLAIN_VALUE_TYPES = frozenset((str, int, float, bool, type(None)))
+
+#: Field formatting methods which are known to format plain values as they are, so enumeration values
+#: of plain types are exported directly by them.
+PLAIN_VALUE_FORMATTERS = frozenset((BaseModelFormatterIter.format_field, ModelFormatterIter.format_field))
+
+
 class JSONEncoder(BaseJSONEncoder):
     """
     Json encoder for Dirty Models
@@ -154,7 +264,7 @@ class JSONEncoder(BaseJSONEncoder):
         if isinstance(obj, BaseModel):
             return self.default(self.default_model_iter(obj))
         elif isinstance(obj, BaseFormatterIter):
-            return obj.format()
+            return obj._format()
         else:
             return super(JSONEncoder, self).default(obj)
 
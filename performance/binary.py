@@ -0,0 +1,64 @@
+'''
+Encoding and decoding models with 100k fields using binary codec, pickle and JSON encoder. Every
+document is encoded from a model which was never exported before, and every decoded model is exported.
+'''
+import json
+import pickle
+
+from dirty_models.binary import decode, encode
+from dirty_models.utils import JSONEncoder
+from performance.diff import DiffModel, create_data
+
+
+class BinaryEncodePerformance:
+
+    def __init__(self, groups=100, items=100, repeats=5):
+        self.groups = groups
+        self.items = items
+        self.repeats = repeats
+
+    def prepare(self):
+        data = create_data(self.groups, self.items)
+        self.models = [DiffModel(data=data, flat=True) for _ in range(self.repeats)]
+
+    def encode(self, model):
+        return encode(model)
+
+    def run(self):
+        self.encode(self.models.pop())
+
+
+class PickleEncodePerformance(BinaryEncodePerformance):
+
+    def encode(self, model):
+        return pickle.dumps(model)
+
+
+class JSONEncodePerformance(BinaryEncodePerformance):
+
+    def encode(self, model):
+        return json.dumps(model, cls=JSONEncoder)
+
+
+class BinaryDecodePerformance(BinaryEncodePerformance):
+
+    def prepare(self):
+        self.data = self.encode(DiffModel(data=create_data(self.groups, self.items), flat=True))
+
+    def decode(self, data):
+        return decode(DiffModel, data)
+
+    def run(self):
+        self.decode(self.data).export_data()
+
+
+class PickleDecodePerformance(BinaryDecodePerformance, PickleEncodePerformance):
+
+    def decode(self, data):
+        return pickle.loads(data)
+
+
+class JSONDecodePerformance(BinaryDecodePerformance, JSONEncodePerformance):
+
+    def decode(self, data):
+        return DiffModel(data=json.loads(data), flat=True)
@@ -0,0 +1,61 @@
+'''
+Field conversion cost: 10k models imported from strings, numbers and enumerations, and 10k writes of
+values which need a conversion.
+'''
+from enum import Enum
+
+from dirty_models.fields import ArrayField, BooleanField, EnumField, FloatField, IntegerField, ModelField, \
+    MultiTypeField, StringField, TimedeltaField
+from dirty_models.models import BaseModel
+
+
+class ConversionEnum(Enum):
+    value_1 = 1
+    value_2 = 'two'
+
+
+class ConversionItemModel(BaseModel):
+    integer = IntegerField()
+    string = StringField()
+
+
+class ConversionModel(BaseModel):
+    integer = IntegerField()
+    float = FloatField()
+    boolean = BooleanField()
+    string = StringField()
+    timedelta = TimedeltaField()
+    enum = EnumField(enum_class=ConversionEnum)
+    multi = MultiTypeField(field_types=[IntegerField(), StringField()])
+    integers = ArrayField(field_type=IntegerField())
+    items = ArrayField(field_type=ModelField(model_class=ConversionItemModel))
+
+
+def create_data(i):
+    return {'integer': str(i),
+            'float': i,
+            'boolean': 'yes',
+            'string': i / 2,
+            'timedelta': i,
+            'enum': 'two',
+            'multi': str(i),
+            'integers': [str(i), i / 2, ConversionEnum.value_1],
+            'items': [{'integer': i, 'string': 'foo'}, {'integer': '1', 'string': i}]}
+
+
+class ConversionPerformance:
+
+    def __init__(self, count=10000):
+        self.count = count
+
+    def prepare(self):
+        self.data = [create_data(i) for i in range(self.count)]
+
+    def run(self):
+        models = [ConversionModel(data) for data in self.data]
+        model = models[0]
+        for i in range(self.count):
+            model.integer = '1'
+            model.enum = 1
+            model.string = ConversionEnum.value_2
+        return models
@@ -0,0 +1,38 @@
+'''
+Formatting 10k models with three timestamps each, many of them identical, with and without format cache.
+'''
+from datetime import datetime, timedelta
+
+from dirty_models.fields import DateField, DateTimeField
+from dirty_models.models import BaseModel
+from dirty_models.utils import ModelFormatterIter
+
+
+class DateFormatModel(BaseModel):
+    created_at = DateTimeField(parse_format='%Y-%m-%dT%H:%M:%SZ')
+    day = DateField(parse_format='%d/%m/%Y')
+    bucket = DateTimeField(parse_format='%Y-%m-%d %H:00')
+
+
+class CachedDateFormatModel(BaseModel):
+    created_at = DateTimeField(parse_format='%Y-%m-%dT%H:%M:%SZ', format_cache_size=1024)
+    day = DateField(parse_format='%d/%m/%Y', format_cache_size=1024)
+    bucket = DateTimeField(parse_format='%Y-%m-%d %H:00', format_cache_size=1024)
+
+
+class DateFormatPerformance:
+
+    def __init__(self, count=10000, cached=False):
+        self.count = count
+        self.model_class = CachedDateFormatModel if cached else DateFormatModel
+
+    def prepare(self):
+        start = datetime(2020, 1, 1)
+        self.models = []
+        for i in range(self.count):
+            value = start + timedelta(minutes=i // 10)
+            self.models.append(self.model_class(data={'created_at': value, 'day': value.date(),
+                                                      'bucket': value.replace(minute=0)}))
+
+    def run(self):
+        return [ModelFormatterIter(model).format() for model in self.models]
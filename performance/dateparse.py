@@ -0,0 +1,30 @@
+'''
+Parsing 100k RFC 3339 timestamps, 1k distinct ones, on a datetime field with and without parse cache.
+'''
+from dirty_models.fields import DateTimeField
+from dirty_models.models import BaseModel
+
+
+class DateParseModel(BaseModel):
+    created_at = DateTimeField()
+    updated_at = DateTimeField(parse_cache_size=1024)
+
+
+class DateParsePerformance:
+
+    def __init__(self, count=100000, distinct=1000, field_name='created_at'):
+        self.count = count
+        self.distinct = distinct
+        self.field_name = field_name
+
+    def prepare(self):
+        self.values = ['2020-01-{0:02d}T{1:02d}:{2:02d}:00.123Z'.format(i % 28 + 1, i % 24, i % 60)
+                       for i in range(self.distinct)] * (self.count // self.distinct)
+        self.model = DateParseModel()
+
+    def run(self):
+        model = self.model
+        field_name = self.field_name
+        for value in self.values:
+            setattr(model, field_name, value)
+        return model
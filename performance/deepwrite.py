@@ -0,0 +1,35 @@
+'''
+Write cost on leaf models of deep trees. It must not depend on depth.
+'''
+from dirty_models.models import BaseModel
+from dirty_models.fields import IntegerField, ModelField
+
+
+class DeepModel(BaseModel):
+    value = IntegerField()
+    child = ModelField()
+
+
+def create_deep_model(depth):
+    model = DeepModel()
+    leaf = model
+    for i in range(depth):
+        leaf.child = {}
+        leaf = leaf.child
+    return model, leaf
+
+
+class DeepWritePerformance:
+
+    def __init__(self, depth=5, writes=10000):
+        self.depth = depth
+        self.writes = writes
+
+    def prepare(self):
+        self.model, self.leaf = create_deep_model(self.depth)
+
+    def run(self):
+        leaf = self.leaf
+        for i in range(self.writes):
+            leaf.value = i
+        return self.model
@@ -0,0 +1,55 @@
+'''
+Diff of models with 100k fields: a copy with a few changes and a model built from same data with a few
+changes.
+'''
+from dirty_models.models import BaseModel
+from dirty_models.fields import ArrayField, IntegerField, ModelField, StringField
+
+
+class DiffItemModel(BaseModel):
+    field_1 = IntegerField()
+    field_2 = IntegerField()
+    field_3 = IntegerField()
+    field_4 = IntegerField()
+    field_5 = IntegerField()
+    field_6 = StringField()
+    field_7 = StringField()
+    field_8 = StringField()
+    field_9 = StringField()
+    field_10 = StringField()
+
+
+class DiffGroupModel(BaseModel):
+    items = ArrayField(field_type=ModelField(model_class=DiffItemModel))
+
+
+class DiffModel(BaseModel):
+    groups = ArrayField(field_type=ModelField(model_class=DiffGroupModel))
+
+
+def create_data(groups, items):
+    return {'groups': [{'items': [{'field_{0}'.format(i): (i * j if i <= 5 else str(i * j))
+                                   for i in range(1, 11)}
+                                  for j in range(items)]}
+                       for k in range(groups)]}
+
+
+class DiffPerformance:
+
+    def __init__(self, groups=100, items=100, changes=10):
+        self.groups = groups
+        self.items = items
+        self.changes = changes
+
+    def prepare(self):
+        data = create_data(self.groups, self.items)
+        self.model = DiffModel(data=data, flat=True)
+
+        self.copy = self.model.copy()
+        self.other = DiffModel(data=data, flat=True)
+        for i in range(self.changes):
+            self.copy.groups[i].items[i].field_1 = -1
+            self.other.groups[i].items[i].field_1 = -1
+
+    def run(self):
+        return self.model.diff(self.copy), self.model.diff(self.other)
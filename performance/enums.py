@@ -0,0 +1,46 @@
+'''
+Enumeration fields: 10k models imported from member names, values and members, and formatted afterwards.
+'''
+from enum import Enum
+
+from dirty_models.fields import ArrayField, EnumField
+from dirty_models.models import BaseModel
+from dirty_models.utils import ModelFormatterIter
+
+
+class StatusEnum(Enum):
+    pending = 'PENDING'
+    running = 'RUNNING'
+    done = 'DONE'
+    failed = 'FAILED'
+
+
+class PriorityEnum(Enum):
+    low = 1
+    normal = 2
+    high = 3
+
+
+class EnumModel(BaseModel):
+    status = EnumField(enum_class=StatusEnum)
+    priority = EnumField(enum_class=PriorityEnum)
+    history = ArrayField(field_type=EnumField(enum_class=StatusEnum))
+
+
+def create_data(i):
+    return {'status': ['pending', 'RUNNING', StatusEnum.done, 'failed'][i % 4],
+            'priority': ['low', 2, 'high'][i % 3],
+            'history': ['pending', 'running', 'DONE']}
+
+
+class EnumPerformance:
+
+    def __init__(self, count=10000):
+        self.count = count
+
+    def prepare(self):
+        self.data = [create_data(i) for i in range(self.count)]
+
+    def run(self):
+        models = [EnumModel(data) for data in self.data]
+        return [ModelFormatterIter(model).format() for model in models]
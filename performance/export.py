@@ -0,0 +1,31 @@
+'''
+Exporting a model with 100k fields again and again, writing a single field between exports.
+'''
+import json
+
+from dirty_models.utils import JSONEncoder
+from performance.diff import DiffModel, create_data
+
+
+class ExportPerformance:
+
+    def __init__(self, groups=100, items=100, exports=10):
+        self.groups = groups
+        self.items = items
+        self.exports = exports
+
+    def prepare(self):
+        self.model = DiffModel(data=create_data(self.groups, self.items), flat=True)
+
+    def run(self):
+        for i in range(self.exports):
+            self.model.groups[i % self.groups].items[i % self.items].field_1 = -i
+            self.model.export_data()
+
+
+class JSONExportPerformance(ExportPerformance):
+
+    def run(self):
+        for i in range(self.exports):
+            self.model.groups[i % self.groups].items[i % self.items].field_1 = -i
+            json.dumps(self.model, cls=JSONEncoder)
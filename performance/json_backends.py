@@ -0,0 +1,34 @@
+'''
+Encoding models with 100k fields as JSON documents, using standard JSON encoder and available JSON
+backends. Every document is encoded from a model which was never exported before.
+'''
+import json
+
+from dirty_models.json_backends import dumps
+from dirty_models.utils import JSONEncoder
+from performance.diff import DiffModel, create_data
+
+
+class JSONEncoderPerformance:
+
+    def __init__(self, groups=100, items=100, repeats=5):
+        self.groups = groups
+        self.items = items
+        self.repeats = repeats
+
+    def prepare(self):
+        data = create_data(self.groups, self.items)
+        self.models = [DiffModel(data=data, flat=True) for _ in range(self.repeats)]
+
+    def run(self):
+        json.dumps(self.models.pop(), cls=JSONEncoder)
+
+
+class JSONBackendPerformance(JSONEncoderPerformance):
+
+    def __init__(self, backend=None, **kwargs):
+        super(JSONBackendPerformance, self).__init__(**kwargs)
+        self.backend = backend
+
+    def run(self):
+        dumps(self.models.pop(), backend=self.backend)
@@ -0,0 +1,35 @@
+'''
+Writing models with 100k fields as JSON documents to a file, using standard JSON encoder and streaming
+JSON writer. Every document is written from a model which was never exported before.
+'''
+import json
+import os
+
+from dirty_models.json_stream import dump
+from dirty_models.utils import JSONEncoder
+from performance.diff import DiffModel, create_data
+
+
+class JSONDumpPerformance:
+
+    def __init__(self, groups=100, items=100, repeats=5):
+        self.groups = groups
+        self.items = items
+        self.repeats = repeats
+
+    def prepare(self):
+        data = create_data(self.groups, self.items)
+        self.models = [DiffModel(data=data, flat=True) for _ in range(self.repeats)]
+
+    def dump(self, model, fp):
+        json.dump(model, fp, cls=JSONEncoder)
+
+    def run(self):
+        with open(os.devnull, 'w') as fp:
+            self.dump(self.models.pop(), fp)
+
+
+class JSONWriterPerformance(JSONDumpPerformance):
+
+    def dump(self, model, fp):
+        dump(model, fp)
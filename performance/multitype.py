@@ -0,0 +1,48 @@
+'''
+Multiple type fields: 10k models imported with values of several types, and formatted afterwards.
+'''
+from datetime import datetime, timedelta
+from enum import Enum
+
+from dirty_models.fields import ArrayField, DateTimeField, EnumField, FloatField, IntegerField, ModelField, \
+    MultiTypeField, StringField
+from dirty_models.models import BaseModel
+from dirty_models.utils import ModelFormatterIter
+
+
+class MultiTypeEnum(Enum):
+    value_1 = 'one'
+    value_2 = 'two'
+
+
+class MultiTypeItemModel(BaseModel):
+    name = StringField()
+
+
+class MultiTypeModel(BaseModel):
+    value = MultiTypeField(field_types=[IntegerField(), FloatField(), StringField(),
+                                        DateTimeField(parse_format='%Y-%m-%d %H:%M')])
+    item = MultiTypeField(field_types=[ArrayField(field_type=StringField()),
+                                       ModelField(model_class=MultiTypeItemModel),
+                                       EnumField(enum_class=MultiTypeEnum)])
+
+
+def create_data(i):
+    start = datetime(2020, 1, 1)
+    return [{'value': i, 'item': {'name': 'foo'}},
+            {'value': i / 2, 'item': MultiTypeEnum.value_1},
+            {'value': start + timedelta(minutes=i), 'item': MultiTypeItemModel(data={'name': 'bar'})},
+            {'value': 'foo', 'item': {'name': 'baz'}}][i % 4]
+
+
+class MultiTypePerformance:
+
+    def __init__(self, count=10000):
+        self.count = count
+
+    def prepare(self):
+        self.data = [create_data(i) for i in range(self.count)]
+
+    def run(self):
+        models = [MultiTypeModel(data) for data in self.data]
+        return [ModelFormatterIter(model).format() for model in models]
@@ -0,0 +1,22 @@
+'''
+Applying a change set with 10k dotted paths on a model with 100k fields.
+'''
+from performance.diff import DiffModel, create_data
+
+
+class PatchPerformance:
+
+    def __init__(self, groups=100, items=100, changes=10000):
+        self.groups = groups
+        self.items = items
+        self.changes = changes
+
+    def prepare(self):
+        self.model = DiffModel(data=create_data(self.groups, self.items), flat=True)
+        self.modifications = {'groups.{0}.items.{1}.field_1'.format(i % self.groups, i // self.groups): -i
+                              for i in range(self.changes)}
+        self.deleted = ['groups.{0}.items.{1}.field_6'.format(i % self.groups, i // self.groups)
+                        for i in range(self.changes)]
+
+    def run(self):
+        self.model.apply_modifications(self.modifications, deleted=self.deleted)
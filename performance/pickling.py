@@ -0,0 +1,28 @@
+'''
+Pickling 10k dynamic models with same shape and 10k typed lists. Fields are stored once per dump.
+'''
+import pickle
+
+from dirty_models.fields import IntegerField
+from dirty_models.model_types import ListModel
+from dirty_models.models import DynamicModel
+
+
+class PickleDynamicModelsPerformance:
+
+    def __init__(self, count=10000):
+        self.count = count
+
+    def prepare(self):
+        self.models = [DynamicModel(data={'id': i, 'name': 'model {0}'.format(i), 'value': i / 2,
+                                          'inner': {'tags': ['a', 'b']}})
+                       for i in range(self.count)]
+
+    def run(self):
+        return len(pickle.loads(pickle.dumps(self.models)))
+
+
+class PickleListModelsPerformance(PickleDynamicModelsPerformance):
+
+    def prepare(self):
+        self.models = [ListModel([i, i + 1], field_type=IntegerField()) for i in range(self.count)]
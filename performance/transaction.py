@@ -0,0 +1,33 @@
+'''
+Rolling back a few writes on a model with 100k fields: using a transaction and restoring a copy
+made by exporting data.
+'''
+from performance.diff import DiffModel, create_data
+
+
+class TransactionPerformance:
+
+    def __init__(self, groups=100, items=100, changes=100):
+        self.groups = groups
+        self.items = items
+        self.changes = changes
+
+    def prepare(self):
+        self.model = DiffModel(data=create_data(self.groups, self.items), flat=True)
+
+    def run(self):
+        with self.model.transaction() as savepoint:
+            for i in range(self.changes):
+                self.model.groups[i % self.groups].items[i % self.items].field_1 = -i
+            self.model.groups[0].items.append({'field_1': -1})
+            savepoint.rollback()
+
+
+class ExportRollbackPerformance(TransactionPerformance):
+
+    def run(self):
+        data = self.model.export_data()
+        for i in range(self.changes):
+            self.model.groups[i % self.groups].items[i % self.items].field_1 = -i
+        self.model.groups[0].items.append({'field_1': -1})
+        self.model = DiffModel(data=data, flat=True)
@@ -7,6 +7,21 @@ from performance import Runner
 from performance.dynamicmodel import DynamicModelPerformance
 from performance.blobfield import BlobFieldPerformance
 from performance.fastdynamicmodel import FastDynamicModelPerformance
+from performance.deepwrite import DeepWritePerformance
+from performance.diff import DiffPerformance
+from performance.patch import PatchPerformance
+from performance.transaction import ExportRollbackPerformance, TransactionPerformance
+from performance.export import ExportPerformance, JSONExportPerformance
+from performance.json_writer import JSONDumpPerformance, JSONWriterPerformance
+from performance.json_backends import JSONBackendPerformance, JSONEncoderPerformance
+from performance.binary import BinaryDecodePerformance, BinaryEncodePerformance, JSONDecodePerformance, \
+    JSONEncodePerformance, PickleDecodePerformance, PickleEncodePerformance
+from performance.pickling import PickleDynamicModelsPerformance, PickleListModelsPerformance
+from performance.conversion import ConversionPerformance
+from performance.dateparse import DateParsePerformance
+from performance.dateformat import DateFormatPerformance
+from performance.multitype import MultiTypePerformance
+from performance.enums import EnumPerformance
 
 config = {'DynamicModel': {'test_class': DynamicModelPerformance,
                            'repeats': 5,
@@ -16,7 +31,91 @@ config = {'DynamicModel': {'test_class': DynamicModelPerformance,
                         'params': {'depth': 6, 'children_count': 6}},
           'FastDynamicModel': {'test_class': FastDynamicModelPerformance,
                                'repeats': 5,
-                               'params': {'depth': 6, 'children_count': 6}}}
+                               'params': {'depth': 6, 'children_count': 6}},
+          'DeepWrite(depth=2)': {'test_class': DeepWritePerformance,
+                                 'repeats': 5,
+                                 'params': {'depth': 2, 'writes': 20000}},
+          'DeepWrite(depth=64)': {'test_class': DeepWritePerformance,
+                                  'repeats': 5,
+                                  'params': {'depth': 64, 'writes': 20000}},
+          'Diff': {'test_class': DiffPerformance,
+                   'repeats': 5,
+                   'params': {'groups': 100, 'items': 100, 'changes': 10}},
+          'Patch': {'test_class': PatchPerformance,
+                    'repeats': 5,
+                    'params': {'groups': 100, 'items': 100, 'changes': 10000}},
+          'Transaction': {'test_class': TransactionPerformance,
+                          'repeats': 5,
+                          'params': {'groups': 100, 'items': 100, 'changes': 100}},
+          'ExportRollback': {'test_class': ExportRollbackPerformance,
+                             'repeats': 5,
+                             'params': {'groups': 100, 'items': 100, 'changes': 100}},
+          'Export': {'test_class': ExportPerformance,
+                     'repeats': 5,
+                     'params': {'groups': 100, 'items': 100, 'exports': 10}},
+          'JSONExport': {'test_class': JSONExportPerformance,
+                         'repeats': 5,
+                         'params': {'groups': 100, 'items': 100, 'exports': 10}},
+          'JSONDump': {'test_class': JSONDumpPerformance,
+                       'repeats': 5,
+                       'params': {'groups': 100, 'items': 100, 'repeats': 5}},
+          'JSONWriter': {'test_class': JSONWriterPerformance,
+                         'repeats': 5,
+                         'params': {'groups': 100, 'items': 100, 'repeats': 5}},
+          'JSONEncoder': {'test_class': JSONEncoderPerformance,
+                          'repeats': 5,
+                          'params': {'groups': 100, 'items': 100, 'repeats': 5}},
+          'JSONBackend(stdlib)': {'test_class': JSONBackendPerformance,
+                                  'repeats': 5,
+                                  'params': {'groups': 100, 'items': 100, 'repeats': 5, 'backend': 'stdlib'}},
+          'JSONBackend': {'test_class': JSONBackendPerformance,
+                          'repeats': 5,
+                          'params': {'groups': 100, 'items': 100, 'repeats': 5}},
+          'BinaryEncode': {'test_class': BinaryEncodePerformance,
+                           'repeats': 5,
+                           'params': {'groups': 100, 'items': 100, 'repeats': 5}},
+          'PickleEncode': {'test_class': PickleEncodePerformance,
+                           'repeats': 5,
+                           'params': {'groups': 100, 'items': 100, 'repeats': 5}},
+          'JSONEncode': {'test_class': JSONEncodePerformance,
+                         'repeats': 5,
+                         'params': {'groups': 100, 'items': 100, 'repeats': 5}},
+          'BinaryDecode': {'test_class': BinaryDecodePerformance,
+                           'repeats': 5,
+                           'params': {'groups': 100, 'items': 100}},
+          'PickleDecode': {'test_class': PickleDecodePerformance,
+                           'repeats': 5,
+                           'params': {'groups': 100, 'items': 100}},
+          'JSONDecode': {'test_class': JSONDecodePerformance,
+                         'repeats': 5,
+                         'params': {'groups': 100, 'items': 100}},
+          'PickleDynamicModels': {'test_class': PickleDynamicModelsPerformance,
+                                  'repeats': 5,
+                                  'params': {'count': 10000}},
+          'PickleListModels': {'test_class': PickleListModelsPerformance,
+                               'repeats': 5,
+                               'params': {'count': 10000}},
+          'Conversion': {'test_class': ConversionPerformance,
+                         'repeats': 5,
+                         'params': {'count': 10000}},
+          'DateParse': {'test_class': DateParsePerformance,
+                        'repeats': 5,
+                        'params': {'count': 100000, 'distinct': 1000}},
+          'DateParse(cache)': {'test_class': DateParsePerformance,
+                               'repeats': 5,
+                               'params': {'count': 100000, 'distinct': 1000, 'field_name': 'updated_at'}},
+          'DateFormat': {'test_class': DateFormatPerformance,
+                         'repeats': 5,
+                         'params': {'count': 10000}},
+          'DateFormat(cache)': {'test_class': DateFormatPerformance,
+                                'repeats': 5,
+                                'params': {'count': 10000, 'cached': True}},
+          'MultiType': {'test_class': MultiTypePerformance,
+                        'repeats': 5,
+                        'params': {'count': 10000}},
+          'Enum': {'test_class': EnumPerformance,
+                   'repeats': 5,
+                   'params': {'count': 10000}}}
 
 if __name__ == '__main__':
 
@@ -0,0 +1,137 @@
+from datetime import date, datetime, time, timedelta, timezone
+from enum import Enum
+from unittest.case import TestCase
+
+from dirty_models.binary import decode, encode
+from dirty_models.fields import ArrayField, BlobField, BooleanField, BytesField, DateField, DateTimeField, \
+    EnumField, FloatField, HashMapField, IntegerField, ModelField, MultiTypeField, StringField, TimedeltaField, \
+    TimeField
+from dirty_models.model_types import ListModel
+from dirty_models.models import BaseModel, DynamicModel, HashMapModel
+
+
+class BinaryEnum(Enum):
+    value_1 = 1
+    value_2 = 'two'
+
+
+class BinaryInnerModel(BaseModel):
+    name = StringField()
+    date = DateTimeField()
+
+
+class BinaryModel(BaseModel):
+    integer = IntegerField()
+    float = FloatField()
+    string = StringField()
+    boolean = BooleanField()
+    bytes = BytesField()
+    datetime = DateTimeField()
+    date = DateField()
+    time = TimeField()
+    timedelta = TimedeltaField()
+    enum = EnumField(enum_class=BinaryEnum)
+    inner = ModelField(model_class=BinaryInnerModel)
+    inner_list = ArrayField(field_type=ModelField(model_class=BinaryInnerModel))
+    hash_map = HashMapField(field_type=EnumField(enum_class=BinaryEnum))
+    dynamic = ModelField(model_class=DynamicModel)
+    multi = MultiTypeField(field_types=[IntegerField(), EnumField(enum_class=BinaryEnum)])
+    matrix = ArrayField(field_type=ArrayField(field_type=IntegerField()))
+    blob = BlobField()
+
+
+class BinaryInnerSubModel(BinaryInnerModel):
+    extra = IntegerField()
+
+
+DATA = {'integer': -2 ** 70,
+        'float': 1.5,
+        'string': 'ñ' * 40,
+        'boolean': False,
+        'bytes': b'\x00' * 300,
+        'datetime': datetime(2020, 1, 2, 3, 4, 5, 6, tzinfo=timezone(timedelta(hours=-3))),
+        'date': date(2021, 2, 3),
+        'time': time(1, 2, 3, 4),
+        'timedelta': timedelta(days=-3, seconds=5, microseconds=7),
+        'enum': BinaryEnum.value_2,
+        'inner': {'name': 'inner', 'date': datetime(2000, 1, 1)},
+        'inner_list': [{'name': 'a'}, {}] * 10,
+        'hash_map': {'key': BinaryEnum.value_1},
+        'dynamic': {'a': 1, 'b': {'c': [1, 2]}},
+        'multi': BinaryEnum.value_1,
+        'matrix': [[1, 2], [300, -40000, 2 ** 40, -2 ** 40]],
+        'blob': {1: [None, True]}}
+
+
+class BinaryCodecTests(TestCase):
+
+    def setUp(self):
+        self.model = BinaryModel(data=DATA)
+
+    def test_model(self):
+        model = decode(BinaryModel, encode(self.model))
+
+        self.assertIsInstance(model, BinaryModel)
+        self.assertEqual(model.export_data(), self.model.export_data())
+        self.assertIsInstance(model.inner_list[0], BinaryInnerModel)
+        self.assertIs(model.hash_map.key, BinaryEnum.value_1)
+        self.assertIs(model.multi, BinaryEnum.value_1)
+        self.assertEqual(model.datetime.utcoffset(), timedelta(hours=-3))
+        self.assertFalse(model.is_modified())
+
+    def test_fields_by_position(self):
+        data = encode(BinaryInnerModel(data={'name': 'foo'}))
+        self.assertEqual(data, b'\x81\x00\xa3foo')
+
+    def test_subclass_by_name(self):
+        model = BinaryModel(data={'inner': BinaryInnerSubModel(data={'name': 'foo', 'extra': 3})})
+        self.assertEqual(decode(BinaryModel, encode(model)).export_data(), {'inner': {'name': 'foo', 'extra': 3}})
+
+    def test_list_model(self):
+        model = decode(ListModel, encode(self.model.inner_list), field_type=ModelField(model_class=BinaryInnerModel))
+
+        self.assertIsInstance(model, ListModel)
+        self.assertIsInstance(model[0], BinaryInnerModel)
+        self.assertEqual(model.export_data(), self.model.inner_list.export_data())
+
+    def test_hash_map_model(self):
+        field_type = EnumField(enum_class=BinaryEnum)
+        model = decode(HashMapModel, encode(self.model.hash_map), field_type=field_type)
+
+        self.assertIsInstance(model, HashMapModel)
+        self.assertIs(model.key, BinaryEnum.value_1)
+
+    def test_dynamic_model(self):
+        model = decode(DynamicModel, encode(self.model.dynamic))
+        self.assertEqual(model.export_data(), {'a': 1, 'b': {'c': [1, 2]}})
+
+    def test_plain_data(self):
+        data = {'a': [1, 2.5, None, 'b' * 70000, b'c' * 70000, list(range(70000))],
+                'e': BinaryEnum.value_2}
+        self.assertEqual(decode(None, encode(data)), dict(data, e='two'))
+
+    def test_integers(self):
+        values = [0, 127, 128, 255, 256, 65535, 65536, 2 ** 32 - 1, 2 ** 32, 2 ** 64 - 1, 2 ** 64,
+                  -1, -32, -33, -128, -129, -32768, -32769, -2 ** 31, -2 ** 31 - 1, -2 ** 63, -2 ** 63 - 1]
+        self.assertEqual(decode(None, encode(values)), values)
+
+    def test_message_pack_format(self):
+        self.assertEqual(encode({'a': [1, -1, None, True, 1.5]}),
+                         b'\x81\xa1a\x95\x01\xff\xc0\xc3\xcb\x3f\xf8\x00\x00\x00\x00\x00\x00')
+
+    def test_not_encodable(self):
+        with self.assertRaises(TypeError):
+            encode({'a': {1, 2}})
+
+    def test_malformed(self):
+        data = encode(self.model)
+        for malformed in [data[:-1], data + b'\x00', b'\xc1', b'\xc7\x01\x7f\x00', b'']:
+            with self.assertRaises(ValueError):
+                decode(BinaryModel, malformed)
+
+    def test_wrong_type(self):
+        with self.assertRaises(TypeError):
+            decode(BinaryModel, encode([1, 2]))
+
+        with self.assertRaises(TypeError):
+            decode(ListModel, encode({'a': 1}))
@@ -1,3 +1,4 @@
+from copy import deepcopy
 from datetime import date, datetime, time, timedelta, timezone
 from enum import Enum
 from unittest import TestCase
@@ -6,12 +7,13 @@ import iso8601
 import sys
 from dateutil import tz
 
-from dirty_models.base import AccessMode
+from dirty_models.base import UNUSABLE, AccessMode
 from dirty_models.fields import ArrayField, BaseField, BooleanField, BytesField, DateField, DateTimeField, EnumField, \
     FloatField, HashMapField, IntegerField, ModelField, MultiTypeField, StringField, StringIdField, TimeField, \
-    TimedeltaField
+    TimedeltaField, accept_value, parse_iso_datetime, parse_iso_time
 from dirty_models.model_types import ListModel
 from dirty_models.models import BaseModel, HashMapModel
+from dirty_models.utils import ModelFormatterIter
 
 
 class TestFields(TestCase):
@@ -1519,6 +1521,74 @@ class MultiTypeFieldComplexTypesTests(TestCase):
             multi_field.get_field_type_by_value({})
 
 
+class MultiTypeFieldDispatchTests(TestCase):
+
+    def setUp(self):
+        super(MultiTypeFieldDispatchTests, self).setUp()
+
+        class MultiTypeModel(BaseModel):
+            multi_field = MultiTypeField(field_types=[IntegerField(), StringField(),
+                                                      DateTimeField(parse_format='%Y')])
+
+        self.model = MultiTypeModel()
+        self.field = MultiTypeModel.multi_field
+        self.integer_field, self.string_field, self.datetime_field = self.field.field_types
+
+    def test_dispatch_table(self):
+        self.assertIs(self.field.get_field_type_by_value(3), self.integer_field)
+        self.assertIs(self.field.get_field_type_by_value(2.5), self.integer_field)
+        self.assertIs(self.field.get_field_type_by_value({}), self.datetime_field)
+
+        with self.assertRaises(TypeError):
+            self.field.get_field_type_by_value({1})
+
+        self.assertEqual(self.field.get_dispatch_table(), {int: self.integer_field,
+                                                           float: self.integer_field,
+                                                           dict: self.datetime_field,
+                                                           set: None})
+
+    def test_shared_by_conversion(self):
+        self.model.multi_field = 2.5
+        self.assertEqual(self.model.multi_field, 2)
+        self.model.multi_field = {1}
+        self.assertEqual(self.model.multi_field, 2)
+        self.assertTrue(self.field.check_value(3))
+        self.assertFalse(self.field.check_value(2.5))
+
+        self.assertEqual(self.field.get_dispatch_table(), {float: self.integer_field,
+                                                           set: None,
+                                                           int: self.integer_field})
+
+    def test_shared_by_formatting(self):
+        self.model.multi_field = datetime(2012, 9, 11)
+        self.assertEqual(ModelFormatterIter(self.model).format(), {'multi_field': '2012'})
+        self.assertEqual(self.field.get_dispatch_table(), {datetime: self.datetime_field})
+
+    def test_value_dependent_types(self):
+        field = MultiTypeField(field_types=[IntegerField(), BooleanField()])
+
+        self.assertEqual(field.get_converter(str)('12'), 12)
+        self.assertIsInstance(field.get_field_type_by_value('12'), IntegerField)
+        self.assertIsInstance(field.get_field_type_by_value('foo'), BooleanField)
+        self.assertEqual(field.get_dispatch_table(), {})
+
+    def test_overridden_check_value(self):
+        class EvenIntegerField(IntegerField):
+
+            def check_value(self, value):
+                return super(EvenIntegerField, self).check_value(value) and value % 2 == 0
+
+        field = MultiTypeField(field_types=[EvenIntegerField(), StringField()])
+
+        self.assertIsInstance(field.get_field_type_by_value(2), EvenIntegerField)
+        self.assertIsInstance(field.get_field_type_by_value(3), StringField)
+        self.assertEqual(field.get_dispatch_table(), {})
+
+    def test_not_pickled(self):
+        self.field.get_field_type_by_value(3)
+        self.assertEqual(deepcopy(self.field).get_dispatch_table(), {})
+
+
 class AutoreferenceModelFieldTests(TestCase):
 
     def setUp(self):
@@ -1803,6 +1873,70 @@ class EnumFieldTests(TestCase):
 
         self.assertEqual(model.export_data(), {'field': [self.TestEnum.value_1, ]})
 
+    def test_get_member(self):
+        self.assertIs(self.field.get_member(self.TestEnum.value_1), self.TestEnum.value_1)
+        self.assertIs(self.field.get_member('value1'), self.TestEnum.value_1)
+        self.assertIs(self.field.get_member('value_2'), self.TestEnum.value_2)
+        self.assertIsNone(self.field.get_member('VALUE_2'))
+        self.assertIsNone(self.field.get_member([2]))
+        self.assertIsNone(self.field.get_member(ConverterEnum.value_1))
+
+    def test_case_insensitive(self):
+        field = EnumField(enum_class=self.TestEnum, case_insensitive=True)
+
+        self.assertIs(field.get_member('VALUE1'), self.TestEnum.value_1)
+        self.assertIs(field.get_member('Value_2'), self.TestEnum.value_2)
+        self.assertTrue(field.can_use_value('VALUE_1'))
+        self.assertIs(field.convert_value('VALUE_1'), self.TestEnum.value_1)
+        self.assertIs(field.get_converter(str)('VALUE_1'), self.TestEnum.value_1)
+        self.assertIs(field.get_converter(str)('value_3'), UNUSABLE)
+        self.assertTrue(field.export_definition()['case_insensitive'])
+
+        field.case_insensitive = False
+        self.assertIsNone(field.get_member('VALUE1'))
+
+    def test_exact_match_before_case_insensitive(self):
+        class CaseEnum(Enum):
+            lower = 'a'
+            upper = 'A'
+
+        field = EnumField(enum_class=CaseEnum, case_insensitive=True)
+
+        self.assertIs(field.get_member('A'), CaseEnum.upper)
+        self.assertIs(field.get_member('UPPER'), CaseEnum.upper)
+        self.assertIs(field.get_member('a'), CaseEnum.lower)
+
+    def test_change_enum_class(self):
+        field = EnumField(enum_class=self.TestEnum)
+        field.enum_class = ConverterEnum
+
+        self.assertIs(field.get_member(1), ConverterEnum.value_1)
+        self.assertIsNone(field.get_member('value1'))
+
+    def test_missing_hook(self):
+        class MissingEnum(Enum):
+            value_1 = 'value1'
+
+            @classmethod
+            def _missing_(cls, value):
+                if value == 'default':
+                    return cls.value_1
+
+        field = EnumField(enum_class=MissingEnum)
+
+        self.assertIs(field.get_member('default'), MissingEnum.value_1)
+        self.assertIsNone(field.get_member('value2'))
+
+    def test_unhashable_values(self):
+        class ListEnum(Enum):
+            value_1 = [1, 2]
+
+        field = EnumField(enum_class=ListEnum)
+
+        self.assertIs(field.get_member([1, 2]), ListEnum.value_1)
+        self.assertIs(field.get_member('value_1'), ListEnum.value_1)
+        self.assertIsNone(field.get_member([3]))
+
 
 class BytesFieldTests(TestCase):
 
@@ -1882,3 +2016,172 @@ class BaseFieldOldReadOnlyTests(TestCase):
     def test_old_read_only_false(self):
         field = BaseField(name='test_field', read_only=False)
         self.assertEquals(field.access_mode, AccessMode.READ_AND_WRITE)
+
+
+class ConverterEnum(Enum):
+    value_1 = 1
+    value_2 = '2'
+    value_3 = 'foo'
+
+
+class ConverterTests(TestCase):
+
+    def test_converter_by_type(self):
+        field = IntegerField()
+
+        self.assertIs(field.get_converter(int), accept_value)
+        self.assertIs(field.get_converter(str), field.get_converter(str))
+        self.assertEqual(field.get_converter(str)('0x10'), 16)
+        self.assertIs(field.get_converter(str)('foo'), UNUSABLE)
+        self.assertEqual(field.get_converter(float)(3.5), 3)
+        self.assertIs(field.get_converter(list)([1]), UNUSABLE)
+
+    def test_enum_values(self):
+        field = IntegerField()
+        converter = field.get_converter(ConverterEnum)
+
+        self.assertEqual(converter(ConverterEnum.value_1), 1)
+        self.assertEqual(converter(ConverterEnum.value_2), 2)
+        self.assertIs(converter(ConverterEnum.value_3), UNUSABLE)
+        self.assertEqual(StringField().get_converter(ConverterEnum)(ConverterEnum.value_1), '1')
+
+    def test_enum_field(self):
+        converter = EnumField(enum_class=ConverterEnum).get_converter(str)
+
+        self.assertIs(converter('2'), ConverterEnum.value_2)
+        self.assertIs(converter('value_3'), ConverterEnum.value_3)
+        self.assertIs(converter('bar'), UNUSABLE)
+
+    def test_creating(self):
+        class ConverterModel(BaseModel):
+            test_field = IntegerField()
+
+            @classmethod
+            def create_new_model(cls, data):
+                return 'created'
+
+        converter = ModelField(model_class=ConverterModel).get_converter(dict)
+
+        self.assertEqual(converter({'test_field': 1}).test_field, 1)
+        self.assertEqual(converter({'test_field': 1}, True), 'created')
+
+    def test_overridden_conversion(self):
+        class UpperStringField(StringField):
+
+            def convert_value(self, value):
+                return super(UpperStringField, self).convert_value(value).upper()
+
+            def can_use_value(self, value):
+                return True
+
+        field = UpperStringField()
+
+        self.assertIsNot(field.get_converter(str), accept_value)
+        self.assertEqual(field.get_converter(bytes)(b'a'), "B'A'")
+
+    def test_not_cached_when_full(self):
+        field = IntegerField()
+        field.converters_size = 0
+
+        self.assertEqual(field.get_converter(str)('1'), 1)
+        self.assertEqual(field._converters, {})
+
+    def test_copy_does_not_share_converters(self):
+        field = ModelField(model_class=HashMapModel)
+        field.get_converter(dict)
+
+        field_copy = deepcopy(field)
+        self.assertEqual(field_copy._converters, {})
+        self.assertIsInstance(field_copy.get_converter(dict)({'a': 1}), HashMapModel)
+
+
+class DateTimeParseTests(TestCase):
+
+    def test_iso_datetime(self):
+        self.assertEqual(parse_iso_datetime('2012-09-11T13:02:41.5Z'),
+                         datetime(2012, 9, 11, 13, 2, 41, 500000, tzinfo=timezone.utc))
+        self.assertEqual(parse_iso_datetime('2012-09-11 13:02-03:00').utcoffset(), timedelta(hours=-3))
+        self.assertEqual(parse_iso_datetime('2012-09-11'), datetime(2012, 9, 11))
+        self.assertIsNone(parse_iso_datetime('11/09/2012'))
+        self.assertIsNone(parse_iso_datetime('2012-13-11'))
+
+    def test_iso_datetime_timezones(self):
+        self.assertEqual(parse_iso_datetime('2012-09-11T13:02:41Z').tzinfo, tz.tzutc())
+        self.assertEqual(parse_iso_datetime('2012-09-11T13:02:41+00:00').tzinfo, tz.tzutc())
+        self.assertEqual(parse_iso_datetime('2012-09-11T13:02:41+02:00').tzinfo, tz.tzoffset(None, 7200))
+        self.assertIsNone(parse_iso_datetime('2012-09-11T13:02:41').tzinfo)
+
+        # UTC is never taken as local timezone, whatever host timezone is
+        self.assertNotIsInstance(DateTimeField().use_value('2012-09-11T13:02:41Z').tzinfo, tz.tzlocal)
+
+    def test_iso_time(self):
+        self.assertEqual(parse_iso_time('13:02:41.000001'), time(13, 2, 41, 1))
+        self.assertIsNone(parse_iso_time('13:02+01:00'))
+
+    def test_not_iso_fallback(self):
+        self.assertEqual(DateTimeField().use_value('Sep 11 2012 13:02'), datetime(2012, 9, 11, 13, 2))
+        self.assertEqual(DateField().use_value('2012-09-11T23:00:00Z'), date(2012, 9, 11))
+        self.assertEqual(TimeField().use_value('2012-09-11T23:00:00Z'), time(23, 0))
+
+    def test_parse_format_is_not_overridden_by_iso(self):
+        field = DateTimeField(parse_format='%d/%m/%Y')
+
+        self.assertIsNone(field.use_value('2012-09-11'))
+        self.assertEqual(field.use_value('11/09/2012'), datetime(2012, 9, 11))
+
+    def test_parse_cache(self):
+        field = DateTimeField(parse_cache_size=2)
+
+        self.assertIs(field.use_value('2012-09-11T13:02:41Z'), field.use_value('2012-09-11T13:02:41Z'))
+        self.assertIsNone(field.use_value('foo'))
+        self.assertEqual(field.get_string_parser().cache_info().hits, 1)
+        self.assertEqual(field.get_string_parser().cache_info().currsize, 2)
+        self.assertEqual(field.export_definition()['parse_cache_size'], 2)
+
+    def test_no_parse_cache(self):
+        self.assertFalse(hasattr(DateTimeField().get_string_parser(), 'cache_info'))
+
+    def test_parser_resolved_again_on_changes(self):
+        field = DateTimeField(parse_format='custom', parse_cache_size=10)
+        field.date_parsers = {'custom': {'parser': '%Y'}}
+        self.assertEqual(field.use_value('2012'), datetime(2012, 1, 1))
+
+        field.date_parsers['custom'] = '%d/%m/%Y'
+        self.assertIsNone(field.use_value('2012'))
+
+        field.parse_format = '%m/%Y'
+        self.assertEqual(field.use_value('02/2012'), datetime(2012, 2, 1))
+
+
+class DateTimeFormatTests(TestCase):
+
+    def test_iso_formats(self):
+        field = DateTimeField(parse_format='%Y-%m-%dT%H:%M:%S.%fZ')
+
+        self.assertEqual(field.get_formatted_value(datetime(2012, 9, 11, 13, 2, 41)), '2012-09-11T13:02:41.000000Z')
+        self.assertEqual(field.get_formatted_value(datetime(2012, 9, 11, 13, 2, 41, tzinfo=timezone.utc)),
+                         '2012-09-11T13:02:41.000000Z')
+        self.assertEqual(DateField(parse_format='%Y-%m-%d').get_formatted_value(date(2012, 9, 11)), '2012-09-11')
+
+    def test_formatter_resolved_again_on_changes(self):
+        field = DateTimeField(parse_format='custom')
+        field.date_parsers = {'custom': {'formatter': '%Y'}}
+        self.assertEqual(field.get_formatted_value(datetime(2012, 9, 11)), '2012')
+
+        field.parse_format = '%d/%m/%Y'
+        self.assertEqual(field.get_formatted_value(datetime(2012, 9, 11)), '11/09/2012')
+
+    def test_format_cache(self):
+        field = DateTimeField(parse_format='%H:%M %z', format_cache_size=10)
+        value = datetime(2012, 9, 11, 13, 2, tzinfo=timezone.utc)
+
+        self.assertEqual(field.get_formatted_value(value), '13:02 +0000')
+        self.assertEqual(field.get_formatted_value(value.astimezone(timezone(timedelta(hours=2)))), '15:02 +0200')
+        self.assertEqual(field.get_formatted_value(datetime(2012, 9, 11, 13, 2, tzinfo=timezone.utc)), '13:02 +0000')
+
+        cache_info = field.get_value_formatter().cache_info()
+        self.assertEqual((cache_info.hits, cache_info.misses), (1, 2))
+        self.assertEqual(field.export_definition()['format_cache_size'], 10)
+
+    def test_no_format_cache(self):
+        self.assertIs(DateTimeField().get_value_formatter(), str)
@@ -0,0 +1,179 @@
+from unittest.case import TestCase
+
+from dirty_models.fields import ArrayField, HashMapField, IntegerField, ModelField
+from dirty_models.journal import ChangeJournal
+from dirty_models.models import BaseModel
+
+
+class JournalModel(BaseModel):
+    test_field_1 = IntegerField()
+    test_field_2 = IntegerField()
+    test_model = ModelField()
+    test_list = ArrayField(field_type=ModelField())
+    test_hash_map = HashMapField(field_type=IntegerField())
+
+
+class ChangeJournalTests(TestCase):
+
+    def setUp(self):
+        self.model = JournalModel(data={'test_field_1': 1,
+                                        'test_field_2': 2,
+                                        'test_model': {'test_field_1': 3,
+                                                       'test_model': {'test_field_1': 4}},
+                                        'test_list': [{'test_field_1': 5}, {'test_field_1': 6}],
+                                        'test_hash_map': {'a': 7}},
+                                  flat=True)
+        self.journal = self.model.start_journal()
+
+    def assert_exports(self):
+        journal_exports = (self.model.export_modifications(),
+                           self.model.export_modified_data(),
+                           sorted(self.model.export_deleted_fields()))
+
+        self.journal.complete = False
+        try:
+            self.assertEqual(journal_exports, (self.model.export_modifications(),
+                                               self.model.export_modified_data(),
+                                               sorted(self.model.export_deleted_fields())))
+        finally:
+            self.journal.complete = True
+
+    def test_start_journal(self):
+        self.assertIsInstance(self.journal, ChangeJournal)
+        self.assertIs(self.model.start_journal(), self.journal)
+        self.assertIs(self.model.get_journal(), self.journal)
+        self.assertTrue(self.journal.complete)
+        self.assertEqual(len(self.journal), 0)
+
+    def test_stop_journal(self):
+        self.model.stop_journal()
+        self.model.test_model.test_field_1 = 10
+
+        self.assertIsNone(self.model.get_journal())
+        self.assertEqual(len(self.journal), 0)
+        self.assertEqual(self.model.export_modifications(), {'test_model.test_field_1': 10})
+
+    def test_entries(self):
+        self.model.test_field_1 = 10
+        self.model.test_model.test_model.test_field_1 = 40
+        del self.model.test_field_2
+        self.model.test_list[1].test_field_1 = 60
+        self.model.test_hash_map.b = 8
+
+        self.assertEqual(self.journal.entries(), [('test_field_1', 'set', 10),
+                                                  ('test_model.test_model.test_field_1', 'set', 40),
+                                                  ('test_field_2', 'delete', None),
+                                                  ('test_list.1.test_field_1', 'set', 60),
+                                                  ('test_hash_map.b', 'set', 8)])
+        self.assert_exports()
+
+    def test_coalescing(self):
+        self.model.test_model.test_field_1 = 10
+        self.model.test_field_1 = 10
+        self.model.test_model.test_field_1 = 20
+
+        self.assertEqual(self.journal.entries(), [('test_field_1', 'set', 10),
+                                                  ('test_model.test_field_1', 'set', 20)])
+        self.assertEqual(self.model.export_modifications(), {'test_field_1': 10,
+                                                             'test_model.test_field_1': 20})
+
+    def test_set_back_original_value(self):
+        self.model.test_field_1 = 10
+        self.model.test_field_1 = 1
+
+        self.assertEqual(len(self.journal), 1)
+        self.assertEqual(self.model.export_modifications(), {})
+        self.assert_exports()
+
+    def test_replace_inner_model(self):
+        self.model.test_model.test_field_1 = 10
+        del self.model.test_model
+        self.model.test_model = JournalModel(data={'test_field_2': 20})
+        self.model.test_model.test_field_1 = 30
+
+        self.assertEqual(self.model.export_modifications(), {'test_model': {'test_field_1': 30,
+                                                                            'test_field_2': 20}})
+        self.assert_exports()
+
+    def test_list_mutation(self):
+        self.model.test_list[0].test_field_1 = 50
+        self.model.test_list.append({'test_field_1': 70})
+
+        self.assertEqual(self.journal.entries(), [('test_list.0.test_field_1', 'set', 50),
+                                                  ('test_list', 'append', None)])
+        self.assertEqual(self.model.export_modifications(), {'test_list': [{'test_field_1': 50},
+                                                                           {'test_field_1': 6},
+                                                                           {'test_field_1': 70}]})
+        self.assert_exports()
+
+        self.model.test_list.clear()
+        self.assert_exports()
+
+    def test_delete_and_reset(self):
+        del self.model.test_model.test_model
+        self.model.test_list[1].test_field_1 = 60
+        del self.model.test_list[0].test_field_1
+        self.assert_exports()
+
+        self.model.test_model.reset_field_value('test_model')
+        self.model.reset_field_value('test_list')
+        self.assert_exports()
+        self.assertFalse(self.model.is_modified())
+
+    def test_clear(self):
+        self.model.test_model.test_field_2 = 10
+        self.model.test_model.clear()
+
+        self.assertEqual(sorted(self.model.export_deleted_fields()), ['test_model.test_field_1',
+                                                                      'test_model.test_model'])
+        self.assert_exports()
+
+    def test_flat_data_resets_journal(self):
+        self.model.test_field_1 = 10
+        self.model.test_list.append({'test_field_1': 70})
+        self.model.flat_data()
+
+        self.assertEqual(len(self.journal), 0)
+        self.assertEqual(self.model.export_modifications(), {})
+
+        self.model.test_list[2].test_field_1 = 80
+        self.assertEqual(self.model.export_modifications(), {'test_list.2.test_field_1': 80})
+
+    def test_flat_inner_model(self):
+        self.model.test_model.test_field_1 = 10
+        self.model.test_field_1 = 10
+        self.model.test_model.flat_data()
+
+        self.assertEqual(self.model.export_modifications(), {'test_field_1': 10})
+        self.assert_exports()
+
+    def test_started_on_modified_model(self):
+        self.model.stop_journal()
+        self.model.test_model.test_field_1 = 10
+        journal = self.model.start_journal()
+        self.model.test_field_1 = 10
+
+        self.assertFalse(journal.complete)
+        self.assertEqual(self.model.export_modifications(), {'test_field_1': 10,
+                                                             'test_model.test_field_1': 10})
+
+        self.model.clear_modified_data()
+        self.assertTrue(journal.complete)
+
+    def test_deleted_inner_model(self):
+        inner_model = self.model.test_model
+        del self.model.test_model
+        inner_model.test_field_1 = 10
+
+        self.assertEqual(self.model.export_modifications(), {})
+        self.assertEqual(self.model.export_deleted_fields(), ['test_model'])
+        self.assert_exports()
+
+    def test_replaced_inner_model(self):
+        inner_model = self.model.test_model.test_model
+        del self.model.test_model.test_model
+        self.model.test_model.test_model = JournalModel()
+        inner_model.test_field_1 = 10
+
+        self.assertEqual(self.model.export_modifications(), {'test_model.test_model': {}})
+        self.assert_exports()
@@ -0,0 +1,140 @@
+from datetime import datetime, timedelta
+from enum import Enum
+from json import dumps as json_dumps, loads as json_loads
+from unittest.case import TestCase, skipUnless
+
+from dirty_models.base import AccessMode
+from dirty_models.fields import ArrayField, DateTimeField, EnumField, HashMapField, IntegerField, ModelField, \
+    StringField, TimedeltaField
+from dirty_models import json_backends
+from dirty_models.json_backends import BaseJSONBackend, OrjsonBackend, StdlibJSONBackend, dumps, get_backend, \
+    loads, prepare, register_backend, set_default_backend
+from dirty_models.models import BaseModel
+from dirty_models.utils import JSONEncoder, ModelFormatterIter
+
+
+class BackendEnum(Enum):
+    value_1 = 1
+    value_2 = '2'
+
+
+class BackendInnerModel(BaseModel):
+    name = StringField()
+    date = DateTimeField(parse_format='%d/%m/%Y')
+
+
+class BackendModel(BaseModel):
+    title = StringField()
+    count = IntegerField()
+    hidden = IntegerField(access_mode=AccessMode.HIDDEN)
+    delta = TimedeltaField()
+    enum = EnumField(enum_class=BackendEnum)
+    inner = ModelField(model_class=BackendInnerModel)
+    inner_list = ArrayField(field_type=ModelField(model_class=BackendInnerModel))
+    dates = HashMapField(field_type=DateTimeField(parse_format='%Y'))
+
+
+DATA = {'title': 'título',
+        'count': 3,
+        'hidden': 4,
+        'delta': timedelta(seconds=1.5),
+        'enum': BackendEnum.value_2,
+        'inner': {'name': 'a', 'date': datetime(2016, 5, 30)},
+        'inner_list': [{'name': 'b'}, {'date': datetime(2017, 1, 2)}],
+        'dates': {'a': datetime(2018, 1, 1)}}
+
+PLAIN_DATA = {'title': 'título',
+              'count': 3,
+              'delta': 1.5,
+              'enum': '2',
+              'inner': {'name': 'a', 'date': '30/05/2016'},
+              'inner_list': [{'name': 'b'}, {'date': '02/01/2017'}],
+              'dates': {'a': '2018'}}
+
+
+class FakeBackend(BaseJSONBackend):
+    name = 'fake'
+
+    def dumps(self, data):
+        return 'fake'
+
+    def loads(self, document):
+        return {'title': document}
+
+
+class JSONBackendsTests(TestCase):
+
+    def setUp(self):
+        self.model = BackendModel(data=DATA)
+
+    def tearDown(self):
+        set_default_backend()
+
+    def test_prepare(self):
+        data = prepare(self.model)
+        self.assertEqual(data, PLAIN_DATA)
+        self.assertIs(prepare(self.model), data)
+        self.assertEqual(prepare({'a': [self.model.inner], 'b': 1}), {'a': [PLAIN_DATA['inner']], 'b': 1})
+        self.assertEqual(prepare(self.model.inner_list), PLAIN_DATA['inner_list'])
+
+    def test_prepare_after_write(self):
+        prepare(self.model)
+        self.model.inner_list[1].name = 'c'
+        self.assertEqual(prepare(self.model)['inner_list'], [{'name': 'b'}, {'name': 'c', 'date': '02/01/2017'}])
+
+    def test_stdlib_same_as_json_encoder(self):
+        self.assertEqual(dumps(self.model, backend='stdlib'), json_dumps(self.model, cls=JSONEncoder))
+
+    def test_stdlib_options(self):
+        self.assertEqual(dumps(self.model.inner, backend=StdlibJSONBackend(separators=(',', ':'))),
+                         '{"name":"a","date":"30/05/2016"}')
+
+    @skipUnless(OrjsonBackend.is_available(), 'orjson is not installed')
+    def test_orjson(self):
+        self.assertIsInstance(get_backend(), OrjsonBackend)
+        self.assertEqual(json_loads(dumps(self.model, backend='orjson')), PLAIN_DATA)
+        self.assertEqual(dumps({1: None}, backend='orjson'), '{"1":null}')
+
+    def test_default_backend(self):
+        self.assertIs(get_backend(), get_backend())
+        set_default_backend('stdlib')
+        self.assertIsInstance(get_backend(), StdlibJSONBackend)
+        self.assertEqual(self.model.dumps_json(), json_dumps(self.model, cls=JSONEncoder))
+
+    def test_loads(self):
+        model = BackendModel.loads_json(json_dumps(PLAIN_DATA), flat=True)
+        self.assertIsInstance(model, BackendModel)
+        self.assertEqual(model.inner.date, datetime(2016, 5, 30))
+        self.assertFalse(model.is_modified())
+        self.assertEqual(loads('[1, 2]', backend='stdlib'), [1, 2])
+
+    def test_formatter_class(self):
+        class UpperFormatterIter(ModelFormatterIter):
+
+            def format_field(self, field, value):
+                if isinstance(value, str):
+                    return value.upper()
+                return super(UpperFormatterIter, self).format_field(field, value)
+
+        self.assertEqual(json_loads(self.model.inner.dumps_json(formatter_class=UpperFormatterIter)),
+                         {'name': 'A', 'date': '30/05/2016'})
+
+    def test_register_backend(self):
+        preference = list(json_backends._backend_preference)
+        self.addCleanup(json_backends._backend_preference.__setitem__, slice(None), preference)
+
+        register_backend(FakeBackend)
+        self.assertNotIsInstance(get_backend(), FakeBackend)
+        self.assertEqual(dumps(self.model, backend='fake'), 'fake')
+        self.assertEqual(BackendModel.loads_json('foo', backend='fake').title, 'foo')
+
+        register_backend(FakeBackend, preferred=True)
+        self.assertIsInstance(get_backend(), FakeBackend)
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            get_backend('foo')
+
+    def test_unknown_type(self):
+        with self.assertRaises(TypeError):
+            dumps({'a': {1, 2}}, backend='stdlib')
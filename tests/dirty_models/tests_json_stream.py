@@ -0,0 +1,233 @@
+from io import BytesIO, StringIO
+from json import JSONDecodeError, dumps, loads
+from unittest.case import TestCase
+
+from datetime import datetime
+
+from dirty_models.base import AccessMode
+from dirty_models.fields import ArrayField, DateTimeField, FloatField, HashMapField, IntegerField, ModelField, \
+    StringField
+from dirty_models.json_stream import dump, iter_json_events, iter_list_items, iterencode, load_model
+from dirty_models.model_types import ListModel
+from dirty_models.models import BaseModel, DynamicModel, HashMapModel
+from dirty_models.utils import JSONEncoder, ModelFormatterIter
+
+
+class StreamInnerModel(BaseModel):
+    name = StringField()
+    value = IntegerField()
+
+
+class StreamModel(BaseModel):
+    title = StringField()
+    count = IntegerField(default=3)
+    inner = ModelField(model_class=StreamInnerModel)
+    inner_list = ArrayField(field_type=ModelField(model_class=StreamInnerModel))
+    numbers = ArrayField(field_type=ArrayField(field_type=IntegerField()))
+    inner_map = HashMapField(field_type=ModelField(model_class=StreamInnerModel))
+    dyn = ModelField(model_class=DynamicModel)
+
+
+class WriterModel(StreamModel):
+    __override_field_access_modes__ = {'count': AccessMode.HIDDEN}
+
+    hidden = IntegerField(access_mode=AccessMode.HIDDEN)
+    date = DateTimeField(parse_format='%Y-%m-%d %H:%M')
+    dates = ArrayField(field_type=DateTimeField(parse_format='%d/%m/%Y'))
+    ratio = FloatField()
+
+
+DATA = {'title': 'test ñ "quoted" \\u',
+        'inner': {'name': 'inner', 'value': 12},
+        'inner_list': [{'name': 'a', 'value': 1}, {'name': 'b', 'value': -2}, {}],
+        'numbers': [[1, 2], [], [3.5e2]],
+        'inner_map': {'k1': {'name': 'x'}, 'k2': {'value': 4}},
+        'dyn': {'flag': True, 'nothing': None, 'other': False, 'deep': {'a': [1, {'b': 2}]}}}
+
+
+class JSONEventsTests(TestCase):
+
+    def test_events(self):
+        events = list(iter_json_events(StringIO('{"a": [1, -2.5e1, true, null], "b": {}}'), chunk_size=3))
+        self.assertEqual(events, [('start_map', None),
+                                  ('map_key', 'a'),
+                                  ('start_array', None),
+                                  ('value', 1),
+                                  ('value', -25.0),
+                                  ('value', True),
+                                  ('value', None),
+                                  ('end_array', None),
+                                  ('map_key', 'b'),
+                                  ('start_map', None),
+                                  ('end_map', None),
+                                  ('end_map', None)])
+
+    def test_scalar_document(self):
+        self.assertEqual(list(iter_json_events(StringIO(' 1234 '), chunk_size=2)), [('value', 1234)])
+
+    def test_multibyte_split(self):
+        data = dumps(['ñ€'], ensure_ascii=False).encode('utf-8')
+        self.assertEqual(list(iter_json_events(BytesIO(data), chunk_size=1)),
+                         [('start_array', None), ('value', 'ñ€'), ('end_array', None)])
+
+    def test_malformed(self):
+        for doc in ['{"a": 1', '{"a" 1}', '[1, 2,]', '{"a": 1,}', '[1} ', '{1: 2}', '[tru]', '[1] 2', '"abc', '']:
+            with self.assertRaises(JSONDecodeError, msg=doc):
+                list(iter_json_events(StringIO(doc), chunk_size=2))
+
+    def test_strings_split_in_chunks(self):
+        values = ['a"b\\\u00f1\n/' * 20, '\U0001f600', 'x\u0001y', '']
+        doc = dumps(values)
+        for chunk_size in (1, 2, 3, 5, 7):
+            self.assertEqual([value for event, value in iter_json_events(StringIO(doc), chunk_size=chunk_size)
+                              if event == 'value'], values, msg=chunk_size)
+
+    def test_malformed_string_fails_at_once(self):
+        for bad in ['\\x', '\\u12g4', '\x01']:
+            fp = StringIO('["a' + bad + 'b' * 100000 + '"]')
+            with self.assertRaises(JSONDecodeError, msg=repr(bad)):
+                list(iter_json_events(fp, chunk_size=16))
+            self.assertLess(fp.tell(), 100, msg=repr(bad))
+
+
+class LoadModelTests(TestCase):
+
+    def _check_model(self, model):
+        self.assertEqual(model.export_data(), StreamModel(data=DATA).export_data())
+        self.assertEqual(model.title, DATA['title'])
+        self.assertIsInstance(model.inner, StreamInnerModel)
+        self.assertIsInstance(model.inner_list[0], StreamInnerModel)
+        self.assertIsInstance(model.inner_map.k1, StreamInnerModel)
+        self.assertIsInstance(model.dyn, DynamicModel)
+        self.assertEqual(model.numbers.export_data(), [[1, 2], [], [350]])
+        self.assertIs(model.inner.get_parent(), model)
+
+    def test_load_text(self):
+        for chunk_size in (1, 7, 65536):
+            model = load_model(StringIO(dumps(DATA)), StreamModel, chunk_size=chunk_size)
+            self._check_model(model)
+            self.assertTrue(model.is_modified())
+
+    def test_load_bytes(self):
+        model = load_model(BytesIO(dumps(DATA, ensure_ascii=False).encode('utf-8')), StreamModel, chunk_size=5)
+        self._check_model(model)
+
+    def test_load_json_classmethod_flat(self):
+        model = StreamModel.load_json(StringIO(dumps(DATA)), flat=True)
+        self._check_model(model)
+        self.assertFalse(model.is_modified())
+
+    def test_same_as_import(self):
+        self.assertEqual(StreamModel.load_json(StringIO(dumps(DATA))).export_modifications(),
+                         StreamModel(data=DATA).export_modifications())
+
+    def test_unknown_and_invalid_fields(self):
+        model = StreamModel.load_json(StringIO('{"unknown": {"a": [1, 2]}, "title": "t", "count": "no", '
+                                               '"inner": 3}'))
+        self.assertEqual(model.export_data(), {'title': 't', 'count': 3})
+
+    def test_load_dynamic_model(self):
+        model = DynamicModel.load_json(StringIO('{"a": 1, "b": {"c": [1, 2]}}'), chunk_size=4)
+        self.assertEqual(model.export_data(), {'a': 1, 'b': {'c': [1, 2]}})
+
+    def test_load_hashmap_model(self):
+        model = HashMapModel.load_json(StringIO('{"a": {"name": "n"}, "b": 3}'),
+                                       field_type=ModelField(model_class=StreamInnerModel))
+        self.assertIsInstance(model.a, StreamInnerModel)
+        self.assertEqual(model.export_data(), {'a': {'name': 'n'}})
+
+    def test_load_not_object(self):
+        with self.assertRaises(TypeError):
+            StreamModel.load_json(StringIO('[1, 2]'))
+
+    def test_load_malformed(self):
+        with self.assertRaises(JSONDecodeError):
+            StreamModel.load_json(StringIO('{"title": "t"} {'))
+
+
+class IterListItemsTests(TestCase):
+
+    def test_iter_models(self):
+        items = iter_list_items(StringIO('[{"name": "a"}, 3, {"value": 2}]'),
+                                field_type=ModelField(model_class=StreamInnerModel), chunk_size=4)
+        result = list(items)
+        self.assertEqual([item.export_data() for item in result], [{'name': 'a'}, {'value': 2}])
+        self.assertIsInstance(result[0], StreamInnerModel)
+
+    def test_iter_is_incremental(self):
+        fp = StringIO('[1, 2, ' + ', '.join(['3'] * 1000) + ']')
+        items = ListModel.iter_json(fp, field_type=IntegerField(), chunk_size=16)
+        self.assertEqual(next(items), 1)
+        self.assertLess(fp.tell(), 100)
+
+    def test_iter_without_field_type(self):
+        self.assertEqual(list(ListModel.iter_json(StringIO('[1, "a", [2], {"b": null}]'))),
+                         [1, 'a', [2], {'b': None}])
+
+    def test_iter_not_array(self):
+        with self.assertRaises(TypeError):
+            list(iter_list_items(StringIO('{}')))
+
+
+class JSONWriterTests(TestCase):
+
+    def setUp(self):
+        self.model = WriterModel(data=dict(DATA,
+                                           hidden=3,
+                                           date=datetime(2016, 5, 30, 22, 22),
+                                           dates=[datetime(2016, 5, 30), datetime(2017, 1, 2)],
+                                           ratio=0.5))
+
+    def test_same_as_json_encoder(self):
+        self.assertEqual(''.join(iterencode(self.model)), dumps(self.model, cls=JSONEncoder))
+
+    def test_same_as_json_encoder_memoized(self):
+        expected = dumps(self.model, cls=JSONEncoder)
+        self.assertIsNotNone(self.model._find_memoized(ModelFormatterIter(self.model)._get_memo_key()))
+        self.assertEqual(''.join(iterencode(self.model)), expected)
+
+    def test_chunks(self):
+        chunks = list(iterencode(self.model, chunk_size=16))
+        self.assertGreater(len(chunks), 1)
+        self.assertTrue(all(len(chunk) < 100 for chunk in chunks))
+        self.assertEqual(''.join(chunks), dumps(self.model, cls=JSONEncoder))
+
+    def test_hidden_fields(self):
+        data = loads(''.join(iterencode(self.model)))
+        self.assertNotIn('hidden', data)
+        self.assertNotIn('count', data)
+        self.assertEqual(data['date'], '2016-05-30 22:22')
+        self.assertEqual(data['dates'], ['30/05/2016', '02/01/2017'])
+
+    def test_list_model(self):
+        self.assertEqual(''.join(iterencode(self.model.inner_list)),
+                         '[{"name": "a", "value": 1}, {"name": "b", "value": -2}, {}]')
+        self.assertEqual(''.join(iterencode(self.model.dates)), '["30/05/2016", "02/01/2017"]')
+
+    def test_dump_text(self):
+        fp = StringIO()
+        self.model.dump_json(fp, ensure_ascii=False)
+        self.assertEqual(fp.getvalue(), dumps(self.model, cls=JSONEncoder, ensure_ascii=False))
+
+    def test_dump_bytes(self):
+        fp = BytesIO()
+        dump(self.model, fp, ensure_ascii=False, chunk_size=8)
+        self.assertEqual(fp.getvalue(), dumps(self.model, cls=JSONEncoder, ensure_ascii=False).encode('utf-8'))
+
+    def test_plain_values(self):
+        data = {'a': [1, 2.5, None, True, False], 1: {}, None: [], 2.5: 'ñ'}
+        self.assertEqual(''.join(iterencode(data)), dumps(data))
+
+    def test_nan(self):
+        self.model.ratio = float('nan')
+        self.assertIn('"ratio": NaN', ''.join(iterencode(self.model)))
+
+        with self.assertRaises(ValueError):
+            ''.join(iterencode(self.model, allow_nan=False))
+
+    def test_fail_unknown_type(self):
+        with self.assertRaises(TypeError):
+            ''.join(iterencode({'foo': {2, 3}}))
+
+        with self.assertRaises(TypeError):
+            ''.join(iterencode({(1, 2): 3}))
@@ -1,12 +1,15 @@
+import gc
 import pickle
+import weakref
 from datetime import date, datetime, time, timedelta
 from enum import Enum
 from functools import partial
 from unittest import TestCase
 
-from dirty_models.base import AccessMode, Creating, Unlocker
+from dirty_models.base import AccessMode, Creating, LazyValue, Unlocker
 from dirty_models.fields import ArrayField, BaseField, BooleanField, DateField, DateTimeField, EnumField, FloatField, \
     HashMapField, IntegerField, ModelField, MultiTypeField, StringField, TimeField, TimedeltaField
+from dirty_models.model_types import ListModel
 from dirty_models.models import BaseModel, CamelCaseMeta, DynamicModel, FastDynamicModel, HashMapModel
 from dirty_models.utils import factory
 
@@ -2379,3 +2382,1258 @@ class TestOverrideFieldModeAccessModel(TestCase):
 
         model.testField1 = 3
         self.assertEqual(model.testField2, 2)
+
+
+class ImportPlanTests(TestCase):
+
+    def setUp(self):
+        class InnerModel(BaseModel):
+            test_field_1 = IntegerField()
+
+        class Model(BaseModel):
+            test_field_1 = IntegerField(name='number_field', alias=['int_field'])
+            test_field_2 = StringField()
+            test_model = ModelField(model_class=InnerModel)
+            test_list = ArrayField(field_type=ModelField(model_class=InnerModel))
+
+        self.inner_model_class = InnerModel
+        self.model_class = Model
+
+    def test_plan_names_and_aliases(self):
+        plan = self.model_class.__import_plan__
+        self.assertEqual(set(plan.keys()), {'number_field', 'test_field_1', 'int_field',
+                                            'test_field_2', 'test_model', 'test_list'})
+        self.assertIs(plan['number_field'], plan['int_field'])
+        self.assertIs(plan['number_field'], plan['test_field_1'])
+
+    def test_import_using_plan(self):
+        model = self.model_class(data={'int_field': '3',
+                                       'test_field_2': 4,
+                                       'test_model': {'test_field_1': '5'},
+                                       'test_list': [{'test_field_1': 6}],
+                                       'unknown': 'foo'})
+
+        self.assertEqual(model.export_data(), {'number_field': 3,
+                                               'test_field_2': '4',
+                                               'test_model': {'test_field_1': 5},
+                                               'test_list': [{'test_field_1': 6}]})
+        self.assertIsInstance(model.test_model, self.inner_model_class)
+
+    def test_import_update_inner_model(self):
+        model = self.model_class(data={'test_model': {'test_field_1': 5}})
+        inner = model.test_model
+        model.import_data({'test_model': {'test_field_1': 6}})
+
+        self.assertIs(model.test_model, inner)
+        self.assertEqual(model.test_model.test_field_1, 6)
+
+    def test_import_none_deletes_field(self):
+        model = self.model_class(data={'test_field_2': 'foo'}, flat=True)
+        model.import_data({'test_field_2': None})
+
+        self.assertEqual(model.export_deleted_fields(), ['test_field_2'])
+
+    def test_import_factory(self):
+        model = self.model_class(data={'test_field_2': factory(lambda: 'foo')})
+
+        self.assertEqual(model.test_field_2, 'foo')
+
+    def test_import_custom_setter(self):
+        def setter(field, obj, value):
+            obj.set_field_value(field.name, value * 2)
+
+        class Model(BaseModel):
+            test_field_1 = IntegerField(setter=setter)
+
+        self.assertEqual(Model(data={'test_field_1': 2}).test_field_1, 4)
+
+    def test_import_read_only_field(self):
+        class Model(BaseModel):
+            test_field_1 = IntegerField(access_mode=AccessMode.READ_ONLY)
+
+        model = Model(data={'test_field_1': 2})
+        model.import_data({'test_field_1': 3})
+
+        self.assertEqual(model.test_field_1, 2)
+
+    def test_import_overridden_use_value(self):
+        class DoubleIntegerField(IntegerField):
+
+            def use_value(self, value, creating=False):
+                return super(DoubleIntegerField, self).use_value(value, creating=creating) * 2
+
+        class Model(BaseModel):
+            test_field_1 = DoubleIntegerField()
+
+        model = Model(data={'test_field_1': 2})
+        self.assertEqual(model.test_field_1, 4)
+
+        model.import_data({'test_field_1': '3'})
+        self.assertEqual(model.test_field_1, 6)
+
+        model.test_field_1 = 4
+        self.assertEqual(model.test_field_1, 8)
+
+
+class FromManyTests(TestCase):
+
+    def setUp(self):
+        class InnerModel(BaseModel):
+            test_field_1 = IntegerField()
+
+        class Model(BaseModel):
+            test_field_1 = IntegerField(default=1)
+            test_field_2 = StringField(access_mode=AccessMode.READ_ONLY)
+            test_model = ModelField(model_class=InnerModel, default={'test_field_1': 2})
+            test_date = DateTimeField(default=factory(datetime.now))
+
+        self.model_class = Model
+
+    def test_from_many(self):
+        rows = [{'test_field_1': '3', 'test_field_2': 'foo'},
+                {'test_field_2': 'bar'},
+                None]
+
+        models = self.model_class.from_many(rows)
+
+        self.assertEqual(len(models), 3)
+        for model, row in zip(models, rows):
+            expected = self.model_class(data=row)
+            self.assertIsInstance(model, self.model_class)
+            self.assertEqual(model.export_modified_data().keys(), expected.export_modified_data().keys())
+            self.assertEqual(model.test_field_1, expected.test_field_1)
+            self.assertEqual(model.test_field_2, expected.test_field_2)
+            self.assertEqual(model.test_model.export_data(), expected.test_model.export_data())
+            self.assertTrue(model.is_locked())
+
+    def test_from_many_no_shared_children(self):
+        models = self.model_class.from_many([{}, {}])
+
+        self.assertIsNot(models[0].test_model, models[1].test_model)
+        self.assertIs(models[0].test_model.get_parent(), models[0])
+        models[0].test_model.test_field_1 = 5
+        self.assertEqual(models[1].test_model.test_field_1, 2)
+
+    def test_from_many_factory_defaults(self):
+        models = self.model_class.from_many([{}, {}])
+
+        self.assertIsInstance(models[0].test_date, datetime)
+        self.assertIsInstance(models[1].test_date, datetime)
+
+    def test_from_many_read_only(self):
+        models = self.model_class.from_many([{'test_field_2': 'foo'}])
+        models[0].test_field_2 = 'bar'
+
+        self.assertEqual(models[0].test_field_2, 'foo')
+
+    def test_from_many_lock_once(self):
+        calls = []
+
+        def lock(model):
+            calls.append('lock')
+            BaseModel.lock(model)
+
+        def unlock(model):
+            calls.append('unlock')
+            BaseModel.unlock(model)
+
+        self.model_class.lock = lock
+        self.model_class.unlock = unlock
+        rows = [{'test_field_2': 'foo', 'test_model': {'test_field_1': 3}}, {}, {}]
+        models = self.model_class.from_many(rows)
+        del self.model_class.lock
+        del self.model_class.unlock
+
+        self.assertLessEqual(len(calls), 1)
+
+        for model in models:
+            self.assertTrue(model.is_locked())
+            self.assertTrue(model.test_model.is_locked())
+        self.assertEqual(models[0].test_field_2, 'foo')
+
+        models[0].test_field_2 = 'bar'
+        self.assertEqual(models[0].test_field_2, 'foo')
+
+    def test_from_many_flat(self):
+        models = self.model_class.from_many([{'test_field_1': 3}], flat=True)
+
+        self.assertFalse(models[0].is_modified())
+        self.assertEqual(models[0].export_original_data()['test_field_1'], 3)
+
+    def test_from_many_list_model(self):
+        models = self.model_class.from_many([{'test_field_1': 3}, {'test_field_1': 4}], as_list_model=True)
+
+        self.assertIsInstance(models, ListModel)
+        self.assertEqual([m.test_field_1 for m in models], [3, 4])
+        self.assertIs(models[0].get_parent(), models)
+
+    def test_from_many_dynamic_model(self):
+        models = DynamicModel.from_many([{'foo': 1}, {'bar': 'baz'}])
+
+        self.assertEqual([m.export_data() for m in models], [{'foo': 1}, {'bar': 'baz'}])
+
+
+class TrustedInnerModel(BaseModel):
+    test_field_1 = IntegerField()
+    test_field_2 = StringField(access_mode=AccessMode.READ_ONLY)
+
+
+class TrustedModel(BaseModel):
+    test_field_1 = IntegerField(default=4)
+    test_field_2 = StringField(name='string_field')
+    test_model = ModelField(model_class=TrustedInnerModel)
+    test_list = ArrayField(field_type=ModelField(model_class=TrustedInnerModel))
+    test_hash_map = HashMapField(field_type=ModelField(model_class=TrustedInnerModel))
+    test_read_only_model = ModelField(model_class=TrustedInnerModel, access_mode=AccessMode.READ_ONLY)
+
+
+class FromTrustedTests(TestCase):
+
+    def setUp(self):
+        self.inner_model_class = TrustedInnerModel
+        self.model_class = TrustedModel
+        self.data = {'test_field_1': 3,
+                     'string_field': 'foo',
+                     'test_model': {'test_field_1': 5, 'test_field_2': 'bar'},
+                     'test_list': [{'test_field_1': 6}, {'test_field_1': 7}],
+                     'test_hash_map': {'key': {'test_field_1': 8}},
+                     'test_read_only_model': {'test_field_1': 9}}
+
+    def test_from_trusted(self):
+        model = self.model_class.from_trusted(self.data)
+
+        self.assertFalse(model.is_modified())
+        self.assertEqual(model.export_data(), self.data)
+        self.assertEqual(model.export_original_data(), self.data)
+        self.assertEqual(model.export_modifications(), {})
+        self.assertEqual(model.export_deleted_fields(), [])
+
+    def test_from_trusted_no_default_data(self):
+        model = self.model_class.from_trusted({'string_field': 'foo'})
+
+        self.assertIsNone(model.test_field_1)
+
+    def test_from_trusted_alias(self):
+        model = self.model_class.from_trusted({'test_field_2': 'foo'})
+
+        self.assertEqual(model.export_data(), {'string_field': 'foo'})
+
+    def test_from_trusted_lazy_inner_model(self):
+        model = self.model_class.from_trusted(self.data)
+
+        self.assertIsInstance(model.__original_data__['test_model'], LazyValue)
+        self.assertIsInstance(model.test_model, self.inner_model_class)
+        self.assertIs(model.__original_data__['test_model'], model.test_model)
+        self.assertIs(model.test_model.get_parent(), model)
+        self.assertFalse(model.test_model.is_modified())
+        self.assertEqual(model.test_model.test_field_1, 5)
+
+    def test_from_trusted_modify_inner_model(self):
+        model = self.model_class.from_trusted(self.data)
+        model.test_model.test_field_1 = 10
+        model.test_model.test_field_2 = 'baz'
+
+        self.assertTrue(model.is_modified())
+        self.assertEqual(model.export_modifications(), {'test_model.test_field_1': 10})
+
+    def test_from_trusted_inner_list(self):
+        model = self.model_class.from_trusted(self.data)
+
+        self.assertIsInstance(model.test_list, ListModel)
+        self.assertIsInstance(model.test_list[0], self.inner_model_class)
+        self.assertIs(model.test_list[0].get_parent(), model.test_list)
+        self.assertEqual(model.test_list[1].test_field_1, 7)
+
+        model.test_list[1].test_field_1 = 11
+        self.assertEqual(model.export_modifications(), {'test_list.1.test_field_1': 11})
+
+    def test_from_trusted_inner_hash_map(self):
+        model = self.model_class.from_trusted(self.data)
+
+        self.assertIsInstance(model.test_hash_map, HashMapModel)
+        self.assertIsInstance(model.test_hash_map.key, self.inner_model_class)
+        self.assertEqual(model.test_hash_map.key.test_field_1, 8)
+
+    def test_from_trusted_read_only_inner_model(self):
+        model = self.model_class.from_trusted(self.data)
+        model.test_read_only_model.test_field_1 = 10
+
+        self.assertEqual(model.test_read_only_model.test_field_1, 9)
+
+    def test_from_trusted_pickle(self):
+        model = self.model_class.from_trusted(self.data)
+        model_unpickled = pickle.loads(pickle.dumps(model))
+
+        self.assertEqual(model_unpickled.export_data(), self.data)
+        self.assertIsInstance(model_unpickled.test_model, self.inner_model_class)
+
+    def test_from_trusted_flat_untouched(self):
+        model = self.model_class.from_trusted(self.data)
+        model.test_field_1 = 2
+        model.flat_data()
+
+        self.assertIsInstance(model.__original_data__['test_model'], LazyValue)
+        self.assertEqual(model.export_data()['test_model'], self.data['test_model'])
+
+    def test_from_trusted_dynamic_model(self):
+        model = DynamicModel.from_trusted({'foo': 1, 'bar': {'baz': 'tor'}})
+
+        self.assertFalse(model.is_modified())
+        self.assertEqual(model.bar.baz, 'tor')
+
+    def test_from_trusted_hash_map_model(self):
+        model = HashMapModel.from_trusted({'foo': 1, 'bar': 2}, field_type=IntegerField())
+
+        self.assertFalse(model.is_modified())
+        self.assertEqual(model.foo, 1)
+
+
+class LazyModelFieldTests(TestCase):
+
+    def setUp(self):
+        class InnerModel(BaseModel):
+            test_field_1 = IntegerField()
+            test_field_2 = StringField(access_mode=AccessMode.WRITABLE_ONLY_ON_CREATION)
+
+        class Model(BaseModel):
+            test_field_1 = IntegerField()
+            test_model = ModelField(model_class=InnerModel, lazy=True)
+            test_hash_map = HashMapField(field_type=IntegerField(), lazy=True)
+
+        self.inner_model_class = InnerModel
+        self.model_class = Model
+
+    def test_lazy_not_built(self):
+        data = {'test_field_1': 1, 'test_field_2': 'foo'}
+        model = self.model_class(data={'test_model': data})
+
+        self.assertIsInstance(model.__modified_data__['test_model'], LazyValue)
+        self.assertTrue(model.is_modified())
+        self.assertEqual(model.export_data()['test_model'], data)
+        self.assertEqual(model.export_modifications(), {'test_model': data})
+        self.assertFalse(model.__modified_data__['test_model'].is_built())
+
+    def test_lazy_built_on_get(self):
+        model = self.model_class(data={'test_model': {'test_field_1': '1'}})
+
+        self.assertIsInstance(model.test_model, self.inner_model_class)
+        self.assertIs(model.test_model, model.__modified_data__['test_model'])
+        self.assertIs(model.test_model.get_parent(), model)
+        self.assertEqual(model.test_model.test_field_1, 1)
+        self.assertEqual(model.export_data(), {'test_model': {'test_field_1': 1}})
+
+    def test_lazy_export_modified_data(self):
+        model = self.model_class(data={'test_model': {'test_field_1': 1}})
+
+        self.assertEqual(model.export_modified_data(), {'test_model': {'test_field_1': 1}})
+
+    def test_lazy_flat_data(self):
+        model = self.model_class(data={'test_model': {'test_field_1': 1}}, flat=True)
+
+        self.assertFalse(model.is_modified())
+        self.assertIsInstance(model.__original_data__['test_model'], LazyValue)
+        self.assertFalse(model.test_model.is_modified())
+        self.assertEqual(model.export_original_data(), {'test_model': {'test_field_1': 1}})
+
+    def test_lazy_update_existing(self):
+        model = self.model_class(data={'test_model': {'test_field_1': 1}})
+        model.test_model = {'test_field_1': 2}
+
+        self.assertEqual(model.test_model.test_field_1, 2)
+
+    def test_lazy_creating(self):
+        model = self.model_class.create_new_model({'test_model': {'test_field_2': 'foo'}})
+        model.test_model.test_field_2 = 'bar'
+
+        self.assertEqual(model.test_model.test_field_2, 'foo')
+
+    def test_lazy_model_instance(self):
+        inner = self.inner_model_class(data={'test_field_1': 1})
+        model = self.model_class(data={'test_model': inner})
+
+        self.assertIs(model.__modified_data__['test_model'], inner)
+
+    def test_lazy_hash_map(self):
+        model = self.model_class(data={'test_hash_map': {'foo': '1'}}, flat=True)
+
+        self.assertIsInstance(model.__original_data__['test_hash_map'], LazyValue)
+        self.assertIsInstance(model.test_hash_map, HashMapModel)
+        self.assertEqual(model.test_hash_map.foo, 1)
+
+    def test_lazy_read_only(self):
+        model = self.model_class(data={'test_model': {'test_field_1': 1}})
+        model.set_access_mode(AccessMode.READ_ONLY)
+        model.test_model.test_field_1 = 2
+
+        self.assertEqual(model.test_model.test_field_1, 1)
+
+    def test_lazy_export_definition(self):
+        self.assertTrue(self.model_class.get_structure()['test_model'].export_definition()['lazy'])
+
+
+class CopyOnWriteTests(TestCase):
+
+    def setUp(self):
+        self.model = TrustedModel(data={'test_field_2': 'foo',
+                                        'test_model': {'test_field_1': 1, 'test_field_2': 'bar'},
+                                        'test_list': [{'test_field_1': 2}, {'test_field_1': 3}],
+                                        'test_hash_map': {'a': {'test_field_1': 4}}},
+                                  flat=True)
+        self.model.test_field_1 = 5
+
+    def test_copy_is_modified(self):
+        model = self.model.copy()
+
+        self.assertIsInstance(model, TrustedModel)
+        self.assertEqual(model.export_data(), self.model.export_data())
+        self.assertEqual(model.export_modifications(), self.model.export_data())
+        self.assertEqual(model.export_original_data(), {})
+        self.assertTrue(model.test_model.is_modified())
+        self.assertEqual(model.test_list[0].export_modifications(), {'test_field_1': 2})
+
+    def test_copy_shares_children(self):
+        model = self.model.copy()
+
+        self.assertIsInstance(model.__modified_data__['test_model'], LazyValue)
+        self.assertIs(model.__modified_data__['test_model'].data, self.model.__original_data__['test_model'])
+        self.assertTrue(model.is_modified_field('test_list'))
+
+    def test_modify_copy(self):
+        model = self.model.copy()
+        model.test_model.test_field_1 = 10
+        model.test_list[0].test_field_1 = 20
+        model.test_list.append({'test_field_1': 30})
+        model.test_hash_map.a.test_field_1 = 40
+
+        self.assertEqual(self.model.test_model.test_field_1, 1)
+        self.assertEqual(self.model.test_list.export_data(), [{'test_field_1': 2}, {'test_field_1': 3}])
+        self.assertEqual(self.model.test_hash_map.a.test_field_1, 4)
+        self.assertFalse(self.model.test_model.is_modified())
+
+        self.assertEqual(model.test_model.test_field_1, 10)
+        self.assertIs(model.test_model.get_parent(), model)
+        self.assertEqual(model.export_modifications(), {'test_field_1': 5,
+                                                        'string_field': 'foo',
+                                                        'test_model': {'test_field_1': 10, 'test_field_2': 'bar'},
+                                                        'test_list': [{'test_field_1': 20},
+                                                                      {'test_field_1': 3},
+                                                                      {'test_field_1': 30}],
+                                                        'test_hash_map': {'a': {'test_field_1': 40}}})
+
+    def test_modify_source(self):
+        inner = self.model.test_model
+        item = self.model.test_list[1]
+        model = self.model.copy()
+        inner.test_field_1 = 10
+        item.test_field_1 = 30
+        self.model.test_hash_map.a.test_field_1 = 40
+
+        self.assertIs(self.model.test_model, inner)
+        self.assertEqual(self.model.test_model.test_field_1, 10)
+        self.assertEqual(self.model.test_list[1].test_field_1, 30)
+
+        self.assertEqual(model.test_model.test_field_1, 1)
+        self.assertEqual(model.test_list[1].test_field_1, 3)
+        self.assertEqual(model.test_hash_map.a.test_field_1, 4)
+        self.assertTrue(model.test_model.is_modified())
+
+    def test_modify_source_after_copy_read(self):
+        model = self.model.copy()
+        self.assertEqual(model.export_data()['test_model'], {'test_field_1': 1, 'test_field_2': 'bar'})
+
+        self.model.test_model.clear_all()
+
+        self.assertEqual(model.test_model.export_data(), {'test_field_1': 1, 'test_field_2': 'bar'})
+
+    def test_unrelated_trees_not_shared(self):
+        other = TrustedModel(data={'test_model': {'test_field_1': 1}})
+        model = self.model.copy()
+
+        self.assertTrue(self.model.test_model._get_state()[5])
+        self.assertFalse(other.test_model._get_state()[5])
+        self.assertFalse(model._get_state()[5])
+
+    def test_dropped_copy(self):
+        inner = self.model.test_model
+        model = self.model.copy()
+        self.assertTrue(inner._get_state()[5])
+
+        del model
+        gc.collect()
+        inner.test_field_1 = 10
+
+        self.assertFalse(inner._get_state()[5])
+        self.assertIsNone(inner.__shared_by__)
+
+    def test_copy_of_copy(self):
+        model = self.model.copy()
+        model2 = model.copy()
+        self.model.test_model.test_field_1 = 10
+        model.test_model.test_field_1 = 20
+
+        self.assertEqual(model2.test_model.test_field_1, 1)
+        self.assertEqual(model.test_model.test_field_1, 20)
+        self.assertEqual(self.model.test_model.test_field_1, 10)
+
+    def test_flat_copy(self):
+        model = self.model.copy()
+        model.flat_data()
+
+        self.assertFalse(model.is_modified())
+        self.assertTrue(self.model.is_modified())
+
+    def test_copy_deleted_fields(self):
+        del self.model.test_field_2
+        model = self.model.copy()
+
+        self.assertIsNone(model.test_field_2)
+        self.assertEqual(model.export_deleted_fields(), [])
+        self.assertNotIn('string_field', model.export_modifications())
+
+    def test_copy_read_only_inner(self):
+        with Unlocker(self.model):
+            self.model.test_read_only_model = {'test_field_1': 1}
+        model = self.model.copy()
+        model.test_read_only_model.test_field_1 = 2
+
+        self.assertEqual(model.test_read_only_model.test_field_1, 1)
+        self.assertEqual(model.test_read_only_model.get_access_mode(), AccessMode.READ_ONLY)
+
+    def test_pickle_copy(self):
+        model = pickle.loads(pickle.dumps(self.model.copy()))
+
+        self.assertEqual(model.export_data(), self.model.export_data())
+        self.assertIsInstance(model.test_model, TrustedInnerModel)
+
+    def test_copy_dynamic_model(self):
+        model = DynamicModel(data={'foo': 1, 'bar': {'baz': 2}})
+        model2 = model.copy()
+        model.bar.baz = 3
+        model2.bar.baz = 4
+
+        self.assertEqual(model.export_data(), {'foo': 1, 'bar': {'baz': 3}})
+        self.assertEqual(model2.export_data(), {'foo': 1, 'bar': {'baz': 4}})
+        self.assertIsNotNone(model2.get_field_obj('bar'))
+
+    def test_copy_fast_dynamic_model(self):
+        model = FastDynamicModel(data={'foo': 1, 'bar': {'baz': 2}})
+        model2 = model.copy()
+        model2.bar.baz = 4
+
+        self.assertEqual(model.export_data(), {'foo': 1, 'bar': {'baz': 2}})
+        self.assertEqual(model2.get_current_structure().keys(), {'foo', 'bar'})
+
+
+class CompactInnerModel(BaseModel):
+    __compact__ = True
+
+    test_field_1 = IntegerField()
+    test_field_2 = StringField(access_mode=AccessMode.READ_ONLY)
+
+
+class CompactModel(BaseModel):
+    __compact__ = True
+
+    test_field_1 = IntegerField(default=4)
+    test_field_2 = StringField(name='string_field', alias=['alias_field'])
+    test_model = ModelField(model_class=CompactInnerModel)
+    test_list = ArrayField(field_type=ModelField(model_class=CompactInnerModel))
+
+
+class CompactChildModel(CompactModel):
+    test_field_3 = FloatField()
+
+
+class CompactModelTests(TestCase):
+
+    def setUp(self):
+        self.model = CompactModel(data={'string_field': 'foo',
+                                        'test_model': {'test_field_1': 1, 'test_field_2': 'bar'},
+                                        'test_list': [{'test_field_1': 2}]},
+                                  flat=True)
+
+    def test_no_instance_dict(self):
+        self.assertFalse(hasattr(self.model, '__dict__'))
+        self.assertFalse(hasattr(self.model.test_model, '__dict__'))
+
+    def test_export_data(self):
+        self.assertEqual(self.model.export_data(), {'test_field_1': 4,
+                                                    'string_field': 'foo',
+                                                    'test_model': {'test_field_1': 1, 'test_field_2': 'bar'},
+                                                    'test_list': [{'test_field_1': 2}]})
+        self.assertFalse(self.model.is_modified())
+
+    def test_modify(self):
+        self.model.alias_field = 'baz'
+        self.model.test_model.test_field_1 = 3
+        self.model.test_model.test_field_2 = 'no'
+
+        self.assertEqual(self.model.test_field_2, 'baz')
+        self.assertEqual(self.model.export_modifications(), {'string_field': 'baz', 'test_model.test_field_1': 3})
+        self.assertEqual(self.model.export_original_data()['string_field'], 'foo')
+        self.assertIs(self.model.test_model.get_parent(), self.model)
+
+    def test_delete_and_reset(self):
+        del self.model.test_field_2
+        del self.model.test_field_1
+
+        self.assertIsNone(self.model.test_field_2)
+        self.assertEqual(self.model.__deleted_fields__, ['test_field_1', 'string_field'])
+        self.assertEqual(self.model.export_modified_data(), {'test_field_1': None, 'string_field': None})
+
+        self.model.reset_field_value('test_field_2')
+
+        self.assertEqual(self.model.test_field_2, 'foo')
+        self.assertEqual(self.model.export_deleted_fields(), ['test_field_1'])
+
+        self.model.flat_data()
+
+        self.assertEqual(self.model.get_fields(), ['string_field', 'test_model', 'test_list'])
+        self.assertEqual(len(self.model.__deleted_fields__), 0)
+
+    def test_data_views(self):
+        self.model.test_field_1 = 5
+
+        self.assertEqual(self.model.__modified_data__, {'test_field_1': 5})
+        self.assertEqual(self.model.__modified_data__.copy(), {'test_field_1': 5})
+        self.assertIn('test_field_1', self.model.__modified_data__)
+        self.assertNotIn('string_field', self.model.__modified_data__)
+
+        with self.assertRaises(KeyError):
+            self.model.__modified_data__['unknown'] = 1
+
+    def test_pickle(self):
+        del self.model.test_field_1
+        self.model.test_model.test_field_1 = 3
+
+        model = pickle.loads(pickle.dumps(self.model))
+
+        self.assertEqual(model.export_data(), self.model.export_data())
+        self.assertEqual(model.export_deleted_fields(), ['test_field_1'])
+        self.assertEqual(model.export_modifications(), {'test_model.test_field_1': 3})
+
+    def test_copy(self):
+        model = self.model.copy()
+        model.flat_data()
+        model.test_model.test_field_1 = 3
+
+        self.assertEqual(model.export_modifications(), {'test_model.test_field_1': 3})
+        self.assertEqual(self.model.test_model.test_field_1, 1)
+
+    def test_from_trusted_and_from_many(self):
+        data = self.model.export_data()
+
+        self.assertEqual(CompactModel.from_trusted(data).export_data(), data)
+        self.assertEqual([model.export_data() for model in CompactModel.from_many([data, data])], [data, data])
+
+    def test_subclass(self):
+        model = CompactChildModel(data={'test_field_1': 1, 'test_field_3': 2.5})
+
+        self.assertEqual(model.export_data(), {'test_field_1': 1, 'test_field_3': 2.5})
+        self.assertFalse(hasattr(model, '__dict__'))
+        self.assertEqual(CompactChildModel.__compact_index__['test_field_3'], 4)
+
+    def test_inherit_not_compact_model(self):
+        with self.assertRaises(TypeError):
+            class NotCompactModel(PicklableModel):
+                __compact__ = True
+
+
+class DynamicModelShapeTests(TestCase):
+
+    def test_same_fields_share_class(self):
+        model1 = DynamicModel(data={'foo': 1, 'bar': 'a'})
+        model2 = DynamicModel(data={'foo': 2, 'bar': 'b'})
+
+        self.assertIs(model1.__class__, model2.__class__)
+        self.assertEqual(set(model1.get_structure().keys()), {'foo', 'bar'})
+
+    def test_new_field_moves_instance(self):
+        model1 = DynamicModel(data={'foo': 1})
+        model2 = DynamicModel(data={'foo': 2})
+        shape = model1.__class__
+        model1.bar = 'a'
+
+        self.assertIsNot(model1.__class__, shape)
+        self.assertTrue(issubclass(model1.__class__, shape))
+        self.assertIs(model2.__class__, shape)
+        self.assertIsNone(model2.get_field_obj('bar'))
+        self.assertIsNone(model2.bar)
+
+        model2.bar = 'b'
+
+        self.assertIs(model1.__class__, model2.__class__)
+
+    def test_different_field_type_different_class(self):
+        model1 = DynamicModel(data={'foo': 1})
+        model2 = DynamicModel(data={'foo': 'a'})
+
+        self.assertIsNot(model1.__class__, model2.__class__)
+        self.assertIsInstance(model1.get_field_obj('foo'), IntegerField)
+        self.assertIsInstance(model2.get_field_obj('foo'), StringField)
+
+    def test_empty_models_share_class(self):
+        self.assertIs(DynamicModel().__class__, DynamicModel().__class__)
+        self.assertIsInstance(DynamicModel(), DynamicModel)
+
+    def test_subclass_shapes(self):
+        class SubDynamicModel(DynamicModel):
+            static = IntegerField()
+
+        model1 = SubDynamicModel(data={'static': 1, 'foo': 1})
+        model2 = DynamicModel(data={'foo': 1})
+
+        self.assertIsInstance(model1, SubDynamicModel)
+        self.assertIsNot(model1.__class__, model2.__class__)
+        self.assertEqual(model1.export_data(), {'static': 1, 'foo': 1})
+
+    def test_instance_of_shape_class(self):
+        model1 = DynamicModel(data={'foo': 1})
+        model2 = model1.__class__(data={'bar': 2})
+
+        self.assertIsInstance(model2.get_field_obj('foo'), IntegerField)
+        self.assertEqual(model2.export_data(), {'bar': 2})
+        self.assertIsNone(model1.get_field_obj('bar'))
+
+    def test_pickle_keeps_fields(self):
+        model = DynamicModel(data={'foo': 1, 'bar': {'baz': 'a'}})
+        model.qux = 2.5
+
+        model2 = pickle.loads(pickle.dumps(model))
+
+        self.assertEqual(model2.export_data(), model.export_data())
+        self.assertIsInstance(model2.get_field_obj('qux'), FloatField)
+        self.assertEqual(model2.bar.baz, 'a')
+
+
+class DeepStateModel(BaseModel):
+    test_field_1 = IntegerField()
+    test_field_2 = IntegerField(access_mode=AccessMode.WRITABLE_ONLY_ON_CREATION)
+    test_model = ModelField()
+    test_list = ArrayField(field_type=ModelField())
+
+
+class CachedStateTests(TestCase):
+
+    def setUp(self):
+        self.model = DeepStateModel()
+        self.leaf = self.model
+        for i in range(10):
+            self.leaf.test_model = {}
+            self.leaf = self.leaf.test_model
+
+    def test_state_is_cached(self):
+        self.leaf.test_field_1 = 1
+        state = self.leaf.__state_cache__
+        self.leaf.test_field_1 = 2
+
+        self.assertIs(self.leaf.__state_cache__, state)
+        self.assertEqual(self.leaf.test_field_1, 2)
+
+    def test_lock_on_ancestor(self):
+        self.model.set_access_mode(AccessMode.READ_ONLY)
+        self.leaf.test_field_1 = 1
+        self.assertIsNone(self.leaf.test_field_1)
+        self.assertTrue(self.leaf.is_locked())
+
+        self.model.unlock()
+        self.assertFalse(self.leaf.is_locked())
+        self.leaf.test_field_1 = 2
+        self.assertEqual(self.leaf.test_field_1, 2)
+
+        self.model.lock()
+        self.assertTrue(self.leaf.is_locked())
+        self.leaf.test_field_1 = 3
+        self.assertEqual(self.leaf.test_field_1, 2)
+
+    def test_access_mode_on_ancestor(self):
+        self.assertEqual(self.leaf.get_access_mode(), AccessMode.READ_AND_WRITE)
+
+        self.model.test_model.set_access_mode(AccessMode.HIDDEN)
+        self.assertEqual(self.leaf.get_access_mode(), AccessMode.HIDDEN)
+
+        self.model.test_model.set_access_mode(AccessMode.READ_AND_WRITE)
+        self.assertEqual(self.leaf.get_access_mode(), AccessMode.READ_AND_WRITE)
+
+    def test_creating_on_ancestor(self):
+        self.leaf.test_field_2 = 1
+        self.assertIsNone(self.leaf.test_field_2)
+
+        with Creating(self.model):
+            self.assertTrue(self.leaf.is_creating())
+            self.leaf.test_field_2 = 2
+
+        self.assertFalse(self.leaf.is_creating())
+        self.assertEqual(self.leaf.test_field_2, 2)
+        self.leaf.test_field_2 = 3
+        self.assertEqual(self.leaf.test_field_2, 2)
+
+    def test_new_parent(self):
+        self.model.set_access_mode(AccessMode.READ_ONLY)
+        leaf = self.leaf
+        self.assertEqual(leaf.get_access_mode(), AccessMode.READ_ONLY)
+
+        model = DeepStateModel()
+        with Unlocker(model):
+            model.test_model = leaf
+
+        self.assertEqual(leaf.get_access_mode(), AccessMode.READ_AND_WRITE)
+
+    def test_parent_disappears(self):
+        model = DeepStateModel(data={'test_model': {}})
+        leaf = model.test_model
+        model.start_creation()
+        self.assertTrue(leaf.is_creating())
+
+        del model
+        gc.collect()
+
+        self.assertIsNone(leaf.get_parent())
+        self.assertFalse(leaf.is_creating())
+
+    def test_list_items(self):
+        self.leaf.test_list = [{'test_field_1': 1}]
+        item = self.leaf.test_list[0]
+
+        self.model.set_access_mode(AccessMode.READ_ONLY)
+        item.test_field_1 = 2
+        self.assertEqual(item.test_field_1, 1)
+
+        with Unlocker(self.model):
+            item.test_field_1 = 3
+        self.assertEqual(item.test_field_1, 3)
+
+    def test_other_trees_keep_state(self):
+        self.leaf.is_locked()
+        state = self.leaf.__state_cache__
+
+        other = DeepStateModel(data={'test_model': {'test_field_1': 1}})
+        other.test_model.set_access_mode(AccessMode.READ_ONLY)
+        other.lock()
+
+        self.assertIs(self.leaf.__state_cache__, state)
+        self.assertTrue(state[0][0])
+        self.assertEqual(other.test_model.get_access_mode(), AccessMode.READ_ONLY)
+
+    def test_detached_child_follows_parent(self):
+        leaf = self.leaf
+        parent = leaf.get_parent()
+        del parent.test_model
+        self.assertIsNone(parent.test_model)
+        self.assertTrue(leaf.is_locked())
+
+        parent.unlock()
+        self.assertIs(leaf.get_parent(), parent)
+        self.assertFalse(leaf.is_locked())
+
+    def test_detached_children_freed(self):
+        gc.disable()
+        self.addCleanup(gc.enable)
+
+        model = DeepStateModel(data={'test_model': {'test_field_1': 1}, 'test_list': [{'test_field_1': 2}]})
+        child = weakref.ref(model.test_model)
+        item = weakref.ref(model.test_list[0])
+        self.assertTrue(model.test_model.is_locked())
+        self.assertTrue(model.test_list[0].is_locked())
+
+        del model.test_model
+        model.test_list.pop(0)
+        self.assertIsNone(child())
+        self.assertIsNone(item())
+
+    def test_dropped_parent(self):
+        model = DeepStateModel(data={'test_model': {'test_field_1': 1}})
+        child = model.test_model
+        model.unlock()
+        self.assertFalse(child.is_locked())
+
+        del model
+        gc.collect()
+        self.assertIsNone(child.get_parent())
+        self.assertTrue(child.is_locked())
+
+
+class ModifiedStateTests(TestCase):
+
+    def setUp(self):
+        self.model = DeepStateModel(data={'test_field_1': 1,
+                                          'test_model': {'test_field_1': 2,
+                                                         'test_model': {'test_field_1': 3}},
+                                          'test_list': [{'test_field_1': 4}, {'test_field_1': 5}]},
+                                    flat=True)
+        self.leaf = self.model.test_model.test_model
+
+    def test_state_is_cached(self):
+        self.assertFalse(self.model.is_modified())
+        self.assertFalse(self.model.__modified_state__)
+        self.assertFalse(self.leaf.__modified_state__)
+
+    def test_write_on_leaf(self):
+        self.assertFalse(self.model.is_modified())
+
+        self.leaf.test_field_1 = 30
+        self.assertTrue(self.model.__modified_state__)
+        self.assertTrue(self.model.test_model.__modified_state__)
+        self.assertTrue(self.model.is_modified())
+
+        self.leaf.test_field_1 = 3
+        self.assertFalse(self.model.__modified_state__)
+        self.assertFalse(self.model.is_modified())
+
+    def test_delete_and_reset_on_leaf(self):
+        self.assertFalse(self.model.is_modified())
+
+        del self.leaf.test_field_1
+        self.assertTrue(self.model.is_modified())
+
+        self.leaf.reset_field_value('test_field_1')
+        self.assertFalse(self.model.is_modified())
+
+    def test_write_on_list_item(self):
+        self.assertFalse(self.model.is_modified())
+
+        self.model.test_list[1].test_field_1 = 50
+        self.assertTrue(self.model.is_modified())
+        self.assertTrue(self.model.test_list.is_modified())
+
+        self.model.test_list[1].test_field_1 = 5
+        self.assertFalse(self.model.is_modified())
+
+        self.model.test_list.append({'test_field_1': 6})
+        self.assertTrue(self.model.is_modified())
+
+        self.model.test_list.clear_modified_data()
+        self.assertFalse(self.model.is_modified())
+
+    def test_modified_sibling(self):
+        self.model.test_list[0].test_field_1 = 40
+        self.leaf.test_field_1 = 30
+        self.leaf.test_field_1 = 3
+
+        self.assertTrue(self.model.is_modified())
+
+        self.model.test_list[0].test_field_1 = 4
+        self.assertFalse(self.model.is_modified())
+
+    def test_child_held_by_two_parents(self):
+        inner = DeepStateModel(data={'test_field_1': 1}, flat=True)
+        parent_1 = DeepStateModel()
+        parent_2 = DeepStateModel()
+        parent_1.test_model = inner
+        parent_2.test_model = inner
+        parent_1.flat_data()
+        parent_2.flat_data()
+
+        self.assertFalse(parent_1.is_modified())
+        self.assertFalse(parent_2.is_modified())
+        self.assertEqual(parent_1.export_data(), {'test_model': {'test_field_1': 1}})
+
+        inner.test_field_1 = 2
+        self.assertTrue(parent_1.is_modified())
+        self.assertTrue(parent_2.is_modified())
+        self.assertEqual(parent_1.export_data(), {'test_model': {'test_field_1': 2}})
+        self.assertEqual(parent_2.export_data(), {'test_model': {'test_field_1': 2}})
+
+        inner.test_field_1 = 1
+        self.assertFalse(parent_1.is_modified())
+        self.assertFalse(parent_2.is_modified())
+
+    def test_flat_data_skips_clean_children(self):
+        self.leaf.test_field_1 = 30
+        list_model = self.model.test_list
+
+        def flat_data():
+            raise AssertionError('Clean child must not be flattened')
+
+        list_model.flat_data = flat_data
+        self.model.flat_data()
+
+        self.assertFalse(self.model.is_modified())
+        self.assertEqual(self.leaf.export_original_data(), {'test_field_1': 30})
+
+    def test_clear_modified_data_skips_clean_children(self):
+        self.leaf.test_field_1 = 30
+        list_model = self.model.test_list
+
+        def clear_modified_data():
+            raise AssertionError('Clean child must not be cleared')
+
+        list_model.clear_modified_data = clear_modified_data
+        self.model.clear_modified_data()
+
+        self.assertFalse(self.model.is_modified())
+        self.assertEqual(self.leaf.test_field_1, 3)
+
+    def test_pickle(self):
+        self.leaf.test_field_1 = 30
+        self.assertTrue(self.model.is_modified())
+
+        model = pickle.loads(pickle.dumps(self.model))
+        self.assertTrue(model.is_modified())
+        self.assertTrue(model.test_model.test_model.is_modified())
+
+
+class DiffTests(TestCase):
+
+    def setUp(self):
+        self.model = TrustedModel(data={'test_field_1': 1,
+                                        'test_field_2': 'foo',
+                                        'test_model': {'test_field_1': 2},
+                                        'test_list': [{'test_field_1': 3}, {'test_field_1': 4}],
+                                        'test_hash_map': {'a': {'test_field_1': 5}}},
+                                  flat=True)
+
+    def test_same_model(self):
+        self.assertEqual(self.model.diff(self.model), {})
+
+    def test_equal_models(self):
+        model = TrustedModel(data=self.model.export_data())
+        self.assertEqual(self.model.diff(model), {})
+
+    def test_changes(self):
+        model = TrustedModel(data=self.model.export_data())
+        model.test_field_1 = 10
+        del model.test_field_2
+        model.test_model.test_field_1 = 20
+        model.test_list[1].test_field_1 = 40
+        model.test_hash_map.b = {'test_field_1': 6}
+
+        self.assertEqual(self.model.diff(model), {'test_field_1': 10,
+                                                  'string_field': None,
+                                                  'test_model.test_field_1': 20,
+                                                  'test_list.1.test_field_1': 40,
+                                                  'test_hash_map.b': {'test_field_1': 6}})
+        self.assertEqual(model.diff(self.model), {'test_field_1': 1,
+                                                  'string_field': 'foo',
+                                                  'test_model.test_field_1': 2,
+                                                  'test_list.1.test_field_1': 4,
+                                                  'test_hash_map.b': None})
+
+    def test_list_length(self):
+        model = TrustedModel(data=self.model.export_data())
+        model.test_list.append({'test_field_1': 5})
+
+        self.assertEqual(self.model.diff(model), {'test_list': [{'test_field_1': 3},
+                                                                {'test_field_1': 4},
+                                                                {'test_field_1': 5}]})
+
+    def test_copy_shared_children(self):
+        model = self.model.copy()
+        model.test_list[0].test_field_1 = 30
+
+        self.assertEqual(self.model.diff(model), {'test_list.0.test_field_1': 30})
+        self.assertFalse(model.__modified_data__['test_model'].is_built())
+        self.assertFalse(model.__modified_data__['test_hash_map'].is_built())
+
+    def test_trusted_models(self):
+        data = self.model.export_data()
+        model = TrustedModel.from_trusted(data)
+        other_model = TrustedModel.from_trusted(data)
+
+        self.assertEqual(model.diff(other_model), {})
+        self.assertFalse(model.__original_data__['test_model'].is_built())
+
+
+class ApplyModificationsTests(TestCase):
+
+    def setUp(self):
+        self.data = {'test_field_1': 1,
+                     'test_field_2': 'foo',
+                     'test_model': {'test_field_1': 2},
+                     'test_list': [{'test_field_1': 3}, {'test_field_1': 4}],
+                     'test_hash_map': {'a': {'test_field_1': 5}}}
+        self.model = TrustedModel(data=self.data, flat=True)
+
+    def test_apply_exported_modifications(self):
+        model = TrustedModel(data=self.data, flat=True)
+        model.test_field_1 = 10
+        del model.test_field_2
+        model.test_model.test_field_1 = 20
+        del model.test_list[0].test_field_1
+        model.test_list[1].test_field_1 = 40
+        model.test_hash_map.b = {'test_field_1': 6}
+
+        self.model.apply_modifications(model.export_modifications(), deleted=model.export_deleted_fields())
+
+        self.assertEqual(self.model.export_data(), model.export_data())
+        self.assertEqual(self.model.export_modifications(), model.export_modifications())
+        self.assertEqual(sorted(self.model.export_deleted_fields()), sorted(model.export_deleted_fields()))
+
+    def test_apply_diff(self):
+        model = TrustedModel(data=self.data)
+        model.test_list.append({'test_field_1': 5})
+        model.test_model.test_field_1 = 20
+
+        self.model.apply_modifications(self.model.diff(model))
+
+        self.assertEqual(self.model.export_data(), model.export_data())
+
+    def test_shared_prefix(self):
+        self.model.apply_modifications({'test_model': {'test_field_1': 10},
+                                        'test_model.test_field_1': 20,
+                                        'test_list.0.test_field_1': 30,
+                                        'test_list.1.test_field_1': 40})
+
+        self.assertEqual(self.model.export_modifications(), {'test_model.test_field_1': 20,
+                                                             'test_list.0.test_field_1': 30,
+                                                             'test_list.1.test_field_1': 40})
+
+    def test_delete_deleted_string(self):
+        self.model.apply_modifications({}, deleted='test_model.test_field_1')
+
+        self.assertEqual(self.model.export_deleted_fields(), ['test_model.test_field_1'])
+
+    def test_delete_list_items(self):
+        self.model.apply_modifications({'test_list.0.test_field_1': 30}, deleted=['test_list.1', 'test_list.0'])
+
+        self.assertEqual(self.model.export_data()['test_list'], [])
+
+    def test_invalid_paths(self):
+        self.model.apply_modifications({'test_field_1.foo': 10,
+                                        'test_list.5.test_field_1': 10,
+                                        'test_list.foo': 10,
+                                        'unknown.test_field_1': 10,
+                                        'unknown': 10},
+                                       deleted=['test_list.3', 'unknown'])
+
+        self.assertFalse(self.model.is_modified())
+
+    def test_read_only(self):
+        self.model.test_model.set_access_mode(AccessMode.READ_ONLY)
+        self.model.apply_modifications({'test_field_1': 10,
+                                        'test_model.test_field_1': 20})
+
+        self.assertEqual(self.model.export_modifications(), {'test_field_1': 10})
+
+    def test_journal(self):
+        journal = self.model.start_journal()
+        self.model.apply_modifications({'test_field_1': 10,
+                                        'test_list.1.test_field_1': 40},
+                                       deleted=['test_model.test_field_1'])
+
+        self.assertEqual(journal.entries(), [('test_field_1', 'set', 10),
+                                             ('test_list.1.test_field_1', 'set', 40),
+                                             ('test_model.test_field_1', 'delete', None)])
+
+
+class ExportMemoTests(TestCase):
+
+    def setUp(self):
+        self.model = TrustedModel(data={'test_field_1': 1,
+                                        'test_model': {'test_field_1': 2},
+                                        'test_list': [{'test_field_1': 3}, {'test_field_1': 4}]},
+                                  flat=True)
+
+    def test_memoized(self):
+        data = self.model._get_exported_data()
+
+        self.assertIs(self.model._get_exported_data(), data)
+        self.assertIs(data['test_model'], self.model.test_model._get_exported_data())
+        self.assertEqual(self.model.export_data(), data)
+        self.assertIsNot(self.model.export_data(), data)
+
+    def test_export_data_copy(self):
+        data = self.model.export_data()
+        data['test_list'][0]['test_field_1'] = 10
+        data['test_model'].clear()
+
+        self.assertEqual(self.model.export_data(), {'test_field_1': 1,
+                                                    'test_model': {'test_field_1': 2},
+                                                    'test_list': [{'test_field_1': 3}, {'test_field_1': 4}]})
+
+    def test_write_on_inner_model(self):
+        data = self.model._get_exported_data()
+        model_data = self.model.test_model._get_exported_data()
+        self.model.test_list[1].test_field_1 = 40
+
+        self.assertEqual(self.model.export_data()['test_list'], [{'test_field_1': 3}, {'test_field_1': 40}])
+        self.assertIsNot(self.model._get_exported_data(), data)
+        self.assertIs(self.model.test_model._get_exported_data(), model_data)
+
+    def test_flat_data_keeps_memoized(self):
+        self.model.test_field_1 = 10
+        data = self.model._get_exported_data()
+        self.model.flat_data()
+
+        self.assertIs(self.model._get_exported_data(), data)
+
+    def test_lazy_inner_model(self):
+        model = TrustedModel.from_trusted({'test_model': {'test_field_1': 2}})
+        model.export_data()
+        model.test_model.test_field_1 = 20
+
+        self.assertEqual(model.export_data(), {'test_model': {'test_field_1': 20}})
+
+    def test_rollback(self):
+        self.model.export_data()
+        with self.model.transaction() as savepoint:
+            self.model.test_model.test_field_1 = 20
+            self.assertEqual(self.model.export_data()['test_model'], {'test_field_1': 20})
+            savepoint.rollback()
+
+        self.assertEqual(self.model.export_data()['test_model'], {'test_field_1': 2})
+
+
+class PickleDynamicModel(DynamicModel):
+    static = IntegerField()
+
+
+class PickleFormatTests(TestCase):
+
+    def setUp(self):
+        self.model = TrustedModel(data={'test_field_1': 1,
+                                        'test_field_2': 'foo',
+                                        'test_model': {'test_field_1': 2}},
+                                  flat=True)
+
+    def test_fields_by_position(self):
+        self.model.test_field_1 = 10
+        del self.model.test_field_2
+
+        reduced = self.model.__reduce__()
+        self.assertEqual(reduced[1][:2], (TrustedModel, b'\x00\x01\x02'))
+        self.assertEqual(reduced[1][3:], (b'\x00', (10,), b'\x01'))
+
+        model = pickle.loads(pickle.dumps(self.model))
+        self.assertEqual(model.export_data(), self.model.export_data())
+        self.assertEqual(model.export_original_data(), self.model.export_original_data())
+        self.assertEqual(model.export_deleted_fields(), ['string_field'])
+
+    def test_dynamic_model_schema_once(self):
+        models = [DynamicModel(data={'foo': i, 'bar': 'a'}) for i in range(100)]
+        data = pickle.dumps(models)
+
+        self.assertEqual(data.count(b'IntegerField'), pickle.dumps(models[:1]).count(b'IntegerField'))
+
+        models2 = pickle.loads(data)
+        self.assertEqual([m.export_data() for m in models2], [m.export_data() for m in models])
+        self.assertIs(models2[0].__class__, models2[1].__class__)
+
+    def test_dynamic_model_subclass(self):
+        model = PickleDynamicModel(data={'static': 1, 'foo': 'bar'})
+
+        self.assertEqual(model.__reduce__()[1][0], PickleDynamicModel)
+
+        model2 = pickle.loads(pickle.dumps(model))
+        self.assertIsInstance(model2, PickleDynamicModel)
+        self.assertIsInstance(model2.get_field_obj('foo'), StringField)
+        self.assertEqual(model2.export_data(), {'static': 1, 'foo': 'bar'})
+
+    def test_fast_dynamic_model_shares_fields(self):
+        models = pickle.loads(pickle.dumps([FastDynamicModel(data={'foo': i}) for i in range(2)]))
+
+        self.assertIs(models[0].get_field_obj('foo'), models[1].get_field_obj('foo'))
+        self.assertEqual(models[1].export_data(), {'foo': 1})
+
+    def test_hash_map_model(self):
+        model = HashMapModel(data={'a': 1}, field_type=IntegerField())
+        model2 = pickle.loads(pickle.dumps(model))
+
+        self.assertIsInstance(model2.get_field_type(), IntegerField)
+        self.assertEqual(model2.export_data(), {'a': 1})
+
+    def test_old_pickles(self):
+        from dirty_models.models import recover_model_from_data
+
+        model = recover_model_from_data(TrustedModel, {'test_field_1': 1}, {'test_field_1': 2}, set())
+        self.assertEqual(model.export_modifications(), {'test_field_1': 2})
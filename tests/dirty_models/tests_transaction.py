@@ -0,0 +1,206 @@
+from unittest.case import TestCase
+
+from dirty_models.fields import ArrayField, HashMapField, IntegerField, ModelField
+from dirty_models.models import BaseModel
+from dirty_models.transaction import Savepoint, Transaction
+
+
+class TransactionModel(BaseModel):
+    test_field_1 = IntegerField()
+    test_field_2 = IntegerField()
+    test_model = ModelField()
+    test_list = ArrayField(field_type=ModelField())
+    test_hash_map = HashMapField(field_type=IntegerField())
+
+
+class CompactTransactionModel(BaseModel):
+    __compact__ = True
+
+    test_field_1 = IntegerField()
+    test_field_2 = IntegerField()
+    test_model = ModelField(model_class=TransactionModel)
+
+
+class TransactionTests(TestCase):
+
+    def setUp(self):
+        self.model = TransactionModel(data={'test_field_1': 1,
+                                            'test_field_2': 2,
+                                            'test_model': {'test_field_1': 3,
+                                                           'test_model': {'test_field_1': 4}},
+                                            'test_list': [{'test_field_1': 5}, {'test_field_1': 6}],
+                                            'test_hash_map': {'a': 7}},
+                                      flat=True)
+        self.model.test_field_2 = 20
+        self.model.test_model.test_model.test_field_1 = 40
+        self.state = self.get_state(self.model)
+
+    def get_state(self, model):
+        return (model.export_data(),
+                model.export_modifications(),
+                sorted(model.export_deleted_fields()),
+                model.is_modified())
+
+    def modify(self):
+        self.model.test_field_1 = 10
+        del self.model.test_field_2
+        self.model.test_model.test_field_1 = 30
+        self.model.test_model.reset_field_value('test_model')
+        self.model.test_list[0].test_field_1 = 50
+        self.model.test_list.append({'test_field_1': 70})
+        self.model.test_hash_map.b = 8
+        del self.model.test_hash_map.a
+
+    def test_commit(self):
+        with self.model.transaction() as savepoint:
+            self.assertIsInstance(savepoint, Savepoint)
+            self.assertIsInstance(self.model.get_transaction(), Transaction)
+            self.modify()
+
+        self.assertIsNone(self.model.get_transaction())
+        self.assertEqual(self.model.export_modifications(), {'test_field_1': 10,
+                                                             'test_model.test_field_1': 30,
+                                                             'test_list': [{'test_field_1': 50},
+                                                                           {'test_field_1': 6},
+                                                                           {'test_field_1': 70}],
+                                                             'test_hash_map.b': 8})
+
+    def test_rollback_on_exception(self):
+        with self.assertRaises(ValueError):
+            with self.model.transaction():
+                self.modify()
+                raise ValueError()
+
+        self.assertIsNone(self.model.get_transaction())
+        self.assertEqual(self.get_state(self.model), self.state)
+
+    def test_rollback_whole_operations(self):
+        with self.model.transaction() as savepoint:
+            self.modify()
+            self.model.test_model.clear()
+            self.model.test_list[1].clear_all()
+            self.model.flat_data()
+            self.model.test_field_1 = 100
+            self.model.test_list.clear_all()
+            savepoint.rollback()
+
+            self.assertEqual(self.get_state(self.model), self.state)
+
+    def test_log_size(self):
+        with self.model.transaction():
+            for i in range(100):
+                self.model.test_field_1 = i
+                self.model.test_model.test_field_1 = i
+                self.model.test_list.append({'test_field_1': i})
+
+            self.assertEqual(len(self.model.get_transaction()), 3)
+
+    def test_savepoints(self):
+        with self.model.transaction():
+            self.model.test_field_1 = 10
+
+            with self.model.savepoint() as savepoint:
+                self.model.test_field_1 = 11
+                self.model.test_model.test_field_1 = 30
+                savepoint.rollback()
+
+                self.assertEqual(self.model.export_modifications(), {'test_field_1': 10,
+                                                                     'test_field_2': 20,
+                                                                     'test_model.test_model.test_field_1': 40})
+                self.model.test_field_1 = 12
+
+            with self.assertRaises(ValueError):
+                with self.model.transaction():
+                    self.model.test_field_1 = 13
+                    raise ValueError()
+
+            self.assertEqual(self.model.test_field_1, 12)
+
+        self.assertEqual(self.model.test_field_1, 12)
+
+    def test_rollback_after_released_savepoint(self):
+        with self.model.transaction() as savepoint:
+            self.model.test_field_1 = 10
+            with self.model.savepoint():
+                self.model.test_field_1 = 11
+                self.model.test_list.append({'test_field_1': 70})
+
+            savepoint.rollback()
+            self.assertEqual(self.get_state(self.model), self.state)
+
+    def test_rollback_inner_savepoints(self):
+        with self.model.transaction() as savepoint:
+            inner_savepoint = self.model.savepoint()
+            self.model.test_field_1 = 10
+            savepoint.rollback()
+
+            with self.assertRaises(RuntimeError):
+                inner_savepoint.rollback()
+
+    def test_savepoint_without_transaction(self):
+        with self.assertRaises(RuntimeError):
+            self.model.savepoint()
+
+    def test_replaced_inner_model(self):
+        inner_model = self.model.test_model
+        with self.model.transaction() as savepoint:
+            del self.model.test_model
+            self.model.test_model = TransactionModel(data={'test_field_1': 100})
+            savepoint.rollback()
+
+        self.assertIs(self.model.test_model, inner_model)
+        self.assertIs(inner_model.get_parent(), self.model)
+        self.assertEqual(self.get_state(self.model), self.state)
+
+    def test_modified_state(self):
+        self.model.flat_data()
+        with self.model.transaction() as savepoint:
+            self.model.test_model.test_model.test_field_1 = 400
+            self.assertTrue(self.model.is_modified())
+            savepoint.rollback()
+
+            self.assertFalse(self.model.is_modified())
+            self.assertFalse(self.model.test_model.is_modified())
+
+    def test_journal(self):
+        self.model.flat_data()
+        journal = self.model.start_journal()
+        self.model.test_field_1 = 10
+
+        with self.model.transaction() as savepoint:
+            self.model.test_model.test_field_1 = 30
+            self.model.flat_data()
+            savepoint.rollback()
+
+        self.assertTrue(journal.complete)
+        self.assertEqual(self.model.export_modifications(), {'test_field_1': 10})
+
+        journal.complete = False
+        self.assertEqual(self.model.export_modifications(), {'test_field_1': 10})
+
+    def test_journal_reset(self):
+        self.model.flat_data()
+        journal = self.model.start_journal()
+        del self.model.test_model.test_model.test_field_1
+
+        with self.model.transaction() as savepoint:
+            self.model.clear_all()
+            savepoint.rollback()
+
+        self.assertEqual(journal.entries()[0], ('test_model.test_model.test_field_1', 'delete', None))
+        self.assertEqual(self.model.export_deleted_fields(), ['test_model.test_model.test_field_1'])
+
+    def test_compact_model(self):
+        model = CompactTransactionModel(data={'test_field_1': 1, 'test_model': {'test_field_1': 2}}, flat=True)
+        model.test_field_2 = 3
+        state = self.get_state(model)
+
+        with model.transaction() as savepoint:
+            model.test_field_1 = 10
+            del model.test_field_2
+            model.test_model.test_field_1 = 20
+            model.flat_data()
+            model.clear()
+            savepoint.rollback()
+
+        self.assertEqual(self.get_state(model), state)
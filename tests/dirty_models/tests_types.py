@@ -1,7 +1,9 @@
 import pickle
+from datetime import datetime
 from unittest import TestCase
+from dirty_models.base import LazyValue
 from dirty_models.model_types import ListModel
-from dirty_models.fields import StringField, ArrayField, ModelField, MultiTypeField
+from dirty_models.fields import StringField, ArrayField, DateTimeField, ModelField, MultiTypeField
 from dirty_models.fields import IntegerField
 from dirty_models.models import BaseModel
 
@@ -314,3 +316,211 @@ class PicklableListTests(TestCase):
 
         self.assertEqual(original_list,
                          list_model_unpickled.__modified_data__)
+
+    def test_shared_items(self):
+        list_model = ListModel([{'int_field': 1}], field_type=ModelField(model_class=PicklableModel))
+        list_model.flat_data()
+        list_model.append({'int_field': 2})
+
+        list_model_unpickled = pickle.loads(pickle.dumps(list_model))
+
+        self.assertIs(list_model_unpickled.__original_data__[0], list_model_unpickled.__modified_data__[0])
+        self.assertEqual(list_model_unpickled.export_data(), [{'int_field': 1}, {'int_field': 2}])
+
+    def test_no_field_type(self):
+        list_model_unpickled = pickle.loads(pickle.dumps(ListModel([1, 'a'])))
+
+        self.assertIsNone(list_model_unpickled.get_field_type())
+        self.assertEqual(list_model_unpickled.export_data(), [1, 'a'])
+
+
+class LazyItemModel(BaseModel):
+    test_field_1 = IntegerField()
+
+
+class TestLazyListModel(TestCase):
+
+    def setUp(self):
+        self.data = [{'test_field_1': '1'}, {'test_field_1': 2}, {'test_field_1': 3}]
+        self.list = ListModel(self.data, field_type=ModelField(model_class=LazyItemModel), lazy=True)
+
+    def test_lazy_items_not_built(self):
+        self.assertTrue(all(isinstance(item, LazyValue) for item in self.list.__modified_data__))
+        self.assertEqual(len(self.list), 3)
+        self.assertEqual(self.list.export_data(), self.data)
+
+    def test_lazy_item_built_on_get(self):
+        item = self.list[1]
+
+        self.assertIsInstance(item, LazyItemModel)
+        self.assertIs(item.get_parent(), self.list)
+        self.assertIs(self.list.__modified_data__[1], item)
+        self.assertIsInstance(self.list.__modified_data__[0], LazyValue)
+        self.assertIsInstance(self.list.__modified_data__[2], LazyValue)
+
+    def test_lazy_item_negative_index(self):
+        self.assertEqual(self.list[-1].test_field_1, 3)
+        self.assertIsInstance(self.list.__modified_data__[0], LazyValue)
+
+    def test_lazy_item_slice(self):
+        items = self.list[0:2]
+
+        self.assertEqual([item.test_field_1 for item in items], [1, 2])
+        self.assertIsInstance(self.list.__modified_data__[2], LazyValue)
+
+    def test_lazy_items_iteration(self):
+        self.assertEqual([item.test_field_1 for item in self.list], [1, 2, 3])
+        self.assertFalse(any(isinstance(item, LazyValue) for item in self.list.__modified_data__))
+
+    def test_lazy_items_export_converted(self):
+        self.list[0]
+
+        self.assertEqual(self.list.export_data(), [{'test_field_1': 1}, {'test_field_1': 2}, {'test_field_1': 3}])
+
+    def test_lazy_items_flat_data(self):
+        self.list.flat_data()
+
+        self.assertFalse(self.list.is_modified())
+        self.assertFalse(self.list[0].is_modified())
+
+        self.list[0].test_field_1 = 4
+        self.assertEqual(self.list.export_modifications(), {'0.test_field_1': 4})
+
+    def test_lazy_items_pop(self):
+        self.assertIsInstance(self.list.pop(), LazyItemModel)
+
+    def test_lazy_items_index(self):
+        item = self.list[1]
+        self.assertEqual(self.list.index(item), 1)
+        self.assertIn(item, self.list)
+
+    def test_lazy_invalid_item(self):
+        test_list = ListModel(['1', 'foo'], field_type=IntegerField(), lazy=True)
+
+        self.assertEqual(test_list.export_data(), ['1'])
+        self.assertEqual(list(test_list), [1])
+
+    def test_lazy_invalid_items_like_eager(self):
+        data = [1, 'x', {}, 3]
+        eager_list = ListModel(data, field_type=IntegerField())
+
+        test_list = ListModel(data, field_type=IntegerField(), lazy=True)
+        self.assertEqual(len(test_list), len(eager_list))
+        self.assertEqual(test_list.export_data(), eager_list.export_data())
+        self.assertEqual(test_list[1], eager_list[1])
+
+        test_list = ListModel(data, field_type=IntegerField(), lazy=True)
+        self.assertEqual(list(test_list), list(eager_list))
+        self.assertEqual(test_list.export_data(), [1, 3])
+        self.assertEqual(len(test_list), 2)
+
+    def test_lazy_item_not_converted(self):
+        test_list = ListModel(['2012-09-11', 'foo'], field_type=DateTimeField(), lazy=True)
+
+        self.assertEqual(test_list[0], datetime(2012, 9, 11))
+        with self.assertRaisesRegex(ValueError, "'foo' could not be used"):
+            test_list[1]
+
+    def test_lazy_append_not_lazy(self):
+        self.list.append({'test_field_1': 4})
+
+        self.assertIsInstance(self.list.__modified_data__[3], LazyItemModel)
+
+    def test_lazy_pickle(self):
+        self.list[0]
+        test_list = pickle.loads(pickle.dumps(self.list))
+
+        self.assertEqual(test_list.export_data(), self.list.export_data())
+        self.assertIsInstance(test_list[2], LazyItemModel)
+
+    def test_lazy_array_field(self):
+        class Model(BaseModel):
+            test_list = ArrayField(field_type=ModelField(model_class=LazyItemModel), lazy=True)
+
+        model = Model(data={'test_list': self.data})
+
+        self.assertEqual(model.export_data(), {'test_list': self.data})
+        self.assertEqual(model.test_list[0].test_field_1, 1)
+        self.assertIs(model.test_list[0].get_parent(), model.test_list)
+
+    def test_lazy_array_field_creating(self):
+        class Model(BaseModel):
+            test_list = ArrayField(field_type=ModelField(model_class=LazyItemModel), lazy=True)
+
+        model = Model.create_new_model({'test_list': self.data})
+
+        self.assertEqual(model.test_list[2].test_field_1, 3)
+
+
+class TestCopyListModel(TestCase):
+
+    def setUp(self):
+        self.list = ListModel([{'test_field_1': 1}, {'test_field_1': 2}],
+                              field_type=ModelField(model_class=LazyItemModel))
+        self.list.flat_data()
+
+    def test_copy(self):
+        copied = self.list.copy()
+
+        self.assertIsInstance(copied, ListModel)
+        self.assertEqual(copied.export_data(), self.list.export_data())
+        self.assertTrue(copied.is_modified())
+        self.assertEqual(copied.export_original_data(), [])
+        self.assertIsInstance(copied[0], LazyItemModel)
+        self.assertTrue(copied[0].is_modified())
+        self.assertIsNot(copied[0], self.list[0])
+        self.assertIs(copied[0].get_parent(), copied)
+
+    def test_modify_copy(self):
+        copied = self.list.copy()
+        copied[0].test_field_1 = 3
+        copied.append({'test_field_1': 4})
+
+        self.assertEqual(self.list.export_data(), [{'test_field_1': 1}, {'test_field_1': 2}])
+        self.assertEqual(copied.export_data(), [{'test_field_1': 3}, {'test_field_1': 2}, {'test_field_1': 4}])
+
+    def test_modify_source(self):
+        copied = self.list.copy()
+        self.list[1].test_field_1 = 3
+        self.list.pop(0)
+
+        self.assertEqual(copied.export_data(), [{'test_field_1': 1}, {'test_field_1': 2}])
+        self.assertEqual(self.list.export_data(), [{'test_field_1': 3}])
+
+    def test_copy_scalars(self):
+        test_list = ListModel([1, 2], field_type=IntegerField())
+        copied = test_list.copy()
+        copied.append(3)
+
+        self.assertEqual(test_list.export_data(), [1, 2])
+        self.assertEqual(copied.export_data(), [1, 2, 3])
+        self.assertTrue(copied.is_modified())
+
+
+class ListDiffTests(TestCase):
+
+    def setUp(self):
+        self.list = ListModel([{'test_field_1': 1}, {'test_field_1': 2}],
+                              field_type=ModelField(model_class=LazyItemModel))
+
+    def test_same_list(self):
+        self.assertEqual(self.list.diff(self.list), {})
+
+    def test_items(self):
+        other = ListModel(self.list.export_data(), field_type=ModelField(model_class=LazyItemModel))
+        self.assertEqual(self.list.diff(other), {})
+
+        other[1].test_field_1 = 3
+        self.assertEqual(self.list.diff(other), {'1.test_field_1': 3})
+
+    def test_length(self):
+        other = self.list.copy()
+        other.pop()
+
+        self.assertEqual(self.list.diff(other), [{'test_field_1': 1}])
+
+    def test_scalars(self):
+        test_list = ListModel([1, 2, 3], field_type=IntegerField())
+        other = ListModel([1, 5, 3], field_type=IntegerField())
+
+        self.assertEqual(test_list.diff(other), {1: 5})
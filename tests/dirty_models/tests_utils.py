@@ -156,6 +156,126 @@ class ModelFormatterIterTests(TestCase):
         self.assertEqual(data['test_timedelta'], 32.1122)
         self.assertEqual(data['test_multi_field'], '2015-07-30')
 
+    def test_format_memoized(self):
+        model = TestModel(data={'test_int_field_1': 4,
+                                'test_array_datetime': [datetime(year=2015, month=5, day=30,
+                                                                 hour=22, minute=22, second=22)],
+                                'test_model_field_1': [[{'test_int_field_1': 5}]]})
+
+        data = ModelFormatterIter(model).format()
+        self.assertIs(ModelFormatterIter(model)._format(), ModelFormatterIter(model)._format())
+
+        data['test_array_datetime'].append('foo')
+        self.assertEqual(ModelFormatterIter(model).format()['test_array_datetime'], ['2015-05-30T22:22:22'])
+
+        model.test_array_datetime.append(datetime(year=2015, month=6, day=30, hour=22, minute=22, second=22))
+        self.assertEqual(ModelFormatterIter(model).format()['test_array_datetime'],
+                         ['2015-05-30T22:22:22', '2015-06-30T22:22:22'])
+
+        model.test_model_field_1[0][0].test_int_field_1 = 6
+        self.assertEqual(loads(dumps(model, cls=JSONEncoder))['test_model_field_1'], [[{'test_int_field_1': 6}]])
+
+    def test_format_formatter_options(self):
+
+        class UpperFormatterIter(ModelFormatterIter):
+
+            def __init__(self, model, upper=False):
+                super(UpperFormatterIter, self).__init__(model)
+                self.upper = upper
+
+            def format_field(self, field, value):
+                if self.upper and isinstance(value, str):
+                    return value.upper()
+                return super(UpperFormatterIter, self).format_field(field, value)
+
+        model = TestModel(data={'test_string_field_1': 'foo', 'test_array_multitype': [4]})
+
+        self.assertEqual(UpperFormatterIter(model, upper=True).format(),
+                         {'other_field': 'FOO', 'test_array_multitype': [4]})
+        self.assertEqual(UpperFormatterIter(model).format(),
+                         {'other_field': 'foo', 'test_array_multitype': [4]})
+        self.assertIsNone(UpperFormatterIter(model)._get_memo_key())
+        self.assertEqual(ModelFormatterIter(model).format(), {'other_field': 'foo', 'test_array_multitype': [4]})
+        self.assertIsNotNone(model._find_memoized(ModelFormatterIter(model)._get_memo_key()))
+
+    def test_format_context_must_to_skip(self):
+        context = {'hide': False}
+
+        class ContextFormatterIter(ModelFormatterIter):
+
+            def must_to_skip(self, name, field, value):
+                return context['hide'] and name == 'test_int_field_1'
+
+        class ContextJSONEncoder(JSONEncoder):
+            default_model_iter = ContextFormatterIter
+
+        model = TestModel(data={'test_int_field_1': 4, 'test_model_field_1': [[{'test_int_field_1': 5}]]})
+        self.assertEqual(ContextFormatterIter(model).format(),
+                         {'test_int_field_1': 4, 'test_model_field_1': [[{'test_int_field_1': 5}]]})
+        self.assertEqual(loads(dumps(model, cls=ContextJSONEncoder)),
+                         {'test_int_field_1': 4, 'test_model_field_1': [[{'test_int_field_1': 5}]]})
+
+        context['hide'] = True
+        self.assertEqual(ContextFormatterIter(model).format(), {'test_model_field_1': [[{}]]})
+        self.assertEqual(loads(dumps(model, cls=ContextJSONEncoder)), {'test_model_field_1': [[{}]]})
+
+    def test_format_plan(self):
+        model = TestModel(data={'test_string_field_1': 'foo', 'test_int_field_1': 4, 'test_hidden': 3})
+        self.assertEqual(ModelFormatterIter(model).format(), {'other_field': 'foo', 'test_int_field_1': 4})
+        plan = TestModel.__format_plans__[ModelFormatterIter]
+        self.assertEqual(plan['other_field'], ('other_field', TestModel.other_field))
+        self.assertEqual(plan['test_hidden'], ('test_hidden', TestModel.test_hidden))
+
+        class SkipFormatterIter(ModelFormatterIter):
+
+            def must_to_skip(self, name, field, value):
+                return value == 4
+
+        self.assertEqual(SkipFormatterIter(model).format(), {'other_field': 'foo', 'test_hidden': 3})
+        self.assertIsNone(TestModel.__format_plans__[SkipFormatterIter])
+        self.assertNotIn(ModelFormatterIter, BaseModel.__format_plans__)
+
+    def test_format_field_access_mode_change(self):
+        model = TestModel(data={'test_int_field_1': 4, 'test_model_field_1': [[{'test_int_field_1': 5}]]})
+        self.assertEqual(ModelFormatterIter(model).format(),
+                         {'test_int_field_1': 4, 'test_model_field_1': [[{'test_int_field_1': 5}]]})
+
+        self.addCleanup(setattr, TestModel.test_int_field_1, 'access_mode', AccessMode.READ_AND_WRITE)
+        TestModel.test_int_field_1.access_mode = AccessMode.HIDDEN
+
+        self.assertEqual(ModelFormatterIter(model).format(), {'test_model_field_1': [[{}]]})
+        self.assertEqual(loads(dumps(model, cls=JSONEncoder)), {'test_model_field_1': [[{}]]})
+
+    def test_format_override_access_mode_change(self):
+        model = TestModel(data={'test_int_field_1': 4, 'test_hidden': 3})
+        self.assertEqual(ModelFormatterIter(model).format(), {'test_int_field_1': 4})
+
+        self.addCleanup(setattr, TestModel, '__override_field_access_modes__',
+                        dict(TestModel.__override_field_access_modes__))
+        TestModel.__override_field_access_modes__['test_int_field_1'] = AccessMode.HIDDEN
+        self.assertEqual(ModelFormatterIter(model).format(), {})
+
+        TestModel.__override_field_access_modes__ = {'test_hidden': AccessMode.READ_AND_WRITE}
+        self.assertEqual(ModelFormatterIter(model).format(), {'test_int_field_1': 4, 'test_hidden': 3})
+
+    def test_format_enum_values(self):
+        model = TestModel(data={'test_enum': TestModel.TestEnum.value_2,
+                                'test_array_multitype': [TestModel.TestEnum.value_1]})
+        self.assertEqual(ModelFormatterIter(model).format(), {'test_enum': '2', 'test_array_multitype': [1]})
+
+        model.test_enum = TestModel.TestEnum.value_3
+        self.assertEqual(ModelFormatterIter(model).format()['test_enum'], '2015-07-30')
+
+        class QuoteFormatterIter(ModelFormatterIter):
+
+            def format_field(self, field, value):
+                if isinstance(value, str):
+                    return '"{0}"'.format(value)
+                return super(QuoteFormatterIter, self).format_field(field, value)
+
+        model.test_enum = TestModel.TestEnum.value_2
+        self.assertEqual(QuoteFormatterIter(model).format(), {'test_enum': '"2"', 'test_array_multitype': [1]})
+
 
 class JSONEncoderTests(TestCase):
 